@@ -0,0 +1,57 @@
+"""Benchmark of JWT verification with and without the verified-token cache
+
+Run from the project directory: `python -m benchmarks.bench_auth`
+"""
+
+import argparse
+import timeit
+import uuid
+
+from jose import jwt
+
+from wirtualnykomiksapi.infrastructure.utils.consts import ALGORITHM, SECRET_KEY
+from wirtualnykomiksapi.infrastructure.utils.token import (
+    decode_user_token,
+    generate_user_token,
+)
+
+
+def uncached_decode(token: str) -> str:
+    """Function verifying a token the way the routers did before the cache.
+
+    Args:
+        token (str): The encoded JWT token
+
+    Returns:
+        str: The user id
+    """
+    return jwt.decode(token, key=SECRET_KEY, algorithms=[ALGORITHM])["sub"]
+
+
+def main() -> None:
+    """Function comparing per-request cost of both verification paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000, help="distinct tokens in rotation")
+    parser.add_argument("--requests", type=int, default=100_000, help="verifications per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, the best one is reported")
+    args = parser.parse_args()
+
+    tokens = [generate_user_token(uuid.uuid4())["user_token"] for _ in range(args.users)]
+    requests = [tokens[i % len(tokens)] for i in range(args.requests)]
+
+    def run(verify) -> None:
+        for token in requests:
+            verify(token)
+
+    run(decode_user_token)  # warm the cache, as a steady stream of requests would
+
+    for name, verify in (("uncached jwt.decode", uncached_decode), ("cached decode_user_token", decode_user_token)):
+        best = min(timeit.repeat(lambda verify=verify: run(verify), number=1, repeat=args.repeat))
+        print(
+            f"{name:26} {best / args.requests * 1e6:8.2f} us/request "
+            f"{args.requests / best:12,.0f} requests/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark of point and list reads on the databases and asyncpg backends
+
+Requires the database configured with the DB_* variables.
+Run from the project directory: `python -m benchmarks.bench_backends`
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from wirtualnykomiksapi.db import comic_table, database, init_db, review_table, user_table
+from wirtualnykomiksapi.infrastructure.repositories.comicdb import ComicRepository
+from wirtualnykomiksapi.infrastructure.repositories.comicpg import AsyncpgComicRepository
+from wirtualnykomiksapi.infrastructure.repositories.reviewdb import ReviewRepository
+from wirtualnykomiksapi.infrastructure.repositories.reviewpg import AsyncpgReviewRepository
+from wirtualnykomiksapi.infrastructure.utils.pg import asyncpg_pool
+
+
+async def seed(user_id: uuid.UUID, rows: int) -> int:
+    """Function creating a comic with the given number of reviews.
+
+    Args:
+        user_id (uuid.UUID): The owner of the comic and the reviews
+        rows (int): The number of reviews
+
+    Returns:
+        int: The id of the comic
+    """
+    comic_id = await database.execute(
+        comic_table.insert().values(
+            title=f"Benchmark {rows}", author="-", description="-", likes=0, views=0, user_id=user_id,
+        )
+    )
+    await database.execute(
+        review_table.insert().values([
+            {"comic_id": comic_id, "user_id": user_id, "rating": i % 10 + 1, "comment": f"Review {i}"}
+            for i in range(rows)
+        ])
+    )
+    return comic_id
+
+
+async def measure(read, calls: int, concurrency: int) -> float:
+    """Function running the read the given number of times.
+
+    Args:
+        read (Callable): The coroutine function of the read
+        calls (int): The number of reads
+        concurrency (int): The number of reads in flight at once
+
+    Returns:
+        float: The throughput in reads per second
+    """
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run() -> None:
+        async with slots:
+            await read()
+
+    await read()  # prepare the statement on a connection first
+    started = time.perf_counter()
+    await asyncio.gather(*(run() for _ in range(calls)))
+    return calls / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    """Function comparing both backends at several result sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--calls", type=int, default=2000, help="reads per case")
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    await init_db()
+    await database.connect()
+    await asyncpg_pool.connect()
+    user_id = await database.execute(
+        user_table.insert().values(email=f"bench-{uuid.uuid4()}@test", password="-").returning(user_table.c.id)
+    )
+    backends = (
+        ("databases", ComicRepository(), ReviewRepository()),
+        ("asyncpg", AsyncpgComicRepository(), AsyncpgReviewRepository()),
+    )
+    try:
+        for rows in args.rows:
+            comic_id = await seed(user_id, rows)
+            for name, comics, reviews in backends:
+                point = await measure(lambda: comics.get_comic_by_id(comic_id), args.calls, args.concurrency)
+                listed = await measure(
+                    lambda: reviews.get_reviews_by_comic_id(comic_id), args.calls, args.concurrency,
+                )
+                print(
+                    f"{rows:6,} rows  {name:10} comic by id {point:9,.0f} reads/s  "
+                    f"reviews by comic {listed:9,.0f} reads/s"
+                )
+    finally:
+        await database.execute(review_table.delete().where(review_table.c.user_id == user_id))
+        await database.execute(comic_table.delete().where(comic_table.c.user_id == user_id))
+        await database.execute(user_table.delete().where(user_table.c.id == user_id))
+        await asyncpg_pool.disconnect()
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Benchmark of statement preparation with and without pre-compiled queries
+
+Run from the project directory: `python -m benchmarks.bench_compiled_query`
+"""
+
+import argparse
+import timeit
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from wirtualnykomiksapi.db import comic_table, review_table
+from wirtualnykomiksapi.infrastructure.repositories.comicdb import _COMIC_BY_ID
+from wirtualnykomiksapi.infrastructure.repositories.reviewdb import _REVIEWS_BY_COMIC
+
+_dialect = asyncpg_dialect()
+
+
+def build_comic_by_id(comic_id: int) -> tuple:
+    """Function building and compiling the comic read the way it was done per call.
+
+    Args:
+        comic_id (int): The id of the comic
+
+    Returns:
+        tuple: The SQL text and its positional arguments
+    """
+    avg_rating = func.coalesce(func.avg(review_table.c.rating), 0.0).label("average_rating")
+    query = (
+        select(comic_table, avg_rating)
+        .select_from(comic_table.outerjoin(review_table))
+        .where(comic_table.c.id == comic_id)
+        .group_by(comic_table.c.id)
+    )
+    compiled = query.compile(dialect=_dialect)
+    return compiled.string, [compiled.params[name] for name in compiled.positiontup]
+
+
+def build_reviews_by_comic(comic_id: int) -> tuple:
+    """Function building and compiling the review read the way it was done per call.
+
+    Args:
+        comic_id (int): The id of the comic
+
+    Returns:
+        tuple: The SQL text and its positional arguments
+    """
+    query = select(review_table).where(review_table.c.comic_id == comic_id)
+    compiled = query.compile(dialect=_dialect)
+    return compiled.string, [compiled.params[name] for name in compiled.positiontup]
+
+
+def main() -> None:
+    """Function comparing per-call CPU cost of both preparation paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000, help="statements prepared per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, the best one is reported")
+    args = parser.parse_args()
+
+    cases = (
+        ("comic by id, built per call", build_comic_by_id),
+        ("comic by id, pre-compiled", lambda i: _COMIC_BY_ID.bind({"comic_id": i})),
+        ("reviews by comic, built per call", build_reviews_by_comic),
+        ("reviews by comic, pre-compiled", lambda i: _REVIEWS_BY_COMIC.bind({"comic_id": i})),
+    )
+
+    for name, prepare in cases:
+        prepare(0)  # compile once up front, as the first request would
+
+        def run(prepare=prepare) -> None:
+            for i in range(args.calls):
+                prepare(i)
+
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        print(
+            f"{name:33} {best / args.calls * 1e6:8.2f} us/call "
+            f"{args.calls / best:12,.0f} calls/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
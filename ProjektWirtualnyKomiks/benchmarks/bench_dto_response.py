@@ -0,0 +1,99 @@
+"""Benchmark of rendering comic lists through response_model and DTOResponse
+
+Run from the project directory: `python -m benchmarks.bench_dto_response`
+"""
+
+import argparse
+import asyncio
+import timeit
+import uuid
+from typing import List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from starlette.responses import JSONResponse
+
+from wirtualnykomiksapi.api.responses import DTOResponse
+from wirtualnykomiksapi.core.domain.genre import Genre
+from wirtualnykomiksapi.core.domain.tag import Tag
+from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO
+
+
+def make_comics(count: int) -> List[ComicDTO]:
+    """Function building a list of comics as the service returns it.
+
+    Args:
+        count (int): The number of comics
+
+    Returns:
+        List[ComicDTO]: The comic DTOs
+    """
+    user_id = uuid.uuid4()
+    return [
+        ComicDTO(
+            id=i,
+            title=f"Comic {i}",
+            author=f"Author {i % 50}",
+            description="A comic about a comic. " * 8,
+            likes=i * 3,
+            views=i * 17,
+            user_id=user_id,
+            average_rating=(i % 10) / 2,
+            genres=[Genre(id=i % 7, name=f"genre-{i % 7}")],
+            tags=[Tag(id=i % 11, name=f"tag-{i % 11}"), Tag(id=i % 13, name=f"tag-{i % 13}")],
+        )
+        for i in range(count)
+    ]
+
+
+async def render_response_model(field, comics: List[ComicDTO]) -> bytes:
+    """Function rendering the body the way FastAPI does for a response_model.
+
+    Args:
+        field (ModelField): The response field of the route
+        comics (List[ComicDTO]): The comics returned by the endpoint
+
+    Returns:
+        bytes: The body of the response
+    """
+    content = await serialize_response(field=field, response_content=comics)
+    return JSONResponse(content).body
+
+
+def main() -> None:
+    """Function comparing per-response cost of both rendering paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comics", type=int, default=100, help="comics per response")
+    parser.add_argument("--responses", type=int, default=1000, help="responses rendered per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, the best one is reported")
+    args = parser.parse_args()
+
+    comics = make_comics(args.comics)
+    field = create_model_field("Response_list", List[ComicDTO], mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    async def before() -> None:
+        for _ in range(args.responses):
+            await render_response_model(field, comics)
+
+    def after() -> None:
+        for _ in range(args.responses):
+            DTOResponse(comics).body
+
+    cases = (
+        ("response_model + JSONResponse", lambda: loop.run_until_complete(before())),
+        ("DTOResponse", after),
+    )
+    try:
+        for name, run in cases:
+            best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+            print(
+                f"{name:30} {best / args.responses * 1e6:10.1f} us/response "
+                f"{args.responses / best:10,.0f} responses/s"
+            )
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark of mapping result sets to DTOs row by row and in one call
+
+Run from the project directory: `python -m benchmarks.bench_mapping`
+"""
+
+import argparse
+import timeit
+import tracemalloc
+import uuid
+
+from asyncpg.protocol.protocol import _create_record  # type: ignore
+
+from wirtualnykomiksapi.infrastructure.dto.reviewdto import ReviewDTO
+from wirtualnykomiksapi.infrastructure.utils.mapping import validate_all
+
+_COLUMNS = {"id": 0, "comic_id": 1, "user_id": 2, "rating": 3, "comment": 4}
+
+
+def make_records(count: int) -> list:
+    """Function building review records as asyncpg returns them.
+
+    Args:
+        count (int): The number of records
+
+    Returns:
+        list: The asyncpg records
+    """
+    user_ids = [uuid.uuid4() for _ in range(50)]
+    return [
+        _create_record(_COLUMNS, (i, i % 500, user_ids[i % 50], i % 10 + 1, f"Comment {i}"))
+        for i in range(count)
+    ]
+
+
+def per_row(records: list) -> list:
+    """Function mapping the records the way the repositories did before.
+
+    Args:
+        records (list): The asyncpg records
+
+    Returns:
+        list: The review DTOs
+    """
+    return [ReviewDTO(**dict(record)) for record in records]
+
+
+def batched(records: list) -> list:
+    """Function mapping the records with a single validation call.
+
+    Args:
+        records (list): The asyncpg records
+
+    Returns:
+        list: The review DTOs
+    """
+    return validate_all(ReviewDTO, [dict(record) for record in records])
+
+
+def peak_allocation(mapping, records: list) -> int:
+    """Function measuring the peak memory allocated while mapping.
+
+    Args:
+        mapping (Callable): The mapping function
+        records (list): The asyncpg records
+
+    Returns:
+        int: The peak number of bytes allocated
+    """
+    tracemalloc.start()
+    try:
+        mapping(records)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Function comparing CPU time and peak allocation of both mappings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=5, help="runs, the best one is reported")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        records = make_records(rows)
+        batched(records)  # build the cached adapter up front, as the first request would
+
+        for name, mapping in (("ReviewDTO(**dict(row))", per_row), ("validate_all", batched)):
+            best = min(timeit.repeat(lambda mapping=mapping: mapping(records), number=1, repeat=args.repeat))
+            print(
+                f"{rows:7,} rows  {name:24} {best * 1e3:9.2f} ms "
+                f"{best / rows * 1e6:7.2f} us/row "
+                f"{peak_allocation(mapping, records) / 1024:10,.0f} KiB peak"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Benchmark of JSON and MessagePack bodies of comic lists
+
+Run from the project directory: `python -m benchmarks.bench_msgpack`
+"""
+
+import argparse
+import gzip
+import json
+import timeit
+
+import msgpack  # type: ignore
+
+from benchmarks.bench_dto_response import make_comics
+from wirtualnykomiksapi.api.responses import dump_json, dump_msgpack
+
+
+def main() -> None:
+    """Function comparing size, encoding and decoding cost of both media types."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--comics", type=int, default=100, help="comics per body")
+    parser.add_argument("--bodies", type=int, default=1000, help="bodies encoded per run")
+    parser.add_argument("--repeat", type=int, default=5, help="runs, the best one is reported")
+    args = parser.parse_args()
+
+    comics = make_comics(args.comics)
+    cases = (
+        ("application/json", dump_json, json.loads),
+        ("application/msgpack", dump_msgpack, msgpack.unpackb),
+    )
+
+    for name, encode, decode in cases:
+        body = encode(comics)
+        encoded = min(timeit.repeat(lambda: encode(comics), number=args.bodies, repeat=args.repeat))
+        decoded = min(timeit.repeat(lambda: decode(body), number=args.bodies, repeat=args.repeat))
+        print(
+            f"{name:20} {len(body):9,} B {len(gzip.compress(body)):8,} B gzip "
+            f"{encoded / args.bodies * 1e6:8.1f} us encode "
+            f"{decoded / args.bodies * 1e6:8.1f} us decode"
+        )
+
+
+if __name__ == "__main__":
+    main()
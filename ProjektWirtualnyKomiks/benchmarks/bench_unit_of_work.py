@@ -0,0 +1,106 @@
+"""Benchmark of concurrent request throughput before and after the unit of work
+
+Requires the database configured with the DB_* variables.
+Run from the project directory: `python -m benchmarks.bench_unit_of_work`
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import databases
+import httpx
+from sqlalchemy import func, select
+
+from wirtualnykomiksapi.api.middleware import UnitOfWorkMiddleware
+from wirtualnykomiksapi.db import comic_table, database, db_uri, init_db, pool_options
+
+
+def make_app(db: databases.Database, latency: float):
+    """Function building an ASGI app issuing the statements of a request.
+
+    Args:
+        db (databases.Database): The database the statements run on
+        latency (float): The number of seconds a read takes on the server
+
+    Returns:
+        ASGIApp: The app reading on GET, writing and reading on POST
+    """
+    read = select(func.pg_sleep(latency), func.count()).select_from(comic_table)
+    write = comic_table.update().where(comic_table.c.id == -1).values(views=comic_table.c.views + 1)
+
+    async def app(scope, receive, send) -> None:
+        if scope["method"] != "GET":
+            await db.execute(write)
+        await db.fetch_val(read)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def measure(app, requests: int, concurrency: int, write_ratio: float) -> float:
+    """Function sending the requests with the given concurrency.
+
+    Args:
+        app (ASGIApp): The app under test
+        requests (int): The number of requests
+        concurrency (int): The number of requests in flight at once
+        write_ratio (float): The share of POST requests
+
+    Returns:
+        float: The throughput in requests per second
+    """
+    methods = ["POST" if random.random() < write_ratio else "GET" for _ in range(requests)]
+    slots = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def send(method: str) -> None:
+            async with slots:
+                response = await client.request(method, "/")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(send(method) for method in methods))
+        return requests / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    """Function comparing the pinned rollback connection with the pooled unit of work."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="server time per statement")
+    args = parser.parse_args()
+
+    await init_db()
+    latency = args.latency_ms / 1000
+
+    # Before: one connection pinned by force_rollback, no request transactions
+    pinned = databases.Database(db_uri, force_rollback=True, **pool_options)
+    await pinned.connect()
+    try:
+        before = await measure(make_app(pinned, latency), args.requests, args.concurrency, args.write_ratio)
+    finally:
+        await pinned.disconnect()
+
+    # After: pooled connections, a transaction only around writes
+    await database.connect()
+    try:
+        after = await measure(
+            UnitOfWorkMiddleware(make_app(database, latency), database=database),
+            args.requests,
+            args.concurrency,
+            args.write_ratio,
+        )
+    finally:
+        await database.disconnect()
+
+    print(f"force_rollback, pinned connection {before:10,.0f} requests/s")
+    print(f"unit of work, pool of {pool_options['max_size']:3}        {after:10,.0f} requests/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""Tests running requests through the whole app against PostgreSQL"""
+
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from wirtualnykomiksapi.api.middleware import PRIMARY_UNTIL_COOKIE
+from wirtualnykomiksapi.db import (
+    database,
+    comic_table,
+    refresh_token_table,
+    review_table,
+    user_comic_list_counter_table,
+    user_comic_list_table,
+    user_table,
+)
+from wirtualnykomiksapi.infrastructure.utils.pool import pool_monitor
+from wirtualnykomiksapi.main import app
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DB_NAME"),
+    reason="requires a PostgreSQL database configured with DB_* variables",
+)
+
+EMAIL = f"api-{os.getpid()}@test"
+PASSWORD = "secret"
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Fixture running the app lifespan once for the whole module."""
+    with TestClient(app) as client:
+        yield client
+        # Statements have to run on the loop of the app, which owns the pool
+        user_ids = user_table.select().with_only_columns(user_table.c.id).where(user_table.c.email == EMAIL)
+        tables = (
+            review_table,
+            user_comic_list_table,
+            user_comic_list_counter_table,
+            comic_table,
+            refresh_token_table,
+        )
+        for table in tables:
+            client.portal.call(database.execute, table.delete().where(table.c.user_id.in_(user_ids)))
+        client.portal.call(database.execute, user_table.delete().where(user_table.c.email == EMAIL))
+
+
+@pytest.fixture(scope="module")
+def user(client):
+    """Fixture registering a user and logging them in."""
+    user_id = client.post("/register", json={"email": EMAIL, "password": PASSWORD}).json()["id"]
+    token = client.post("/token", json={"email": EMAIL, "password": PASSWORD}).json()["user_token"]
+    return user_id, {"Authorization": f"Bearer {token}"}
+
+
+def test_reviews_by_user_and_comic(client, user):
+    user_id, headers = user
+    comic = client.post(
+        "/comic/create",
+        json={"title": "Reviewed", "author": "Author", "description": "-"},
+        headers=headers,
+    ).json()
+    review = client.post(
+        "/review/create",
+        json={"comic_id": comic["id"], "rating": 7, "comment": "Good"},
+        headers=headers,
+    ).json()
+
+    by_user = client.get(f"/review/user/{user_id}")
+    by_comic = client.get(f"/review/comic/{comic['id']}")
+
+    assert by_user.status_code == 200
+    assert by_user.json() == [review]
+    assert by_comic.status_code == 200
+    assert by_comic.json() == [review]
+
+
+def test_rejected_logins_borrow_no_connection(client, user):
+    invalid = {"email": f"throttled-{os.getpid()}@test", "password": "wrong"}
+    for _ in range(10):
+        if client.post("/token", json=invalid).status_code == 429:
+            break
+
+    acquired = pool_monitor.acquired
+    throttled = client.post("/token", json=invalid)
+    malformed = client.post("/token", json={"email": EMAIL})
+
+    assert (throttled.status_code, malformed.status_code) == (429, 422)
+    assert pool_monitor.acquired == acquired
+
+
+def test_primary_cookie_only_after_writes(client, user):
+    _, headers = user
+    login = client.post("/token", json={"email": EMAIL, "password": PASSWORD})
+    created = client.post(
+        "/comic/create",
+        json={"title": "Written", "author": "Author", "description": "-"},
+        headers=headers,
+    )
+
+    assert login.status_code == 200
+    assert PRIMARY_UNTIL_COOKIE not in login.headers.get("set-cookie", "")
+    assert created.status_code == 201
+    assert PRIMARY_UNTIL_COOKIE in created.headers.get("set-cookie", "")
+
+
+def test_repository_transaction_nests_in_request_transaction(client, user):
+    _, headers = user
+    comic = client.post(
+        "/comic/create",
+        json={"title": "Listed", "author": "Author", "description": "-"},
+        headers=headers,
+    ).json()
+
+    added = client.post(f"/user_comic_list/add?comic_id={comic['id']}", headers=headers)
+
+    assert added.status_code == 201
+    assert (added.json()["comic_id"], added.json()["status"]) == (comic["id"], "planning")
+
+
+def test_user_list_keeps_bare_list_without_paging(client, user):
+    user_id, headers = user
+    comic = client.post(
+        "/comic/create",
+        json={"title": "Paged", "author": "Author", "description": "-"},
+        headers=headers,
+    ).json()
+    entry = client.post(f"/user_comic_list/add?comic_id={comic['id']}", headers=headers).json()
+
+    whole = client.get("/user_comic_list/all", headers=headers)
+    page = client.get("/user_comic_list/all?limit=200", headers=headers)
+
+    assert whole.status_code == 200
+    assert {"id": entry["id"], "user_id": user_id, "comic_id": comic["id"], "status": "planning"} in whole.json()
+    assert page.status_code == 200
+    assert comic["id"] in [item["comic_id"] for item in page.json()["items"]]
+    assert page.json()["next_cursor"] is None
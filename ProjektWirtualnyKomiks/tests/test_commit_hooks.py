@@ -0,0 +1,54 @@
+"""Tests running commit hooks of the unit of work against PostgreSQL"""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from wirtualnykomiksapi.api.middleware import UnitOfWorkMiddleware
+from wirtualnykomiksapi.db import database
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import after_commit
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DB_NAME"),
+    reason="requires a PostgreSQL database configured with DB_* variables",
+)
+
+
+async def _run_hooks(status: int) -> list:
+    """Function sending a write request whose handler registers a commit hook.
+
+    Args:
+        status (int): The status the handler answers with
+
+    Returns:
+        list: The hooks run, with the point they ran at
+    """
+    ran = []
+
+    async def app(scope, receive, send) -> None:
+        await database.execute("SELECT 1")
+        after_commit(lambda: ran.append("hook"))
+        ran.append("handler")
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    await database.connect()
+    try:
+        transport = httpx.ASGITransport(app=UnitOfWorkMiddleware(app, database=database))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.post("/")
+    finally:
+        await database.disconnect()
+
+    after_commit(lambda: ran.append("outside"))
+    return ran
+
+
+def test_hooks_run_after_commit():
+    assert asyncio.run(_run_hooks(201)) == ["handler", "hook", "outside"]
+
+
+def test_hooks_are_dropped_on_rollback():
+    assert asyncio.run(_run_hooks(409)) == ["handler", "outside"]
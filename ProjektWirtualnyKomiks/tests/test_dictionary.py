@@ -0,0 +1,17 @@
+"""Tests of the in-memory name dictionaries"""
+
+from wirtualnykomiksapi.infrastructure.utils.dictionary import NameDictionary
+
+
+def test_reload_picks_up_changes_and_keeps_unchanged_snapshot():
+    dictionary = NameDictionary()
+    dictionary.load([(1, "Drama"), (2, "Horror")])
+    loaded = dictionary.snapshot
+
+    dictionary.load([(2, "Horror"), (1, "Drama")])
+    unchanged = dictionary.snapshot
+    dictionary.load([(1, "Comedy")])
+
+    assert unchanged is loaded
+    assert dict(dictionary.snapshot.names) == {1: "Comedy"}
+    assert dictionary.snapshot.version != loaded.version
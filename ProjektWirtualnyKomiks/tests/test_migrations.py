@@ -0,0 +1,91 @@
+"""Tests running the schema migrations against PostgreSQL"""
+
+import asyncio
+import os
+
+import pytest
+import sqlalchemy
+
+from wirtualnykomiksapi.core.domain.user_comic_list import UserComicListStatus
+from wirtualnykomiksapi.db import (
+    MIGRATIONS,
+    database,
+    init_db,
+    schema_hash,
+    comic_table,
+    user_table,
+    user_comic_list_table,
+    user_comic_list_counter_table,
+)
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DB_NAME"),
+    reason="requires a PostgreSQL database configured with DB_* variables",
+)
+
+
+async def _backfill_counters() -> tuple:
+    """Function adding list entries without counters and running the migrations twice.
+
+    Returns:
+        tuple: The status counters of the user after each run
+    """
+    await init_db(retries=1)
+    await database.connect()
+    user_id = None
+    try:
+        user_id = await database.execute(
+            user_table.insert().values(email=f"migrations-{os.getpid()}@test", password="-")
+            .returning(user_table.c.id)
+        )
+        statuses = [
+            UserComicListStatus.PLANNING,
+            UserComicListStatus.PLANNING,
+            UserComicListStatus.COMPLETED,
+        ]
+        for i, status in enumerate(statuses):
+            comic_id = await database.execute(
+                comic_table.insert().values(title=f"Comic {i}", likes=0, views=0, user_id=user_id)
+                .returning(comic_table.c.id)
+            )
+            await database.execute(
+                user_comic_list_table.insert().values(user_id=user_id, comic_id=comic_id, status=status.value)
+            )
+
+        counts = []
+        for _ in range(2):
+            for migration in MIGRATIONS:
+                await database.execute(sqlalchemy.text(migration))
+            rows = await database.fetch_all(
+                user_comic_list_counter_table.select()
+                .where(user_comic_list_counter_table.c.user_id == user_id)
+            )
+            counts.append({row["status"]: row["count"] for row in rows})
+        return tuple(counts)
+    finally:
+        if user_id is not None:
+            await database.execute(
+                user_comic_list_counter_table.delete()
+                .where(user_comic_list_counter_table.c.user_id == user_id)
+            )
+            await database.execute(
+                user_comic_list_table.delete().where(user_comic_list_table.c.user_id == user_id)
+            )
+            await database.execute(comic_table.delete().where(comic_table.c.user_id == user_id))
+            await database.execute(user_table.delete().where(user_table.c.id == user_id))
+        await database.disconnect()
+
+
+def test_migrations_backfill_counters_once():
+    first, second = asyncio.run(_backfill_counters())
+
+    expected = {UserComicListStatus.PLANNING.value: 2, UserComicListStatus.COMPLETED.value: 1}
+    assert first == expected
+    assert second == expected
+
+
+def test_schema_hash_covers_migrations(monkeypatch):
+    applied = schema_hash()
+    monkeypatch.setattr("wirtualnykomiksapi.db.MIGRATIONS", MIGRATIONS + ["SELECT 1"])
+
+    assert schema_hash() != applied
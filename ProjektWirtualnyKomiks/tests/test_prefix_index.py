@@ -0,0 +1,17 @@
+"""Tests of the autocompletion prefix index"""
+
+from wirtualnykomiksapi.infrastructure.dto.autocompletedto import AutocompleteKind, SuggestionDTO
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import PrefixIndex
+
+
+def test_search_of_all_kinds_ranks_within_each_kind():
+    index = PrefixIndex.build([
+        SuggestionDTO(kind=AutocompleteKind.TITLE, value="Batman", popularity=90_000),
+        SuggestionDTO(kind=AutocompleteKind.TITLE, value="Bone", popularity=50_000),
+        SuggestionDTO(kind=AutocompleteKind.TITLE, value="Blacksad", popularity=40_000),
+        SuggestionDTO(kind=AutocompleteKind.GENRE, value="Biography", popularity=12),
+    ])
+
+    suggestions = index.search("b", None, 2)
+
+    assert [suggestion.value for suggestion in suggestions] == ["Batman", "Biography"]
@@ -0,0 +1,68 @@
+"""Tests running the refresh token exchange against PostgreSQL"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from wirtualnykomiksapi.core.domain.user import UserIn
+from wirtualnykomiksapi.db import database, init_db, refresh_token_table, user_table
+from wirtualnykomiksapi.infrastructure.repositories.user import UserRepository
+from wirtualnykomiksapi.infrastructure.services.user import UserService
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DB_NAME"),
+    reason="requires a PostgreSQL database configured with DB_* variables",
+)
+
+
+async def _exchange() -> tuple:
+    """Function logging a user in and exchanging the refresh token twice.
+
+    Returns:
+        tuple: The login, the first and the repeated exchange, and the
+            expired tokens left of the user and of another user
+    """
+    await init_db(retries=1)
+    await database.connect()
+    service = UserService(UserRepository())
+    email = f"refresh-{os.getpid()}@test"
+    other_email = f"refresh-other-{os.getpid()}@test"
+    try:
+        user = await service.register_user(UserIn(email=email, password="secret"))
+        other = await service.register_user(UserIn(email=other_email, password="secret"))
+        await database.execute(
+            refresh_token_table.insert().values([
+                {
+                    "user_id": owner.id,
+                    "token_hash": token_hash,
+                    "expires_at": datetime.now(timezone.utc) - timedelta(days=1),
+                }
+                for owner, token_hash in ((user, "expired"), (other, "expired-other"))
+            ])
+        )
+
+        login = await service.authenticate_user(UserIn(email=email, password="secret"))
+        rotated = await service.refresh_user_token(login.refresh_token)
+        reused = await service.refresh_user_token(login.refresh_token)
+        expired = await database.fetch_all(
+            refresh_token_table.select().with_only_columns(refresh_token_table.c.token_hash)
+            .where(refresh_token_table.c.token_hash.in_(["expired", "expired-other"]))
+        )
+        return login, rotated, reused, [row["token_hash"] for row in expired]
+    finally:
+        emails = [email, other_email]
+        user_ids = user_table.select().with_only_columns(user_table.c.id).where(user_table.c.email.in_(emails))
+        await database.execute(refresh_token_table.delete().where(refresh_token_table.c.user_id.in_(user_ids)))
+        await database.execute(user_table.delete().where(user_table.c.email.in_(emails)))
+        await database.disconnect()
+
+
+def test_refresh_token_is_rotated_and_single_use():
+    login, rotated, reused, expired = asyncio.run(_exchange())
+
+    assert rotated is not None
+    assert rotated.refresh_token and rotated.refresh_token != login.refresh_token
+    assert reused is None
+    assert expired == ["expired-other"]
@@ -0,0 +1,51 @@
+"""Tests running the get-or-create of genre names against PostgreSQL"""
+
+import asyncio
+import os
+
+import pytest
+
+from wirtualnykomiksapi.db import database, genre_table, init_db
+from wirtualnykomiksapi.infrastructure.repositories.genredb import GenreRepository
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DB_NAME"),
+    reason="requires a PostgreSQL database configured with DB_* variables",
+)
+
+
+async def _resolve_concurrently(names: list) -> tuple:
+    """Function resolving the names in opposite orders from concurrent tasks.
+
+    Args:
+        names (list): The names, with duplicates and padding
+
+    Returns:
+        tuple: The results of both tasks
+    """
+    await init_db(retries=1)
+    await database.connect()
+    repository = GenreRepository()
+    try:
+        results = await asyncio.gather(
+            repository.resolve_genres(names),
+            repository.resolve_genres(list(reversed(names))),
+        )
+        return tuple([(genre.id, genre.name) for genre in genres] for genres in results)
+    finally:
+        stripped = {name.strip() for name in names}
+        await database.execute(genre_table.delete().where(genre_table.c.name.in_(stripped)))
+        await database.disconnect()
+
+
+def test_resolve_names_deduplicates_and_agrees_on_ids():
+    prefix = f"resolve-{os.getpid()}"
+    names = [f"{prefix}-b", f" {prefix}-a ", f"{prefix}-c", f"{prefix}-b", " "]
+
+    forward, backward = asyncio.run(_resolve_concurrently(names))
+
+    assert [name for _, name in forward] == [f"{prefix}-b", f"{prefix}-a", f"{prefix}-c"]
+    assert [name for _, name in backward] == [f"{prefix}-b", f"{prefix}-c", f"{prefix}-a"]
+    assert dict((name, entry_id) for entry_id, name in forward) == dict(
+        (name, entry_id) for entry_id, name in backward
+    )
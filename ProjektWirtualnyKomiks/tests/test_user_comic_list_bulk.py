@@ -0,0 +1,86 @@
+"""Tests running the bulk user list status update against PostgreSQL"""
+
+import asyncio
+import os
+
+import pytest
+
+from wirtualnykomiksapi.core.domain.user_comic_list import (
+    UserComicListIn,
+    UserComicListStatus,
+)
+from wirtualnykomiksapi.db import (
+    database,
+    init_db,
+    comic_table,
+    user_table,
+    user_comic_list_table,
+    user_comic_list_counter_table,
+)
+from wirtualnykomiksapi.infrastructure.repositories.user_comic_listdb import (
+    UserComicListRepository,
+)
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("DB_NAME"),
+    reason="requires a PostgreSQL database configured with DB_* variables",
+)
+
+
+async def _update_statuses() -> tuple:
+    """Function creating a user list and moving its entries in one bulk update.
+
+    Returns:
+        tuple: The changed rows and the status counters of the user
+    """
+    await init_db(retries=1)
+    await database.connect()
+    repository = UserComicListRepository()
+    user_id = None
+    try:
+        user_id = await database.execute(
+            user_table.insert().values(email=f"bulk-{os.getpid()}@test", password="-")
+            .returning(user_table.c.id)
+        )
+        comic_ids = [
+            await database.execute(
+                comic_table.insert().values(title=f"Comic {i}", likes=0, views=0, user_id=user_id)
+                .returning(comic_table.c.id)
+            )
+            for i in range(3)
+        ]
+        for comic_id in comic_ids:
+            await repository.add_comic(str(user_id), comic_id)
+
+        changed = await repository.update_statuses(
+            str(user_id),
+            [
+                UserComicListIn(comic_id=comic_ids[0], status=UserComicListStatus.READING),
+                UserComicListIn(comic_id=comic_ids[1], status=UserComicListStatus.PLANNING),
+                UserComicListIn(comic_id=comic_ids[2], status=UserComicListStatus.COMPLETED),
+            ],
+        )
+        summary = await repository.get_summary(str(user_id))
+        return changed, comic_ids, summary
+    finally:
+        if user_id is not None:
+            await database.execute(
+                user_comic_list_counter_table.delete()
+                .where(user_comic_list_counter_table.c.user_id == user_id)
+            )
+            await database.execute(
+                user_comic_list_table.delete().where(user_comic_list_table.c.user_id == user_id)
+            )
+            await database.execute(comic_table.delete().where(comic_table.c.user_id == user_id))
+            await database.execute(user_table.delete().where(user_table.c.id == user_id))
+        await database.disconnect()
+
+
+def test_update_statuses_returns_only_changed_rows():
+    changed, comic_ids, summary = asyncio.run(_update_statuses())
+
+    assert {(entry.comic_id, entry.status) for entry in changed} == {
+        (comic_ids[0], UserComicListStatus.READING),
+        (comic_ids[2], UserComicListStatus.COMPLETED),
+    }
+    assert (summary.planning, summary.reading, summary.completed) == (1, 1, 1)
@@ -0,0 +1,55 @@
+"""A module containing authentication dependencies for routers"""
+
+import hmac
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from wirtualnykomiksapi.config import config
+from wirtualnykomiksapi.infrastructure.utils.token import decode_user_token
+
+bearer_scheme = HTTPBearer()
+
+
+async def get_current_user_id(
+        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> str:
+    """A dependency returning the id of the authenticated user
+
+    Args:
+        credentials (HTTPAuthorizationCredentials, optional): The credentials
+
+    Raises:
+        HTTPException: 403 if the token is invalid, expired or has no subject
+
+    Returns:
+        str: The id of the user
+    """
+
+    if user_uuid := decode_user_token(credentials.credentials):
+        return user_uuid
+
+    raise HTTPException(status_code=403, detail="Unauthorized")
+
+
+async def require_internal_token(
+        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> None:
+    """A dependency admitting operators presenting the internal API token
+
+    Without INTERNAL_API_TOKEN configured the internal endpoints are closed.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials, optional): The credentials
+
+    Raises:
+        HTTPException: 403 if the token is not configured or does not match
+    """
+
+    if config.INTERNAL_API_TOKEN and hmac.compare_digest(
+        credentials.credentials.encode(),
+        config.INTERNAL_API_TOKEN.encode(),
+    ):
+        return
+
+    raise HTTPException(status_code=403, detail="Unauthorized")
@@ -0,0 +1,406 @@
+"""A module containing ASGI middlewares of the app"""
+
+import asyncio
+import time
+from collections import Counter
+from http.cookies import SimpleCookie
+from typing import Optional
+
+from databases import Database
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from wirtualnykomiksapi.api.responses import (
+    negotiate_media_type,
+    response_encoding,
+    response_media_type,
+)
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import (
+    pending_commit_hooks,
+    run_commit_hooks,
+)
+from wirtualnykomiksapi.infrastructure.utils.compression import IDENTITY, compressor
+from wirtualnykomiksapi.infrastructure.utils.lifecycle import ShutdownCoordinator
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import (
+    check_request_queries,
+    request_queries,
+    request_written_tables,
+)
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_reads_allowed
+from wirtualnykomiksapi.infrastructure.utils.unit_of_work import UnitOfWork, current_unit_of_work
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_UNTIL_COOKIE = "primary_until"
+# Tables read only by write requests, which always run on the primary,
+# so writing them needs no read-your-writes window
+PRIMARY_ONLY_TABLES = frozenset({"refresh_tokens"})
+
+
+class DrainingMiddleware:
+    """A middleware tracking in-flight requests for the shutdown coordinator.
+
+    Once the worker starts draining, new requests are answered with 503
+    and `Connection: close`, so the load balancer retries them elsewhere.
+    """
+
+    def __init__(self, app: ASGIApp, coordinator: ShutdownCoordinator) -> None:
+        """The initializer of the draining middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+            coordinator (ShutdownCoordinator): The coordinator counting the requests
+        """
+
+        self.app = app
+        self.coordinator = coordinator
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the ASGI call
+
+        Args:
+            scope (Scope): The connection scope
+            receive (Receive): The channel of incoming messages
+            send (Send): The channel of outgoing messages
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.coordinator.request_started():
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"connection", b"close"),
+                    (b"retry-after", b"1"),
+                    (b"content-length", b"0"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.coordinator.request_finished()
+
+
+class ContentNegotiationMiddleware:
+    """A middleware negotiating the encoding of DTO responses.
+
+    The media type chosen from the Accept header and the content coding
+    chosen from the Accept-Encoding header are stored in context variables
+    which `DTOResponse` reads when rendering the body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the content negotiation middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the ASGI call
+
+        Args:
+            scope (Scope): The connection scope
+            receive (Receive): The channel of incoming messages
+            send (Send): The channel of outgoing messages
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        media_type_token = response_media_type.set(negotiate_media_type(headers.get("accept", "")))
+        encoding_token = response_encoding.set(compressor.negotiate(headers.get("accept-encoding", "")))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            response_encoding.reset(encoding_token)
+            response_media_type.reset(media_type_token)
+
+
+class CompressionMiddleware:
+    """A middleware compressing response bodies.
+
+    Bodies smaller than `minimum_size`, streamed bodies and responses which
+    are already encoded (e.g. served from the compressed payload cache) are
+    sent unchanged. Bodies of at least `thread_size` bytes are compressed in
+    a worker thread, so they do not stall the event loop.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, thread_size: int) -> None:
+        """The initializer of the compression middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+            minimum_size (int): The smallest body worth compressing
+            thread_size (int): The smallest body compressed in a worker thread
+        """
+
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_size = thread_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the ASGI call
+
+        Args:
+            scope (Scope): The connection scope
+            receive (Receive): The channel of incoming messages
+            send (Send): The channel of outgoing messages
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = compressor.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == IDENTITY:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+            ):
+                await send(start)
+                start = None
+                await send(message)
+                return
+
+            if len(body) >= self.thread_size:
+                body = await asyncio.to_thread(compressor.compress, body, encoding)
+            else:
+                body = compressor.compress(body, encoding)
+
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(body))
+            if "accept-encoding" not in headers.get("vary", "").lower():
+                headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            start = None
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class UnitOfWorkMiddleware:
+    """A middleware running every write request in a single DB transaction.
+
+    The transaction begins with the first statement of the request, which
+    then holds one pooled connection until it ends; requests answered
+    without touching the database never borrow a connection. It is
+    committed before the response headers are sent if the status is
+    below 400 and rolled back otherwise. Callbacks registered
+    with `after_commit` run right after the commit and are dropped on
+    rollback. Read-only requests are left alone, so their statements run on autocommit connections
+    borrowed from the pool one query at a time.
+    """
+
+    def __init__(self, app: ASGIApp, database: Database) -> None:
+        """The initializer of the unit of work middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+            database (Database): The database to open transactions on
+        """
+
+        self.app = app
+        self.database = database
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the ASGI call
+
+        Args:
+            scope (Scope): The connection scope
+            receive (Receive): The channel of incoming messages
+            send (Send): The channel of outgoing messages
+        """
+
+        if scope["type"] != "http" or scope["method"] in READ_ONLY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        hooks: list = []
+        unit_of_work = UnitOfWork(self.database)
+        hooks_token = pending_commit_hooks.set(hooks)
+        unit_token = current_unit_of_work.set(unit_of_work)
+        finished = False
+
+        async def send_after_commit(message: Message) -> None:
+            nonlocal finished
+
+            if message["type"] == "http.response.start" and not finished:
+                finished = True
+                if message["status"] < 400:
+                    await unit_of_work.commit()
+                    run_commit_hooks(hooks)
+                else:
+                    hooks.clear()
+                    await unit_of_work.rollback()
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_commit)
+        finally:
+            if not finished:
+                hooks.clear()
+                await unit_of_work.rollback()
+            current_unit_of_work.reset(unit_token)
+            pending_commit_hooks.reset(hooks_token)
+
+
+class QueryCountMiddleware:
+    """A middleware counting SQL statements issued by every request.
+
+    Requests exceeding the configured number of statements, or repeating
+    a single statement too often (a likely N+1 pattern), are logged.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the query count middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+        """
+
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the ASGI call
+
+        Args:
+            scope (Scope): The connection scope
+            receive (Receive): The channel of incoming messages
+            send (Send): The channel of outgoing messages
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries: Counter = Counter()
+        token = request_queries.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_queries.reset(token)
+            check_request_queries(queries, scope["path"])
+
+
+class ReplicaRoutingMiddleware:
+    """A middleware deciding whether reads of a request may use a replica.
+
+    Read-only requests are routed to replicas unless the client has written
+    within the last `window` seconds, which the response to every successful
+    request that changed replicated data records in a cookie; the client then
+    keeps reading from the primary until replication has caught up with its
+    own changes. Write requests which changed nothing (e.g. failed logins)
+    leave the routing of the client alone.
+    """
+
+    def __init__(self, app: ASGIApp, window: int) -> None:
+        """The initializer of the replica routing middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application
+            window (int): The number of seconds a writer reads from the primary
+        """
+
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the ASGI call
+
+        Args:
+            scope (Scope): The connection scope
+            receive (Receive): The channel of incoming messages
+            send (Send): The channel of outgoing messages
+        """
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] in READ_ONLY_METHODS:
+            token = replica_reads_allowed.set(not self._wrote_recently(scope))
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                replica_reads_allowed.reset(token)
+            return
+
+        written: set = set()
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+                and written - PRIMARY_ONLY_TABLES
+            ):
+                cookie = (
+                    f"{PRIMARY_UNTIL_COOKIE}={time.time() + self.window:.0f}; "
+                    f"Max-Age={self.window}; Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode("latin-1")),
+                ]
+
+            await send(message)
+
+        token = request_written_tables.set(written)
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            request_written_tables.reset(token)
+
+    def _wrote_recently(self, scope: Scope) -> bool:
+        """A private method checking the read-your-writes cookie of the request
+
+        Args:
+            scope (Scope): The connection scope
+
+        Returns:
+            bool: Whether the client has to read from the primary
+        """
+
+        for name, value in scope["headers"]:
+            if name != b"cookie":
+                continue
+
+            morsel = SimpleCookie(value.decode("latin-1")).get(PRIMARY_UNTIL_COOKIE)
+            if morsel is None:
+                continue
+
+            try:
+                return float(morsel.value) > time.time()
+            except ValueError:
+                return False
+
+        return False
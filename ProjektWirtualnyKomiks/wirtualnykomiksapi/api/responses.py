@@ -0,0 +1,240 @@
+"""A module containing response classes of the API"""
+
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Hashable, List, Mapping, Optional, Tuple
+
+import msgpack  # type: ignore
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import SchemaSerializer
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+from wirtualnykomiksapi.infrastructure.utils.compression import IDENTITY, compressed_payload_cache
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# The media type negotiated for the current request from its Accept header
+response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+# The content coding negotiated for the current request from its Accept-Encoding header
+response_encoding: ContextVar[str] = ContextVar("response_encoding", default=IDENTITY)
+
+_ANY_ADAPTER: TypeAdapter = TypeAdapter(Any)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type) -> TypeAdapter:
+    """Function getting the cached adapter serializing lists of a model.
+
+    Args:
+        model (type): The model of the list items
+
+    Returns:
+        TypeAdapter: The adapter of the list
+    """
+
+    return TypeAdapter(List[model])  # type: ignore
+
+
+def _serializer(content: Any) -> Tuple[SchemaSerializer, Any]:
+    """Function picking the compiled serializer of the content.
+
+    Models and lists of models are dumped with their compiled pydantic-core
+    serializers; anything else falls back to the generic serializer.
+
+    Args:
+        content (Any): The DTO, list of DTOs or plain data
+
+    Returns:
+        Tuple[SchemaSerializer, Any]: The serializer and the content it accepts
+    """
+
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__, content
+
+    if not isinstance(content, (list, tuple, dict, str, bytes)) and hasattr(content, "__iter__"):
+        content = list(content)
+
+    if isinstance(content, (list, tuple)) and content and isinstance(content[0], BaseModel):
+        return _list_adapter(type(content[0])).serializer, content
+
+    return _ANY_ADAPTER.serializer, content
+
+
+def dump_json(content: Any) -> bytes:
+    """Function serializing DTOs to JSON in a single pass.
+
+    Args:
+        content (Any): The DTO, list of DTOs or plain data
+
+    Returns:
+        bytes: The JSON document
+    """
+
+    serializer, content = _serializer(content)
+    return serializer.to_json(content)
+
+
+def dump_msgpack(content: Any) -> bytes:
+    """Function serializing DTOs to MessagePack.
+
+    The DTOs are first dumped to the same JSON-compatible values as in the
+    JSON responses, so both encodings carry identical documents.
+
+    Args:
+        content (Any): The DTO, list of DTOs or plain data
+
+    Returns:
+        bytes: The MessagePack document
+    """
+
+    serializer, content = _serializer(content)
+    return msgpack.packb(serializer.to_python(content, mode="json"))
+
+
+def dump(content: Any, media_type: str) -> bytes:
+    """Function serializing DTOs to the given media type.
+
+    Args:
+        content (Any): The DTO, list of DTOs, plain data or a pre-serialized
+            JSON document
+        media_type (str): The media type of the body
+
+    Returns:
+        bytes: The serialized document
+    """
+
+    if isinstance(content, bytes):
+        return content
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return dump_msgpack(content)
+
+    return dump_json(content)
+
+
+async def precompress(key: Hashable, content: Any) -> None:
+    """Function caching the bodies of a cacheable response ahead of requests.
+
+    Args:
+        key (Hashable): The cache key the endpoint passes to its responses
+        content (Any): The DTO, list of DTOs or plain data
+    """
+
+    for media_type in (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE):
+        await compressed_payload_cache.precompress(key, media_type, dump(content, media_type))
+
+
+def negotiate_media_type(accept: str) -> str:
+    """Function choosing the response encoding from an Accept header.
+
+    MessagePack is chosen only if the client ranks it at least as high as
+    JSON; anything else gets JSON.
+
+    Args:
+        accept (str): The value of the Accept header
+
+    Returns:
+        str: The negotiated media type
+    """
+
+    quality = {JSON_MEDIA_TYPE: 0.0, MSGPACK_MEDIA_TYPE: 0.0}
+    for item in accept.split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        if media_type == "application/x-msgpack":
+            media_type = MSGPACK_MEDIA_TYPE
+        if media_type not in quality:
+            continue
+
+        value = 1.0
+        for param in params:
+            key, _, number = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    value = float(number)
+                except ValueError:
+                    value = 0.0
+        quality[media_type] = max(quality[media_type], value)
+
+    if quality[MSGPACK_MEDIA_TYPE] > 0 and quality[MSGPACK_MEDIA_TYPE] >= quality[JSON_MEDIA_TYPE]:
+        return MSGPACK_MEDIA_TYPE
+
+    return JSON_MEDIA_TYPE
+
+
+class DTOResponse(Response):
+    """A response rendering already validated DTOs.
+
+    Endpoints returning this response bypass the `response_model` pass of
+    FastAPI, which would validate the DTOs again and encode them through
+    `jsonable_encoder`; `response_model` still documents the schema. The
+    body is JSON or MessagePack, as negotiated for the request.
+
+    Bodies of cacheable responses, which repeat until the data changes,
+    are rendered and compressed once per cache key and then served from the
+    compressed payload cache.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+        cache_key: Optional[Hashable] = None,
+    ) -> None:
+        """The initializer of the DTO response.
+
+        Args:
+            content (Any): The DTO, list of DTOs or plain data
+            status_code (int, optional): The status of the response. Defaults to 200.
+            headers (Optional[Mapping[str, str]], optional): The extra headers
+            background (Optional[BackgroundTask], optional): The task run after sending
+            cache_key (Optional[Hashable], optional): The version of the data
+                and the request parameters the body depends on, if the body
+                is worth caching. Defaults to None.
+        """
+
+        self.media_type = response_media_type.get()
+        self.cache_key = cache_key
+        self.content_encoding = IDENTITY
+        super().__init__(
+            content,
+            status_code,
+            {"vary": "Accept, Accept-Encoding", **(headers or {})},
+            None,
+            background,
+        )
+
+    def render(self, content: Any) -> bytes:
+        """A method serializing the content of the response
+
+        Args:
+            content (Any): The DTO, list of DTOs, plain data or a pre-serialized
+                JSON document
+
+        Returns:
+            bytes: The body of the response
+        """
+
+        if self.cache_key is None:
+            return dump(content, self.media_type)
+
+        body, self.content_encoding = compressed_payload_cache.get(
+            self.cache_key,
+            self.media_type,
+            response_encoding.get(),
+            lambda: dump(content, self.media_type),
+        )
+        return body
+
+    def init_headers(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """A method building the headers of the response
+
+        Args:
+            headers (Optional[Mapping[str, str]], optional): The extra headers
+        """
+
+        super().init_headers(headers)
+        if self.content_encoding != IDENTITY:
+            self.raw_headers.append((b"content-encoding", self.content_encoding.encode("latin-1")))
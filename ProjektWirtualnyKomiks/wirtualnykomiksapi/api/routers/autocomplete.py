@@ -0,0 +1,37 @@
+"""A module containing search autocompletion routers"""
+
+from typing import Iterable, Optional
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+
+from wirtualnykomiksapi.api.responses import DTOResponse
+from wirtualnykomiksapi.container import Container
+from wirtualnykomiksapi.infrastructure.dto.autocompletedto import AutocompleteKind, SuggestionDTO
+from wirtualnykomiksapi.infrastructure.services.iautocomplete import IAutocompleteService
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import MAX_SUGGESTIONS
+
+router = APIRouter()
+
+
+@router.get("", response_model=Iterable[SuggestionDTO], status_code=200)
+@inject
+async def autocomplete(
+        prefix: str = Query(..., min_length=1, max_length=100),
+        kind: Optional[AutocompleteKind] = None,
+        limit: int = Query(default=10, ge=1, le=MAX_SUGGESTIONS),
+        service: IAutocompleteService = Depends(Provide[Container.autocomplete_service]),
+) -> DTOResponse:
+    """An endpoint for getting search suggestions for typed prefix
+
+    Args:
+        prefix (str): The typed prefix
+        kind (Optional[AutocompleteKind]): The kind of terms, all if not given
+        limit (int): The maximal number of suggestions
+        service (IAutocompleteService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The suggestions, most popular first
+    """
+
+    return DTOResponse(await service.suggest(prefix=prefix, kind=kind, limit=limit))
@@ -1,20 +1,17 @@
 """A module containing comic-related routers"""
 
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Union
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
 
+from wirtualnykomiksapi.api.auth import get_current_user_id
+from wirtualnykomiksapi.api.responses import DTOResponse
 from wirtualnykomiksapi.container import Container
 from wirtualnykomiksapi.core.domain.comic import ComicIn, ComicBroker
-from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO
+from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO, FacetedComicsDTO
 from wirtualnykomiksapi.infrastructure.dto.comic_comparison_dto import ComicComparisonDTO
 from wirtualnykomiksapi.infrastructure.services.icomic import IComicService
-from wirtualnykomiksapi.infrastructure.utils import consts
-
-bearer_scheme = HTTPBearer()
 
 router = APIRouter()
 
@@ -23,19 +20,19 @@ router = APIRouter()
 @inject
 async def get_all_comics(
         service: IComicService = Depends(Provide[Container.comic_service]),#type: ignore
-) -> Iterable:
+) -> DTOResponse:
     """An endpoint for getting all comics
 
     Args:
         service (IComicService, optional): The injected service dependency
 
     Returns:
-        Iterable: The comics attributes collection
+        DTOResponse: The comics attributes collection
     """
 
     comics = await service.get_all_comics()
 
-    return comics
+    return DTOResponse(comics)
 
 
 @router.get("/id/{comic_id}", response_model=ComicDTO, status_code=200)
@@ -43,7 +40,7 @@ async def get_all_comics(
 async def get_comic_by_id(
         comic_id: int,
         service: IComicService = Depends(Provide[Container.comic_service]),
-) -> dict | None:
+) -> DTOResponse:
     """An endpoint for comic by id
 
     Args:
@@ -51,35 +48,41 @@ async def get_comic_by_id(
         service (IComicService, optional): The injected service dependency
 
     Returns:
-        dict | None: The comic details
+        DTOResponse: The comic details
     """
 
     if comic := await service.get_comic_by_id(comic_id):
-        return comic.model_dump()
+        return DTOResponse(comic)
 
     raise HTTPException(status_code=404, detail="Comic not found")
 
 
-@router.get("/filter", response_model=Iterable[ComicDTO], status_code=200)
+@router.get("/filter", response_model=Union[List[ComicDTO], FacetedComicsDTO], status_code=200)
 @inject
 async def get_filtered_comics(
     genres: Optional[str] = None,
     tags: Optional[str] = None,
+    facets: bool = False,
     service: IComicService = Depends(Provide[Container.comic_service]),
-) -> Iterable:
+) -> DTOResponse:
     """An endpoint for getting filtered comics
 
     Args:
         genres (Optional[str]): The genre
         tags (Optional[str]): The tag
+        facets (bool): Whether to return genre and tag counts of the result
         service (IComicService, optional): The injected service dependency
 
     Returns:
-        Iterable: The comics details collection
+        DTOResponse: The comics details collection, with the facet counts if requested
     """
 
+    if facets:
+        faceted = await service.get_faceted_comics(genres=genres, tags=tags)
+        return DTOResponse(faceted)
+
     comics = await service.get_filtered_comics(genres=genres, tags=tags)
-    return comics
+    return DTOResponse(comics)
 
 
 @router.get("/top-rated", response_model=Iterable[ComicDTO], status_code=200)
@@ -87,7 +90,7 @@ async def get_filtered_comics(
 async def get_top_rated_comics(
         limit: int,
         service: IComicService = Depends(Provide[Container.comic_service]),
-) -> Iterable:
+) -> DTOResponse:
     """An endpoint for getting comics with the highest average rating
 
     Args:
@@ -95,10 +98,10 @@ async def get_top_rated_comics(
         service (IComicService, optional): The injected service dependency
 
     Returns:
-        Iterable: The comic collection of highest average rated comics
+        DTOResponse: The comic collection of highest average rated comics
     """
     comics = await service.get_top_rated_comics(limit=limit)
-    return comics
+    return DTOResponse(comics)
 
 
 @router.get("/most-popular", response_model=Iterable[ComicDTO], status_code=200)
@@ -106,7 +109,7 @@ async def get_top_rated_comics(
 async def get_most_popular_comics(
         limit: int,
         service: IComicService = Depends(Provide[Container.comic_service]),
-) -> Iterable:
+) -> DTOResponse:
     """An endpoint for getting comics with the most views
 
     Args:
@@ -114,11 +117,11 @@ async def get_most_popular_comics(
         service (IComicService, optional): The injected service dependency
 
     Returns:
-        Iterable: The comic collection of most viewed comics
+        DTOResponse: The comic collection of most viewed comics
     """
 
     comics = await service.get_most_popular_comics(limit=limit)
-    return comics
+    return DTOResponse(comics)
 
 
 @router.get("/compare", response_model=ComicComparisonDTO, status_code=200)
@@ -127,7 +130,7 @@ async def compare_comics(
         comic_id1: int,
         comic_id2: int,
         service: IComicService = Depends(Provide[Container.comic_service]),
-) -> dict:
+) -> DTOResponse:
     """An endpoint for comparing two comics
 
     Args:
@@ -136,11 +139,11 @@ async def compare_comics(
         service (IComicService, optional): The injected service dependency
 
     Returns:
-        dict: The comparison comic details
+        DTOResponse: The comparison comic details
     """
 
     if comparison := await service.compare_comics(comic_id1, comic_id2):
-        return comparison.model_dump()
+        return DTOResponse(comparison)
 
     raise HTTPException(status_code=404, detail="One or both comics not found")
 
@@ -150,36 +153,29 @@ async def compare_comics(
 async def create_comic(
         comic: ComicIn,
         service: IComicService = Depends(Provide[Container.comic_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
-) -> dict:
+        user_uuid: str = Depends(get_current_user_id)
+) -> DTOResponse:
     """An endpoint for adding new comic
 
     Args:
         comic (ComicIn): The comic data,
         service (IComicService, optional): The injected service dependency
-        credentials (HTTPAuthorizationCredentials, optional): The credentials
+        user_uuid (str, optional): The id of the authenticated user
+
+    Raises:
+        HTTPException: 404 if the new comic cannot be read back
 
     Returns:
-        dict: The new comic attributes
+        DTOResponse: The new comic attributes
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
-
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     extended_comic_data = ComicBroker(
         user_id=user_uuid,
         **comic.model_dump()
     )
-    new_comic = await service.add_comic(extended_comic_data)
+    if new_comic := await service.add_comic(extended_comic_data):
+        return DTOResponse(new_comic, status_code=201)
 
-    return new_comic.model_dump() if new_comic else {}
+    raise HTTPException(status_code=404, detail="Comic not found")
 
 
 @router.put("/{comic_id}", response_model=ComicDTO, status_code=200)
@@ -188,33 +184,22 @@ async def update_comic(
         comic_id: int,
         updated_comic: ComicIn,
         service: IComicService = Depends(Provide[Container.comic_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+        user_uuid: str = Depends(get_current_user_id),
+) -> DTOResponse:
     """An endpoint for updating comic data
 
     Args:
         comic_id (int): The id of the comic
         updated_comic (ComicIn): The updated comic details
         service (IComicService, optional): The injected service dependency
-        credentials (HTTPAuthorizationCredentials, optional): The crendetials
+        user_uuid (str, optional): The id of the authenticated user
 
     Raises:
         HTTPException: 404 if comic doesn't exist
 
     Returns:
-        dict: The updated comic details
+        DTOResponse: The updated comic details
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
-
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if comic_data := await service.get_comic_by_id(comic_id=comic_id):
         if str(comic_data.user_id) != user_uuid:
             raise HTTPException(status_code=403, detail="Unauthorized")
@@ -228,8 +213,8 @@ async def update_comic(
             comic_id=comic_id,
             data=extended_updated_comic,
         )
-        return updated_comic_data.model_dump() if updated_comic_data \
-            else {}
+        if updated_comic_data:
+            return DTOResponse(updated_comic_data)
 
     raise HTTPException(status_code=404, detail="Comic not found")
 
@@ -1,13 +1,19 @@
 """A module containing genre-related routers"""
-from typing import Iterable
+from typing import Iterable, List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException
 
+from wirtualnykomiksapi.api.responses import (
+    MSGPACK_MEDIA_TYPE,
+    DTOResponse,
+    response_media_type,
+)
 from wirtualnykomiksapi.container import Container
 from wirtualnykomiksapi.core.domain.genre import Genre, GenreIn
 from wirtualnykomiksapi.infrastructure.dto.genredto import GenreDTO
 from wirtualnykomiksapi.infrastructure.services.igenre import IGenreService
+from wirtualnykomiksapi.infrastructure.utils.dictionary import genre_dictionary
 
 router = APIRouter()
 
@@ -15,26 +21,30 @@ router = APIRouter()
 @inject
 async def get_all_genres(
         service: IGenreService = Depends(Provide[Container.genre_service]),
-) -> Iterable:
+) -> DTOResponse:
     """An endpoint for getting all genres
 
     Args:
         service (IGenreService, optional): The injected service dependency
 
     Returns:
-        Iterable: The genre attributes collection
+        DTOResponse: The genre attributes collection, pre-serialized for JSON clients
     """
 
-    genres = await service.get_all_genres()
-    return genres
+    # Taken before the listing, so a concurrent change can only make the cached body newer
+    cache_key = ("genre/all", genre_dictionary.snapshot.version)
+    if response_media_type.get() == MSGPACK_MEDIA_TYPE:
+        return DTOResponse(await service.get_all_genres(), cache_key=cache_key)
 
+    return DTOResponse(await service.get_all_genres_json(), cache_key=cache_key)
 
-@router.get("/{genre_id}", response_model=GenreDTO, status_code=200)
+
+@router.get("/{genre_id}", response_model=Genre, status_code=200)
 @inject
 async def get_genre_by_id(
         genre_id: int,
         service: IGenreService = Depends(Provide[Container.genre_service]),
-) -> dict | None:
+) -> DTOResponse:
     """An endpoint for getting genre by id
 
     Args:
@@ -42,11 +52,11 @@ async def get_genre_by_id(
         service (IGenreService, optional): The injected service dependency
 
     Returns:
-        dict | None: The requested genre attributes
+        DTOResponse: The requested genre attributes
     """
 
     if genre := await service.get_genre_by_id(genre_id):
-        return genre.model_dump()
+        return DTOResponse(genre)
 
     raise HTTPException(status_code=404, detail="Genre not found")
 
@@ -56,7 +66,7 @@ async def get_genre_by_id(
 async def create_genre(
         genre: GenreIn,
         service: IGenreService = Depends(Provide[Container.genre_service]),
-) -> dict:
+) -> DTOResponse:
     """An endpoint for adding new genre
 
     Args:
@@ -64,10 +74,29 @@ async def create_genre(
         service (IGenreService, optional): The injected service dependency
 
     Returns:
-        dict: The new genre attributes
+        DTOResponse: The new genre attributes
     """
     new_genre = await service.add_genre(genre)
-    return new_genre.model_dump() if new_genre else {}
+    return DTOResponse(new_genre, status_code=201)
+
+
+@router.post("/resolve", response_model=Iterable[GenreDTO], status_code=200)
+@inject
+async def resolve_genres(
+        names: List[str] = Body(..., max_length=1000),
+        service: IGenreService = Depends(Provide[Container.genre_service]),
+) -> DTOResponse:
+    """An endpoint for getting ids of genres by name, creating the missing ones
+
+    Args:
+        names (List[str]): The genre names
+        service (IGenreService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The genres in the order of the first occurrence of their names
+    """
+
+    return DTOResponse(await service.resolve_genres(names))
 
 
 @router.put("/{genre_id}", response_model=Genre, status_code=201)
@@ -76,7 +105,7 @@ async def update_genre(
         genre_id: int,
         updated_genre: GenreIn,
         service: IGenreService = Depends(Provide[Container.genre_service]),
-) -> dict:
+) -> DTOResponse:
     """An endpoint for updating genre data
 
     Args:
@@ -88,7 +117,7 @@ async def update_genre(
          HTTPException: 404 if genre does not exist
 
     Returns:
-        dict: The updated genre data
+        DTOResponse: The updated genre data
     """
     if await service.get_genre_by_id(genre_id=genre_id):
         new_updated_genre = await service.update_genre(
@@ -96,7 +125,8 @@ async def update_genre(
             data=updated_genre,
         )
 
-        return new_updated_genre.model_dump() if new_updated_genre else {}
+        if new_updated_genre:
+            return DTOResponse(new_updated_genre, status_code=201)
 
     raise HTTPException(status_code=404, detail="Genre not found")
 
@@ -0,0 +1,49 @@
+"""A module containing health probe routers"""
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from wirtualnykomiksapi.db import database
+from wirtualnykomiksapi.infrastructure.dto.healthdto import HealthDTO
+from wirtualnykomiksapi.infrastructure.utils.readiness import readiness
+
+router = APIRouter()
+
+# The number of seconds the database has to answer the readiness probe
+DATABASE_CHECK_TIMEOUT = 1.0
+
+
+@router.get("/healthz", response_model=HealthDTO, status_code=200)
+async def get_liveness() -> dict:
+    """An endpoint for checking whether the worker process is alive
+
+    Returns:
+        dict: The liveness status
+    """
+
+    return {"status": "alive"}
+
+
+@router.get("/readyz", response_model=HealthDTO, status_code=200)
+async def get_readiness() -> JSONResponse:
+    """An endpoint for checking whether the worker may receive traffic
+
+    Returns:
+        JSONResponse: The result of every readiness check, with status
+            503 if any of them fails
+    """
+
+    checks = readiness.evaluate()
+    try:
+        await asyncio.wait_for(database.fetch_val("SELECT 1"), DATABASE_CHECK_TIMEOUT)
+        checks["database"] = True
+    except Exception:  # pylint: disable=broad-except
+        checks["database"] = False
+
+    ready = all(checks.values())
+    return JSONResponse(
+        HealthDTO(status="ready" if ready else "unavailable", checks=checks).model_dump(),
+        status_code=200 if ready else 503,
+    )
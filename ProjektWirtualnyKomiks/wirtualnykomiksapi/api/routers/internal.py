@@ -0,0 +1,97 @@
+"""A module containing internal operational routers"""
+
+from typing import Iterable
+
+from fastapi import APIRouter, Depends
+
+from wirtualnykomiksapi.api.auth import require_internal_token
+
+from wirtualnykomiksapi.infrastructure.dto.metricsdto import (
+    LoginThrottleMetricsDTO,
+    PasswordPoolMetricsDTO,
+    PoolMetricsDTO,
+    QueryMetricsDTO,
+    ReplicaMetricsDTO,
+    TokenCacheMetricsDTO,
+)
+from wirtualnykomiksapi.db import database
+from wirtualnykomiksapi.infrastructure.utils.password import password_pool
+from wirtualnykomiksapi.infrastructure.utils.pool import pool_monitor
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import query_recorder
+from wirtualnykomiksapi.infrastructure.utils.throttle import (
+    login_email_limiter,
+    login_ip_limiter,
+)
+from wirtualnykomiksapi.infrastructure.utils.token import token_cache
+
+# Metrics reveal SQL statements and traffic of users, so only operators may read them
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@router.get("/pool", response_model=PoolMetricsDTO, status_code=200)
+async def get_pool_metrics() -> dict:
+    """An endpoint for getting database connection pool metrics
+
+    Returns:
+        dict: The pool occupancy and acquire latency percentiles
+    """
+
+    return pool_monitor.metrics()
+
+
+@router.get("/queries", response_model=Iterable[QueryMetricsDTO], status_code=200)
+async def get_query_metrics() -> Iterable:
+    """An endpoint for getting latency histograms of SQL statements
+
+    Returns:
+        Iterable: The statement fingerprints, the most time-consuming first
+    """
+
+    return query_recorder.metrics()
+
+
+@router.get("/replicas", response_model=Iterable[ReplicaMetricsDTO], status_code=200)
+async def get_replica_metrics() -> Iterable:
+    """An endpoint for getting the state of read replicas
+
+    Returns:
+        Iterable: The replica hosts, their health and number of routed reads
+    """
+
+    return database.replicas.metrics()
+
+
+@router.get("/password-pool", response_model=PasswordPoolMetricsDTO, status_code=200)
+async def get_password_pool_metrics() -> dict:
+    """An endpoint for getting password hashing pool metrics
+
+    Returns:
+        dict: The pool concurrency and queue depth metrics
+    """
+
+    return password_pool.metrics()
+
+
+@router.get("/token-cache", response_model=TokenCacheMetricsDTO, status_code=200)
+async def get_token_cache_metrics() -> dict:
+    """An endpoint for getting verified token cache metrics
+
+    Returns:
+        dict: The cache size and hit statistics
+    """
+
+    return token_cache.metrics()
+
+
+@router.get("/login-throttle", response_model=LoginThrottleMetricsDTO, status_code=200)
+async def get_login_throttle_metrics() -> dict:
+    """An endpoint for getting login throttling metrics
+
+    Returns:
+        dict: The per-IP and per-email limiter metrics
+    """
+
+    return {
+        "ip": login_ip_limiter.metrics(),
+        "email": login_email_limiter.metrics(),
+    }
@@ -0,0 +1,120 @@
+"""A module containing catalog statistics routers"""
+
+from typing import Iterable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query
+
+from wirtualnykomiksapi.api.responses import DTOResponse, precompress
+from wirtualnykomiksapi.container import Container
+from wirtualnykomiksapi.infrastructure.dto.statsdto import (
+    AuthorRankingCriterion,
+    AuthorStatsDTO,
+    CorrelationDTO,
+    GenreRatingDTO,
+    RatingDistributionDTO,
+)
+from wirtualnykomiksapi.infrastructure.services.istats import IStatsService
+
+router = APIRouter()
+
+DEFAULT_AUTHOR_LIMIT = 10
+
+
+async def precompress_stats(service: IStatsService) -> None:
+    """Function caching the bodies of the statistics endpoints for a new snapshot.
+
+    Args:
+        service (IStatsService): The statistics service
+    """
+
+    version = await service.get_snapshot_version()
+    await precompress(("stats/ratings", version), await service.get_rating_distribution())
+    await precompress(("stats/genres", version), await service.get_genre_ratings())
+    await precompress(("stats/correlations", version), await service.get_correlation())
+    for criterion in AuthorRankingCriterion:
+        await precompress(
+            ("stats/authors", version, criterion, DEFAULT_AUTHOR_LIMIT),
+            await service.get_author_leaderboard(sort_by=criterion, limit=DEFAULT_AUTHOR_LIMIT),
+        )
+
+
+@router.get("/ratings", response_model=RatingDistributionDTO, status_code=200)
+@inject
+async def get_rating_distribution(
+        service: IStatsService = Depends(Provide[Container.stats_service]),
+) -> DTOResponse:
+    """An endpoint for getting the distribution of review ratings
+
+    Args:
+        service (IStatsService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The rating distribution
+    """
+
+    version = await service.get_snapshot_version()
+    distribution = await service.get_rating_distribution()
+    return DTOResponse(distribution, cache_key=("stats/ratings", version))
+
+
+@router.get("/genres", response_model=Iterable[GenreRatingDTO], status_code=200)
+@inject
+async def get_genre_ratings(
+        service: IStatsService = Depends(Provide[Container.stats_service]),
+) -> DTOResponse:
+    """An endpoint for getting mean and median rating per genre
+
+    Args:
+        service (IStatsService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The per-genre rating aggregates
+    """
+
+    version = await service.get_snapshot_version()
+    return DTOResponse(await service.get_genre_ratings(), cache_key=("stats/genres", version))
+
+
+@router.get("/correlations", response_model=CorrelationDTO, status_code=200)
+@inject
+async def get_correlation(
+        service: IStatsService = Depends(Provide[Container.stats_service]),
+) -> DTOResponse:
+    """An endpoint for getting correlations between views, likes and ratings
+
+    Args:
+        service (IStatsService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The metric correlations
+    """
+
+    version = await service.get_snapshot_version()
+    correlation = await service.get_correlation()
+    return DTOResponse(correlation, cache_key=("stats/correlations", version))
+
+
+@router.get("/authors", response_model=Iterable[AuthorStatsDTO], status_code=200)
+@inject
+async def get_author_leaderboard(
+        sort_by: AuthorRankingCriterion = AuthorRankingCriterion.VIEWS,
+        limit: int = Query(default=DEFAULT_AUTHOR_LIMIT, ge=1, le=100),
+        service: IStatsService = Depends(Provide[Container.stats_service]),
+) -> DTOResponse:
+    """An endpoint for getting the author leaderboard
+
+    Args:
+        sort_by (AuthorRankingCriterion): The ranking criterion
+        limit (int): The amount of shown authors
+        service (IStatsService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The best authors by given criterion
+    """
+
+    version = await service.get_snapshot_version()
+    return DTOResponse(
+        await service.get_author_leaderboard(sort_by=sort_by, limit=limit),
+        cache_key=("stats/authors", version, sort_by, limit),
+    )
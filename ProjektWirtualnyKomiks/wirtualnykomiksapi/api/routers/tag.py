@@ -1,16 +1,22 @@
 """A module containing tag-related routers"""
 
-from typing import Iterable
+from typing import Iterable, List
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException
 from fastapi.openapi.models import HTTPBearer
 
 
+from wirtualnykomiksapi.api.responses import (
+    MSGPACK_MEDIA_TYPE,
+    DTOResponse,
+    response_media_type,
+)
 from wirtualnykomiksapi.container import Container
 from wirtualnykomiksapi.core.domain.tag import Tag, TagIn
 from wirtualnykomiksapi.infrastructure.dto.tagdto import TagDTO
 from wirtualnykomiksapi.infrastructure.services.itag import ITagService
+from wirtualnykomiksapi.infrastructure.utils.dictionary import tag_dictionary
 
 bearer_scheme = HTTPBearer()
 
@@ -20,26 +26,30 @@ router = APIRouter()
 @inject
 async def get_all_tags(
         service: ITagService = Depends(Provide[Container.tag_service]),
-) -> Iterable:
+) -> DTOResponse:
     """An endpoint for getting all tags
 
     Args:
         service (ITagService, optional): The injected service dependency
 
     Returns:
-        Iterable: The tag attributes collection
+        DTOResponse: The tag attributes collection, pre-serialized for JSON clients
     """
 
-    tags = await service.get_all_tags()
-    return tags
+    # Taken before the listing, so a concurrent change can only make the cached body newer
+    cache_key = ("tag/all", tag_dictionary.snapshot.version)
+    if response_media_type.get() == MSGPACK_MEDIA_TYPE:
+        return DTOResponse(await service.get_all_tags(), cache_key=cache_key)
 
+    return DTOResponse(await service.get_all_tags_json(), cache_key=cache_key)
 
-@router.get("/{tag_id}", response_model=TagDTO, status_code=200)
+
+@router.get("/{tag_id}", response_model=Tag, status_code=200)
 @inject
 async def get_tag_by_id(
         tag_id: int,
         service: ITagService = Depends(Provide[Container.tag_service]),
-) -> dict | None:
+) -> DTOResponse:
     """An endpoint for getting tag details by id
 
     Args:
@@ -50,11 +60,11 @@ async def get_tag_by_id(
         HTTPException: 404 if tag does not exist
 
     Returns:
-        dict | None: The requested tag attributes
+        DTOResponse: The requested tag attributes
     """
 
     if tag := await service.get_tag_by_id(tag_id=tag_id):
-        return tag.model_dump()
+        return DTOResponse(tag)
 
     raise HTTPException(status_code=404, detail="Tag not found")
 
@@ -64,7 +74,7 @@ async def get_tag_by_id(
 async def create_tag(
         tag: TagIn,
         service: ITagService = Depends(Provide[Container.tag_service]),
-) -> dict:
+) -> DTOResponse:
     """An endpoint for adding new tags
 
     Args:
@@ -72,12 +82,31 @@ async def create_tag(
         service (ITagService, optional): The injected service dependency
 
     Returns:
-        dict: The new tag attributes
+        DTOResponse: The new tag attributes
     """
 
     new_tag = await service.add_tag(tag)
 
-    return new_tag.model_dump() if new_tag else {}
+    return DTOResponse(new_tag, status_code=201)
+
+
+@router.post("/resolve", response_model=Iterable[TagDTO], status_code=200)
+@inject
+async def resolve_tags(
+        names: List[str] = Body(..., max_length=1000),
+        service: ITagService = Depends(Provide[Container.tag_service]),
+) -> DTOResponse:
+    """An endpoint for getting ids of tags by name, creating the missing ones
+
+    Args:
+        names (List[str]): The tag names
+        service (ITagService, optional): The injected service dependency
+
+    Returns:
+        DTOResponse: The tags in the order of the first occurrence of their names
+    """
+
+    return DTOResponse(await service.resolve_tags(names))
 
 
 @router.put("/{tag_id}", response_model=Tag, status_code=201)
@@ -86,7 +115,7 @@ async def update_tag(
         tag_id: int,
         updated_tag: TagIn,
         service: ITagService = Depends(Provide[Container.tag_service]),
-) -> dict:
+) -> DTOResponse:
     """An endpoint for updating tag data
 
     Args:
@@ -98,7 +127,7 @@ async def update_tag(
         HTTPException: 404 if tag does not exist
 
     Returns:
-        dict: The updated tag data
+        DTOResponse: The updated tag data
     """
     if await service.get_tag_by_id(tag_id=tag_id):
         new_updated_tag = await service.update_tag(
@@ -106,7 +135,8 @@ async def update_tag(
             data=updated_tag,
         )
 
-        return new_updated_tag.model_dump() if new_updated_tag else {}
+        if new_updated_tag:
+            return DTOResponse(new_updated_tag, status_code=201)
 
     raise HTTPException(status_code=404, detail="Tag not found")
 
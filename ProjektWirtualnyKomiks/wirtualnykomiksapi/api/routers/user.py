@@ -1,13 +1,21 @@
 """A module containing user-related routers"""
 
+import math
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 
+from wirtualnykomiksapi.api.responses import DTOResponse
 from wirtualnykomiksapi.container import Container
-from wirtualnykomiksapi.core.domain.user import UserIn
+from wirtualnykomiksapi.core.domain.user import RefreshTokenIn, UserIn
 from wirtualnykomiksapi.infrastructure.dto.tokendto import TokenDTO
 from wirtualnykomiksapi.infrastructure.dto.userdto import UserDTO
 from wirtualnykomiksapi.infrastructure.services.iuser import IUserService
+from wirtualnykomiksapi.infrastructure.utils.throttle import (
+    TokenBucketLimiter,
+    login_email_limiter,
+    login_ip_limiter,
+)
 
 router = APIRouter()
 
@@ -16,7 +24,7 @@ router = APIRouter()
 async def register_user(
     user: UserIn,
     service: IUserService = Depends(Provide[Container.user_service]),
-) -> dict:
+) -> DTOResponse:
     """A router coroutine for registering new user
 
     Args:
@@ -24,11 +32,11 @@ async def register_user(
         service (IUserService, optional): The injected user service.
 
     Returns:
-        dict: The user DTO details.
+        DTOResponse: The user DTO details.
     """
 
     if new_user := await service.register_user(user):
-        return UserDTO(**dict(new_user)).model_dump()
+        return DTOResponse(UserDTO(**dict(new_user)), status_code=201)
 
     raise HTTPException(
         status_code=400,
@@ -40,23 +48,80 @@ async def register_user(
 @inject
 async def authenticate_user(
     user: UserIn,
+    request: Request,
     service: IUserService = Depends(Provide[Container.user_service]),
-) -> dict:
+) -> DTOResponse:
     """A router coroutine for authenticating users.
 
     Args:
         user (UserIn): The user input data.
+        request (Request): The incoming HTTP request.
         service (IUserService, optional): The injected user service.
 
+    Raises:
+        HTTPException: 429 if too many attempts came from the client or for the e-mail
+
     Returns:
-        dict: The token DTO details.
+        DTOResponse: The token DTO details.
     """
 
+    client_ip = request.client.host if request.client else "unknown"
+    _throttle_login(login_ip_limiter, client_ip)
+    _throttle_login(login_email_limiter, user.email.strip().lower())
+
     if token_details := await service.authenticate_user(user):
         print("user confirmed")
-        return token_details.model_dump()
+        return DTOResponse(token_details)
 
     raise HTTPException(
         status_code=401,
         detail="Provided incorrect credentials",
     )
+
+
+@router.post("/token/refresh", response_model=TokenDTO, status_code=200)
+@inject
+async def refresh_user_token(
+    data: RefreshTokenIn,
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> DTOResponse:
+    """A router coroutine for exchanging refresh token for new access and refresh tokens.
+
+    The refresh token is single-use; the response carries its replacement.
+
+    Args:
+        data (RefreshTokenIn): The refresh token.
+        service (IUserService, optional): The injected user service.
+
+    Returns:
+        DTOResponse: The token DTO details.
+    """
+
+    if token_details := await service.refresh_user_token(data.refresh_token):
+        return DTOResponse(token_details)
+
+    raise HTTPException(
+        status_code=401,
+        detail="Invalid or expired refresh token",
+    )
+
+
+def _throttle_login(limiter: TokenBucketLimiter, key: str) -> None:
+    """A function rejecting the login attempt when the bucket is empty
+
+    Args:
+        limiter (TokenBucketLimiter): The limiter to take the token from
+        key (str): The throttled key
+
+    Raises:
+        HTTPException: 429 if there are no tokens left for the key
+    """
+
+    allowed, retry_after = limiter.acquire(key)
+
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
@@ -1,52 +1,104 @@
 """A module containing user comic list-related routers"""
 
-from typing import Iterable
+from typing import Iterable, List, Optional, Union
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 
+from wirtualnykomiksapi.api.auth import get_current_user_id
+from wirtualnykomiksapi.api.responses import DTOResponse
 from wirtualnykomiksapi.container import Container
-from wirtualnykomiksapi.core.domain.user_comic_list import UserComicList, UserComicListBroker, UserComicListStatus
-from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import UserComicListDTO
+from wirtualnykomiksapi.core.domain.user_comic_list import (
+    UserComicList,
+    UserComicListBroker,
+    UserComicListIn,
+    UserComicListSort,
+    UserComicListStatus,
+)
+from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import (
+    UserComicListDTO,
+    UserComicListPageDTO,
+    UserComicListSummaryDTO,
+)
 from wirtualnykomiksapi.infrastructure.services.iuser_comic_list import IUserComicListService
-from wirtualnykomiksapi.infrastructure.utils import consts
 
 
-bearer_scheme = HTTPBearer()
-
 router = APIRouter()
 
 
-@router.get("/all", response_model=Iterable[UserComicListDTO], status_code=200)
+@router.get(
+    "/all",
+    response_model=Union[List[UserComicListDTO], UserComicListPageDTO],
+    status_code=200,
+)
 @inject
 async def get_user_list(
+        status: Optional[UserComicListStatus] = None,
+        sort_by: Optional[UserComicListSort] = None,
+        limit: Optional[int] = Query(default=None, ge=1, le=200),
+        cursor: Optional[str] = None,
         service: IUserComicListService = Depends(Provide[Container.user_comic_list_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> Iterable:
-    """An endpoint for getting user's comic list
+        user_uuid: str = Depends(get_current_user_id),
+) -> DTOResponse:
+    """An endpoint for getting a page of user's comic list
+
+    Without any of the query parameters the whole list is returned as
+    a bare list of entries, the response of clients from before paging.
 
     Args:
+        status (Optional[UserComicListStatus]): The status to filter by
+        sort_by (Optional[UserComicListSort]): The order of the entries,
+            by title if not given
+        limit (Optional[int]): The maximal number of entries on the page,
+            50 if not given
+        cursor (Optional[str]): The cursor returned with the previous page
         service (IUserComicListService, optional): The injected service
-        credentials (HTTPAuthorizationCredentials, optional): The credentials
+        user_uuid (str, optional): The id of the authenticated user
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
 
     Returns:
-        Iterable: The collection of comics in user's list
+        DTOResponse: The entries and the cursor of the next page
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
 
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
+    if status is None and sort_by is None and limit is None and cursor is None:
+        comic_list = await service.get_whole_user_list(user_id=user_uuid)
+        return DTOResponse(comic_list)
+
+    try:
+        page = await service.get_user_list(
+            user_id=user_uuid,
+            status=status,
+            sort_by=sort_by or UserComicListSort.TITLE,
+            limit=limit or 50,
+            cursor=cursor,
+        )
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return DTOResponse(page)
+
+
+@router.get("/summary", response_model=UserComicListSummaryDTO, status_code=200)
+@inject
+async def get_summary(
+        service: IUserComicListService = Depends(Provide[Container.user_comic_list_service]),
+        user_uuid: str = Depends(get_current_user_id),
+) -> DTOResponse:
+    """An endpoint for getting number of comics per status in user's list
+
+    Args:
+        service (IUserComicListService, optional): The injected service
+        user_uuid (str, optional): The id of the authenticated user
+
+    Returns:
+        DTOResponse: The counts of comics by status
+    """
 
-    comic_list = await service.get_user_list(user_id=user_uuid)
-    return comic_list
+    summary = await service.get_summary(user_id=user_uuid)
+    return DTOResponse(summary)
 
 
 @router.post("/add", response_model=UserComicList, status_code=201)
@@ -54,30 +106,19 @@ async def get_user_list(
 async def add_comic(
     comic_id: int,
     service: IUserComicListService = Depends(Provide[Container.user_comic_list_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
-) -> dict:
+    user_uuid: str = Depends(get_current_user_id)
+) -> DTOResponse:
     """An endpoint for adding comic to user's comic list
 
     Args:
         comic_id (int): The id of the comic
         service (IUserComicListService, optional): The injected service dependency
-        credentials (HTTPAuthorizationCredentials, optional): The credentials
+        user_uuid (str, optional): The id of the authenticated user
 
     Returns:
-        dict: The new comic list
+        DTOResponse: The new comic list
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
-
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     extended_user_list = UserComicListBroker(
         user_id=user_uuid,
         comic_id=comic_id,
@@ -86,7 +127,7 @@ async def add_comic(
 
     new_comic = await service.add_comic(extended_user_list)
 
-    return new_comic.model_dump() if new_comic else {}
+    return DTOResponse(new_comic, status_code=201)
 
 
 @router.put("/{comic_id}", response_model=UserComicList, status_code=201)
@@ -95,34 +136,23 @@ async def update_status(
         comic_id: int,
         status: str,
         service: IUserComicListService = Depends(Provide[Container.user_comic_list_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> UserComicListDTO:
+        user_uuid: str = Depends(get_current_user_id),
+) -> DTOResponse:
     """An endpoint for updating comic status on user's list
 
     Args:
         comic_id (int): The id of the comic
         status (str): Status of the comic
         service (IUserComicListService, optional): The injected service dependency
-        credentials (HTTPAuthorizationCredentials, optional): The credentials
+        user_uuid (str, optional): The id of the authenticated user
 
     Raises:
         HTTPException: 404 if comic does not exist
 
     Returns:
-        dict: The updated comic status details
+        DTOResponse: The updated comic status details
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
-
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     try:
         updated = await service.update_status(user_id=user_uuid, comic_id=comic_id, status=status)
 
@@ -133,7 +163,28 @@ async def update_status(
     if not updated:
         raise HTTPException(status_code=404, detail="Comic not found")
 
-    return updated
+    return DTOResponse(updated, status_code=201)
+
+
+@router.patch("/bulk", response_model=Iterable[UserComicList], status_code=200)
+@inject
+async def update_statuses(
+        entries: List[UserComicListIn] = Body(..., max_length=1000),
+        service: IUserComicListService = Depends(Provide[Container.user_comic_list_service]),
+        user_uuid: str = Depends(get_current_user_id),
+) -> DTOResponse:
+    """An endpoint for updating statuses of many comics on user's list at once
+
+    Args:
+        entries (List[UserComicListIn]): The comic ids with their new statuses
+        service (IUserComicListService, optional): The injected service dependency
+        user_uuid (str, optional): The id of the authenticated user
+
+    Returns:
+        DTOResponse: The entries whose status has changed
+    """
+
+    return DTOResponse(await service.update_statuses(user_id=user_uuid, entries=entries))
 
 
 @router.delete("/{comic_id}", status_code=204)
@@ -141,29 +192,18 @@ async def update_status(
 async def delete_comic(
         comic_id: int,
         service: IUserComicListService = Depends(Provide[Container.user_comic_list_service]),
-        credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme)
+        user_uuid: str = Depends(get_current_user_id)
 ) -> None:
     """An endpoint for deleting comic from user's list
 
     Args:
         comic_id (int): The id of the comic
         service (IUserComicListService, optional): The  injected service
-        credentials (HTTPAuthorizationCredentials, optional): The credentials
+        user_uuid (str, optional): The id of the authenticated user
 
     Raises:
         HTTPException: 404 if comic doesn't exist in user's list
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
-
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     delete = await service.delete_comic(user_id=user_uuid, comic_id=comic_id)
 
     if not delete:
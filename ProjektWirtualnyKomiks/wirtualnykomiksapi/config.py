@@ -15,6 +15,39 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_BACKEND: str = "databases"
+    DB_CONNECT_RETRIES: int = 8
+    DB_CONNECT_BACKOFF_BASE: float = 0.5
+    DB_CONNECT_BACKOFF_MAX: float = 10.0
+    DB_REPLICA_HOSTS: str = ""
+    DB_REPLICA_CHECK_SECONDS: float = 5.0
+    READ_YOUR_WRITES_SECONDS: int = 5
+    DB_POOL_MIN_SIZE: int = 2
+    DB_POOL_MAX_SIZE: int = 10
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_POOL_ACQUIRE_TIMEOUT: float = 10.0
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    INTERNAL_API_TOKEN: Optional[str] = None
+    SLOW_QUERY_MS: float = 200.0
+    REQUEST_QUERY_LIMIT: int = 20
+    REQUEST_QUERY_REPEAT_LIMIT: int = 5
+    STATS_REFRESH_SECONDS: float = 300.0
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_LEVEL: Optional[str] = None
+    COMPRESSION_CPU_THRESHOLD: int = 4
+    COMPRESSION_CACHE_SIZE: int = 512
+    COMPRESSION_THREAD_SIZE: int = 262144
+    SHUTDOWN_GRACE_SECONDS: float = 5.0
+    SHUTDOWN_DRAIN_SECONDS: float = 20.0
+    SHUTDOWN_HOOK_SECONDS: float = 5.0
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    TOKEN_CACHE_SIZE: int = 10000
+    LOGIN_IP_BURST: float = 20
+    LOGIN_IP_PER_MINUTE: float = 20
+    LOGIN_EMAIL_BURST: float = 5
+    LOGIN_EMAIL_PER_MINUTE: float = 5
+    LOGIN_THROTTLE_MAX_KEYS: int = 100000
 
 
 config = AppConfig()
\ No newline at end of file
@@ -1,14 +1,20 @@
 """Module providing containers injecting dependencies"""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Singleton, Factory
+from dependency_injector.providers import Factory, Object, Selector, Singleton
+
+from wirtualnykomiksapi.config import config
 
 from wirtualnykomiksapi.infrastructure.repositories.comicdb import ComicRepository
+from wirtualnykomiksapi.infrastructure.repositories.comicpg import AsyncpgComicRepository
 from wirtualnykomiksapi.infrastructure.repositories.reviewdb import ReviewRepository
+from wirtualnykomiksapi.infrastructure.repositories.reviewpg import AsyncpgReviewRepository
 from wirtualnykomiksapi.infrastructure.repositories.genredb import GenreRepository
 from wirtualnykomiksapi.infrastructure.repositories.tagdb import TagRepository
 from wirtualnykomiksapi.infrastructure.repositories.user_comic_listdb import UserComicListRepository
 from wirtualnykomiksapi.infrastructure.repositories.user import UserRepository
+from wirtualnykomiksapi.infrastructure.repositories.statsdb import StatsRepository
+from wirtualnykomiksapi.infrastructure.repositories.autocompletedb import AutocompleteRepository
 
 
 from wirtualnykomiksapi.infrastructure.services.comic import ComicService
@@ -17,15 +23,28 @@ from wirtualnykomiksapi.infrastructure.services.genre import GenreService
 from wirtualnykomiksapi.infrastructure.services.tag import TagService
 from wirtualnykomiksapi.infrastructure.services.user_comic_list import UserComicListService
 from wirtualnykomiksapi.infrastructure.services.user import UserService
+from wirtualnykomiksapi.infrastructure.services.stats import StatsService
+from wirtualnykomiksapi.infrastructure.services.autocomplete import AutocompleteService
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes"""
-    comic_repository = Singleton(ComicRepository)
-    review_repository = Singleton(ReviewRepository)
+    # DB_BACKEND="asyncpg" runs the pre-compiled reads on a separate asyncpg pool
+    comic_repository = Selector(
+        Object(config.DB_BACKEND),
+        databases=Singleton(ComicRepository),
+        asyncpg=Singleton(AsyncpgComicRepository),
+    )
+    review_repository = Selector(
+        Object(config.DB_BACKEND),
+        databases=Singleton(ReviewRepository),
+        asyncpg=Singleton(AsyncpgReviewRepository),
+    )
     genre_repository = Singleton(GenreRepository)
     tag_repository = Singleton(TagRepository)
     user_comic_list_repository = Singleton(UserComicListRepository)
     user_repository = Singleton(UserRepository)
+    stats_repository = Singleton(StatsRepository)
+    autocomplete_repository = Singleton(AutocompleteRepository)
 
     comic_service = Factory(
         ComicService,
@@ -56,3 +75,13 @@ class Container(DeclarativeContainer):
         UserService,
         repository=user_repository,
     )
+
+    stats_service = Singleton(
+        StatsService,
+        repository=stats_repository,
+    )
+
+    autocomplete_service = Singleton(
+        AutocompleteService,
+        repository=autocomplete_repository,
+    )
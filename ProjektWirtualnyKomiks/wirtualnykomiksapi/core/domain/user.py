@@ -11,4 +11,8 @@ class UserIn(BaseModel):
 class User(UserIn):
     """The user model class"""
     id: UUID4
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+class RefreshTokenIn(BaseModel):
+    """An input model for exchanging refresh token"""
+    refresh_token: str
\ No newline at end of file
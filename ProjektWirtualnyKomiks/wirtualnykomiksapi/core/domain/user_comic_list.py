@@ -11,6 +11,13 @@ class UserComicListStatus(str, Enum):
     DROPPED = "dropped"
 
 
+class UserComicListSort(str, Enum):
+    """Order of entries in user's comic list"""
+    TITLE = "title"
+    ADDED = "added"
+    STATUS = "status"
+
+
 class UserComicListIn(BaseModel):
     """Model representing all user comic list attributes"""
     comic_id: int
@@ -0,0 +1,32 @@
+"""Model containing autocompletion repository abstractions"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class IAutocompleteRepository(ABC):
+    """An abstract class representing protocol of autocompletion repository"""
+
+    @abstractmethod
+    async def get_comic_terms(self) -> Iterable[Any]:
+        """Abstract method getting comic titles and authors with their views
+
+        Returns:
+            Iterable[Any]: The comic titles, authors and views
+        """
+
+    @abstractmethod
+    async def get_genre_terms(self) -> Iterable[Any]:
+        """Abstract method getting genre names with their number of comics
+
+        Returns:
+            Iterable[Any]: The genre names and comic counts
+        """
+
+    @abstractmethod
+    async def get_tag_terms(self) -> Iterable[Any]:
+        """Abstract method getting tag names with their number of comics
+
+        Returns:
+            Iterable[Any]: The tag names and comic counts
+        """
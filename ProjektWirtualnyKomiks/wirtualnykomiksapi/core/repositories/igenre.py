@@ -17,6 +17,18 @@ class IGenreRepository(ABC):
             Iterably[Any]: All the genres
         """
 
+    @abstractmethod
+    async def get_all_genres_json(self) -> bytes:
+        """Abstract method getting all genres serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the genres
+        """
+
+    @abstractmethod
+    async def load_dictionary(self) -> None:
+        """Abstract method loading the in-memory genre dictionary"""
+
     @abstractmethod
     async def get_genre_by_id(self, genre_id: int) -> Any | None:
         """Abstract method getting genre by id
@@ -39,6 +51,17 @@ class IGenreRepository(ABC):
             Any | None: The genre
         """
 
+    @abstractmethod
+    async def resolve_genres(self, names: Iterable[str]) -> Iterable[Any]:
+        """Abstract method getting ids of genres by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The genre names
+
+        Returns:
+            Iterable[Any]: The genres in the order of the first occurrence of their names
+        """
+
     @abstractmethod
     async def update_genre(self, genre_id: int, data: GenreIn) -> Any | None:
         """Abstract method updating existing genre
@@ -0,0 +1,19 @@
+"""Model containing catalog statistics repository abstractions"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Tuple
+
+
+class IStatsRepository(ABC):
+    """An abstract class representing protocol of statistics repository"""
+
+    @abstractmethod
+    async def get_catalog_columns(self) -> Tuple[Iterable[Any], ...]:
+        """Abstract method getting all columns used by the statistics
+
+        Returns:
+            Tuple[Iterable[Any], ...]: The comic ids, authors, views and likes
+                ordered by id, the comic ids and ratings of all reviews,
+                the genre ids and names ordered by id and the comic ids and
+                genre ids of all associations, read from one snapshot
+        """
@@ -17,6 +17,18 @@ class ITagRepository(ABC):
             Iterable[Any]: All the tags
         """
 
+    @abstractmethod
+    async def get_all_tags_json(self) -> bytes:
+        """Abstract method getting all tags serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the tags
+        """
+
+    @abstractmethod
+    async def load_dictionary(self) -> None:
+        """Abstract method loading the in-memory tag dictionary"""
+
     @abstractmethod
     async def get_tag_by_id(self, tag_id: int) -> Any | None:
         """Abstract method getting tag by id
@@ -39,6 +51,17 @@ class ITagRepository(ABC):
             Any | None: The tag
         """
 
+    @abstractmethod
+    async def resolve_tags(self, names: Iterable[str]) -> Iterable[Any]:
+        """Abstract method getting ids of tags by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The tag names
+
+        Returns:
+            Iterable[Any]: The tags in the order of the first occurrence of their names
+        """
+
     @abstractmethod
     async def update_tag(self, tag_id: int, data: TagIn) -> Any | None:
         """Abstract method updating existing tag
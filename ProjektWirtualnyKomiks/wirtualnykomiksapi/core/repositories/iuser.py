@@ -1,6 +1,7 @@
 """A repository for user entity"""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Any
 
 from pydantic import UUID4
@@ -41,4 +42,34 @@ class IUserRepository(ABC):
 
         Returns:
             Any | None: The user object if exists
+        """
+
+    @abstractmethod
+    async def add_refresh_token(
+        self,
+        user_id: UUID4,
+        token_hash: str,
+        expires_at: datetime,
+    ) -> None:
+        """The method storing refresh token digest of the user
+
+        Expired tokens of the user are purged at the same time.
+
+        Args:
+            user_id (UUID4): UUID of the user
+            token_hash (str): The digest of the refresh token
+            expires_at (datetime): The expiration date of the token
+        """
+
+    @abstractmethod
+    async def consume_refresh_token(self, token_hash: str) -> Any | None:
+        """The method removing unexpired refresh token and getting its owner
+
+        A token can be consumed only once, even by concurrent requests.
+
+        Args:
+            token_hash (str): The digest of the refresh token
+
+        Returns:
+            Any | None: The user UUID if the token existed and was valid
         """
\ No newline at end of file
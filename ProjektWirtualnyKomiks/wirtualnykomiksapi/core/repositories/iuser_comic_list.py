@@ -5,21 +5,43 @@ from typing import Any, Iterable, List, Optional
 
 from pydantic import UUID4
 
-from wirtualnykomiksapi.core.domain.user_comic_list import UserComicListIn
+from wirtualnykomiksapi.core.domain.user_comic_list import UserComicListIn, UserComicListSort, UserComicListStatus
 
 
 class IUserComicListRepository(ABC):
     """An abstract class representing protocol of user's comic list repository"""
 
     @abstractmethod
-    async def get_user_list(self, user_id: str) -> Iterable[Any]:
-        """Abstract method getting user's comic list
+    async def get_user_list(
+            self,
+            user_id: str,
+            status: Optional[UserComicListStatus],
+            sort_by: UserComicListSort,
+            limit: int,
+            cursor: Optional[str],
+    ) -> Any:
+        """Abstract method getting a page of user's comic list
 
         Args:
             user_id (str): The id of the user
+            status (Optional[UserComicListStatus]): The status to filter by
+            sort_by (UserComicListSort): The order of the entries
+            limit (int): The maximal number of entries on the page
+            cursor (Optional[str]): The cursor returned with the previous page
 
         Returns:
-            Iterable[Any]: The collection of comics in users list
+            Any: The entries and the cursor of the next page
+        """
+
+    @abstractmethod
+    async def get_whole_user_list(self, user_id: str) -> Iterable[Any]:
+        """Abstract method getting all entries of user's comic list
+
+        Args:
+            user_id (str): The id of the user
+
+        Returns:
+            Iterable[Any]: The entries ordered by comic title
         """
 
     @abstractmethod
@@ -47,6 +69,18 @@ class IUserComicListRepository(ABC):
             Optional[Any]: The updated status of the comic
         """
 
+    @abstractmethod
+    async def update_statuses(self, user_id: str, entries: Iterable[UserComicListIn]) -> Iterable[Any]:
+        """Abstract method updating statuses of many comics in the user's list
+
+        Args:
+            user_id (str): The id of the user
+            entries (Iterable[UserComicListIn]): The comic ids with their new statuses
+
+        Returns:
+            Iterable[Any]: The entries whose status has changed
+        """
+
     @abstractmethod
     async def delete_comic(self, user_id: str, comic_id: int) -> bool:
         """Abstract method deleting comic from user's list
@@ -57,4 +91,24 @@ class IUserComicListRepository(ABC):
 
         Returns:
             bool: Success of the operation
-        """
\ No newline at end of file
+        """
+
+    @abstractmethod
+    async def get_summary(self, user_id: str) -> Any:
+        """Abstract method getting number of comics per status in user's list
+
+        Args:
+            user_id (str): The id of the user
+
+        Returns:
+            Any: The counts of comics by status
+        """
+
+    @abstractmethod
+    async def rebuild_counters(self, user_id: Optional[str] = None) -> None:
+        """Abstract method recomputing status counters from the list entries
+
+        Args:
+            user_id (Optional[str]): The user whose counters are rebuilt,
+                all users if not given
+        """
@@ -1,10 +1,13 @@
 """A module providing database access"""
 
 import asyncio
+import hashlib
+import random
 
-import databases
 import sqlalchemy
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.exc import OperationalError, DatabaseError
 from sqlalchemy.ext.asyncio import create_async_engine
 from asyncpg.exceptions import (    # type: ignore
@@ -13,6 +16,8 @@ from asyncpg.exceptions import (    # type: ignore
 )
 
 from wirtualnykomiksapi.config import config
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import InstrumentedDatabase
+from wirtualnykomiksapi.infrastructure.utils.replicas import ReplicaSet, RoutedDatabase
 
 metadata = sqlalchemy.MetaData()
 
@@ -93,8 +98,104 @@ user_comic_list_table = sqlalchemy.Table(
     sqlalchemy.Column("user_id", UUID(as_uuid=True), sqlalchemy.ForeignKey("users.id"), nullable=False),
     sqlalchemy.Column("comic_id", sqlalchemy.Integer, sqlalchemy.ForeignKey("comics.id"), nullable=False),
     sqlalchemy.Column("status", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column(
+        "added_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+    # Also serves as the (user_id, comic_id) index for per-user range scans
+    sqlalchemy.UniqueConstraint("user_id", "comic_id", name="uq_user_comic_list_user_comic"),
+    # Keyset pagination of a user's list by added time and by status
+    sqlalchemy.Index("ix_user_comic_list_user_added", "user_id", "added_at", "id"),
+    sqlalchemy.Index("ix_user_comic_list_user_status", "user_id", "status", "added_at", "id"),
+)
+
+# Number of entries per status in users personal comic lists
+user_comic_list_counter_table = sqlalchemy.Table(
+    "user_comic_list_counters",
+    metadata,
+    sqlalchemy.Column("user_id", UUID(as_uuid=True), sqlalchemy.ForeignKey("users.id"), primary_key=True),
+    sqlalchemy.Column("status", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("count", sqlalchemy.Integer, nullable=False, default=0),
+)
+
+# Refresh tokens (stored as SHA-256 digests of the opaque tokens)
+refresh_token_table = sqlalchemy.Table(
+    "refresh_tokens",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("user_id", UUID(as_uuid=True), sqlalchemy.ForeignKey("users.id"), nullable=False),
+    sqlalchemy.Column("token_hash", sqlalchemy.String(64), nullable=False, unique=True),
+    sqlalchemy.Column("expires_at", sqlalchemy.DateTime(timezone=True), nullable=False),
+    # Purging expired tokens of a user
+    sqlalchemy.Index("ix_refresh_tokens_user_expires_at", "user_id", "expires_at"),
+)
+
+# Hash of the schema the database was last migrated to
+schema_version_table = sqlalchemy.Table(
+    "schema_version",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("schema_hash", sqlalchemy.String(64), nullable=False),
 )
 
+# Key of the advisory lock serializing schema changes of concurrently starting workers
+SCHEMA_LOCK_KEY = 0x57_4B_4F_4D
+
+# `create_all` only creates missing tables, so changes to existing ones are
+# applied by these idempotent steps, run in order after it
+MIGRATIONS = [
+    # user_comic_list: one entry per (user_id, comic_id)
+    """
+    DELETE FROM user_comic_list AS duplicate
+    USING user_comic_list AS kept
+    WHERE duplicate.user_id = kept.user_id
+        AND duplicate.comic_id = kept.comic_id
+        AND duplicate.id > kept.id
+    """,
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'uq_user_comic_list_user_comic'
+        ) THEN
+            ALTER TABLE user_comic_list
+                ADD CONSTRAINT uq_user_comic_list_user_comic UNIQUE (user_id, comic_id);
+        END IF;
+    END
+    $$
+    """,
+    # user_comic_list: time of adding and the keyset pagination indexes
+    """
+    ALTER TABLE user_comic_list
+        ADD COLUMN IF NOT EXISTS added_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_user_comic_list_user_added
+        ON user_comic_list (user_id, added_at, id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_user_comic_list_user_status
+        ON user_comic_list (user_id, status, added_at, id)
+    """,
+    # user_comic_list_counters: counts of the entries which existed before the
+    # table; entries added since then always come with their counter rows
+    """
+    INSERT INTO user_comic_list_counters (user_id, status, count)
+    SELECT user_id, status, count(*)
+    FROM user_comic_list
+    GROUP BY user_id, status
+    ON CONFLICT (user_id, status) DO NOTHING
+    """,
+    # refresh_tokens: index for purging expired tokens of a user
+    """
+    CREATE INDEX IF NOT EXISTS ix_refresh_tokens_user_expires_at
+        ON refresh_tokens (user_id, expires_at)
+    """,
+    "DROP INDEX IF EXISTS ix_refresh_tokens_expires_at",
+]
+
 
 db_uri = (
     f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
@@ -103,36 +204,116 @@ db_uri = (
 
 engine = create_async_engine(
     db_uri,
-    echo=True,
+    echo=False,
     future=True,
     pool_pre_ping=True,
 )
 
-database = databases.Database(
+pool_options = dict(
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    max_inactive_connection_lifetime=config.DB_POOL_MAX_INACTIVE_LIFETIME,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+)
+
+# Read replicas share credentials and database name with the primary
+replica_uris = [
+    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}@{host.strip()}/{config.DB_NAME}"
+    for host in config.DB_REPLICA_HOSTS.split(",")
+    if host.strip()
+]
+
+database = RoutedDatabase(
     db_uri,
-    force_rollback=True,
+    replicas=ReplicaSet(
+        [InstrumentedDatabase(uri, **pool_options) for uri in replica_uris],
+        check_timeout=config.DB_REPLICA_CHECK_SECONDS,
+    ),
+    **pool_options,
 )
 
-async def init_db(retries: int = 5, delay: int = 5) -> None:
+def schema_hash() -> str:
+    """Function computing the hash of the DDL of all tables and indexes.
+
+    The migrations are hashed as well, so adding or changing one also
+    makes the workers apply the schema again.
+
+    Returns:
+        str: The SHA-256 hex digest of the schema
+    """
+    dialect = postgresql.dialect()
+    statements = []
+    for table in metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+        statements.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in sorted(table.indexes, key=lambda index: index.name)
+        )
+    statements.extend(MIGRATIONS)
+
+    return hashlib.sha256("\n".join(statements).encode()).hexdigest()
+
+
+async def init_db(
+    retries: int = config.DB_CONNECT_RETRIES,
+    base_delay: float = config.DB_CONNECT_BACKOFF_BASE,
+    max_delay: float = config.DB_CONNECT_BACKOFF_MAX,
+) -> None:
     """Function initializing the DB.
 
+    The schema is applied under an advisory lock, so of the workers starting
+    together one runs the DDL and the others wait for it and then find the
+    schema version already up to date. The schema hash is recorded in the
+    same transaction, after the missing tables are created and the
+    migrations have run.
+
     Args:
         retries (int, optional): Number of retries of connect to DB.
-            Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+            Defaults to DB_CONNECT_RETRIES.
+        base_delay (float, optional): Delay before the first retry, doubled
+            on every next one. Defaults to DB_CONNECT_BACKOFF_BASE.
+        max_delay (float, optional): The maximal delay between retries.
+            Defaults to DB_CONNECT_BACKOFF_MAX.
     """
+    current_hash = schema_hash()
+
     for attempt in range(retries):
         try:
             async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
+                await conn.execute(
+                    sqlalchemy.select(sqlalchemy.func.pg_advisory_xact_lock(SCHEMA_LOCK_KEY))
+                )
+                applied_hash = None
+                if await conn.scalar(sqlalchemy.select(sqlalchemy.func.to_regclass("schema_version"))):
+                    applied_hash = await conn.scalar(
+                        sqlalchemy.select(schema_version_table.c.schema_hash)
+                    )
+
+                if applied_hash != current_hash:
+                    await conn.run_sync(metadata.create_all)
+                    for migration in MIGRATIONS:
+                        await conn.execute(sqlalchemy.text(migration))
+                    query = insert(schema_version_table).values(id=1, schema_hash=current_hash)
+                    await conn.execute(
+                        query.on_conflict_do_update(
+                            index_elements=[schema_version_table.c.id],
+                            set_={"schema_hash": current_hash},
+                        )
+                    )
+            # The engine only runs the DDL, its connections would count
+            # against max_connections next to the request pool
+            await engine.dispose()
             return
         except (
             OperationalError,
             DatabaseError,
             CannotConnectNowError,
             ConnectionDoesNotExistError,
+            OSError,
         ) as e:
             print(f"Attempt {attempt + 1} failed: {e}")
-            await asyncio.sleep(delay)
+            if attempt + 1 < retries:
+                # Full jitter keeps restarting workers from retrying in lockstep
+                await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
 
     raise ConnectionError("Could not connect to DB after several retries.")
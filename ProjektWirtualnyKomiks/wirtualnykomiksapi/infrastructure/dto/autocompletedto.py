@@ -0,0 +1,25 @@
+"""A module containing DTO models for search autocompletion"""
+
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AutocompleteKind(str, Enum):
+    """Kind of autocompleted catalog term"""
+    TITLE = "title"
+    AUTHOR = "author"
+    GENRE = "genre"
+    TAG = "tag"
+
+
+class SuggestionDTO(BaseModel):
+    """A model representing DTO for an autocompletion suggestion"""
+    kind: AutocompleteKind
+    value: str
+    popularity: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
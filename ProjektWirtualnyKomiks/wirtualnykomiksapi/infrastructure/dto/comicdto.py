@@ -23,4 +23,38 @@ class ComicDTO(BaseModel):
         from_attributes=True,
         extra="ignore",
         arbitrary_types_allowed=True,
+    )
+
+
+class FacetCountDTO(BaseModel):
+    """A model representing DTO for number of filtered comics with a genre or tag"""
+    id: int
+    name: str
+    count: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class ComicFacetsDTO(BaseModel):
+    """A model representing DTO for genre and tag counts of filtered comics"""
+    genres: List[FacetCountDTO] = []
+    tags: List[FacetCountDTO] = []
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class FacetedComicsDTO(BaseModel):
+    """A model representing DTO for filtered comics with their facet counts"""
+    comics: List[ComicDTO]
+    facets: ComicFacetsDTO
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
     )
\ No newline at end of file
@@ -0,0 +1,16 @@
+"""A module containing DTO models for health probes"""
+
+from typing import Dict
+
+from pydantic import BaseModel, ConfigDict
+
+
+class HealthDTO(BaseModel):
+    """A model representing DTO for the result of a health probe"""
+    status: str
+    checks: Dict[str, bool] = {}
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
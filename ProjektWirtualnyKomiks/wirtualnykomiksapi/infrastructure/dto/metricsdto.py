@@ -0,0 +1,106 @@
+"""A module containing DTO models for internal metrics"""
+
+from typing import Dict
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PasswordPoolMetricsDTO(BaseModel):
+    """A model representing DTO for password hashing pool metrics"""
+    executor: str
+    max_workers: int
+    in_flight: int
+    queued: int
+    peak_queued: int
+    completed: int
+    average_wait_ms: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class PoolMetricsDTO(BaseModel):
+    """A model representing DTO for database connection pool metrics"""
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    idle: int
+    waiting: int
+    peak_waiting: int
+    acquired: int
+    timeouts: int
+    acquire_p50_ms: float
+    acquire_p95_ms: float
+    acquire_p99_ms: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class QueryMetricsDTO(BaseModel):
+    """A model representing DTO for latency statistics of a SQL statement"""
+    fingerprint: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    buckets: Dict[str, int]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class ReplicaMetricsDTO(BaseModel):
+    """A model representing DTO for the state of a read replica"""
+    host: str
+    healthy: bool
+    reads: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class TokenCacheMetricsDTO(BaseModel):
+    """A model representing DTO for verified token cache metrics"""
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class TokenBucketMetricsDTO(BaseModel):
+    """A model representing DTO for token bucket limiter metrics"""
+    keys: int
+    max_keys: int
+    allowed: int
+    rejected: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class LoginThrottleMetricsDTO(BaseModel):
+    """A model representing DTO for login throttling metrics"""
+    ip: TokenBucketMetricsDTO
+    email: TokenBucketMetricsDTO
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
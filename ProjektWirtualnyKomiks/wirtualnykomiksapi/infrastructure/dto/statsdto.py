@@ -0,0 +1,68 @@
+"""A module containing DTO models for catalog statistics"""
+
+from enum import Enum
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class AuthorRankingCriterion(str, Enum):
+    """Criterion used to rank authors in the leaderboard"""
+    VIEWS = "views"
+    LIKES = "likes"
+    COMICS = "comics"
+    RATING = "rating"
+
+
+class RatingDistributionDTO(BaseModel):
+    """A model representing DTO for rating distribution"""
+    total_reviews: int
+    mean_rating: float
+    median_rating: float
+    counts: Dict[int, int]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class GenreRatingDTO(BaseModel):
+    """A model representing DTO for per-genre rating aggregates"""
+    genre_id: int
+    name: str
+    reviews: int
+    mean_rating: float
+    median_rating: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class CorrelationDTO(BaseModel):
+    """A model representing DTO for comic metric correlations"""
+    comics: int
+    views_likes: Optional[float] = None
+    views_rating: Optional[float] = None
+    likes_rating: Optional[float] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class AuthorStatsDTO(BaseModel):
+    """A model representing DTO for author leaderboard entry"""
+    author: str
+    comics: int
+    views: int
+    likes: int
+    average_rating: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
@@ -2,6 +2,8 @@
 
 
 from datetime import datetime
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -10,6 +12,8 @@ class TokenDTO(BaseModel):
     token_type: str
     user_token: str
     expires: datetime
+    refresh_token: Optional[str] = None
+    refresh_expires: Optional[datetime] = None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -1,5 +1,8 @@
 """A module containing DTO models for user's comic list"""
 
+from datetime import datetime
+from typing import List, Optional
+
 from pydantic import BaseModel, ConfigDict, UUID4  # type: ignore
 from enum import Enum
 
@@ -21,4 +24,43 @@ class UserComicListDTO(BaseModel):
         from_attributes=True,
         extra="ignore",
         arbitrary_types_allowed=True,
+    )
+
+
+class UserComicListEntryDTO(BaseModel):
+    """A model representing DTO for an entry of user's comic list view"""
+    id: int
+    comic_id: int
+    status: UserComicListStatus
+    added_at: datetime
+    title: str
+    author: Optional[str]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class UserComicListPageDTO(BaseModel):
+    """A model representing DTO for a page of user's comic list"""
+    items: List[UserComicListEntryDTO]
+    next_cursor: Optional[str] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class UserComicListSummaryDTO(BaseModel):
+    """A model representing DTO for number of comics per status in user's list"""
+    planning: int = 0
+    reading: int = 0
+    completed: int = 0
+    dropped: int = 0
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
     )
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Module containing autocompletion repository implementation."""
+
+from typing import Any, Iterable
+
+from sqlalchemy import func, select
+
+from wirtualnykomiksapi.core.repositories.iautocomplete import IAutocompleteRepository
+
+from wirtualnykomiksapi.db import (
+    database,
+    comic_table,
+    genre_table,
+    tag_table,
+    comic_genre_table,
+    comic_tag_table,
+)
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_read
+
+
+class AutocompleteRepository(IAutocompleteRepository):
+    """A class representing autocompletion DB repository"""
+
+    @replica_read
+    async def get_comic_terms(self) -> Iterable[Any]:
+        """The method getting comic titles and authors with their views
+
+        Returns:
+            Iterable[Any]: The comic titles, authors and views
+        """
+
+        query = select(
+            comic_table.c.title,
+            comic_table.c.author,
+            comic_table.c.views,
+        )
+        return await database.fetch_all(query)
+
+    @replica_read
+    async def get_genre_terms(self) -> Iterable[Any]:
+        """The method getting genre names with their number of comics
+
+        Returns:
+            Iterable[Any]: The genre names and comic counts
+        """
+
+        query = (
+            select(
+                genre_table.c.name,
+                func.count(comic_genre_table.c.comic_id).label("count"),
+            )
+            .select_from(genre_table.outerjoin(comic_genre_table))
+            .group_by(genre_table.c.id)
+        )
+        return await database.fetch_all(query)
+
+    @replica_read
+    async def get_tag_terms(self) -> Iterable[Any]:
+        """The method getting tag names with their number of comics
+
+        Returns:
+            Iterable[Any]: The tag names and comic counts
+        """
+
+        query = (
+            select(
+                tag_table.c.name,
+                func.count(comic_tag_table.c.comic_id).label("count"),
+            )
+            .select_from(tag_table.outerjoin(comic_tag_table))
+            .group_by(tag_table.c.id)
+        )
+        return await database.fetch_all(query)
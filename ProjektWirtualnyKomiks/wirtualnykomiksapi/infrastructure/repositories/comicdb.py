@@ -1,10 +1,11 @@
 """Module containing comic repository implementation."""
 
-from typing import Any, Iterable, Optional, List
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, List, Set
 
 import sqlalchemy
 from asyncpg import Record # type: ignore
-from sqlalchemy import select, func, insert
+from sqlalchemy import any_, bindparam, select, func, insert
 
 from wirtualnykomiksapi.core.repositories.icomic import IComicRepository
 from wirtualnykomiksapi.core.domain.comic import Comic, ComicBroker
@@ -12,6 +13,15 @@ from wirtualnykomiksapi.core.domain.genre import Genre
 from wirtualnykomiksapi.core.domain.tag import Tag
 from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO
 from wirtualnykomiksapi.infrastructure.dto.comic_comparison_dto import ComicComparisonDTO
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import after_commit
+from wirtualnykomiksapi.infrastructure.utils.dictionary import (
+    NameDictionary,
+    genre_dictionary,
+    tag_dictionary,
+)
+from wirtualnykomiksapi.infrastructure.utils.compiled_query import CompiledQuery
+from wirtualnykomiksapi.infrastructure.utils.mapping import validate_all
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import autocomplete_stale
 
 from wirtualnykomiksapi.db import (
     database,
@@ -22,10 +32,61 @@ from wirtualnykomiksapi.db import (
     comic_genre_table,
     comic_tag_table,
 )
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_read
+
+_average_rating = func.coalesce(func.avg(review_table.c.rating), 0.0).label("average_rating")
+_comic_columns = (
+    comic_table.c.id,
+    comic_table.c.title,
+    comic_table.c.author,
+    comic_table.c.description,
+    comic_table.c.likes,
+    comic_table.c.views,
+    comic_table.c.user_id,
+    _average_rating,
+)
+
+# Hot read statements, compiled once and executed with bound values only
+_ALL_COMICS = CompiledQuery(
+    select(*_comic_columns)
+    .select_from(comic_table.outerjoin(review_table))
+    .order_by(comic_table.c.id)
+    .group_by(comic_table.c.id)
+)
+_COMIC_BY_ID = CompiledQuery(
+    select(*_comic_columns)
+    .select_from(comic_table.outerjoin(review_table))
+    .where(comic_table.c.id == bindparam("comic_id"))
+    .group_by(comic_table.c.id)
+)
+_TOP_RATED_COMICS = CompiledQuery(
+    select(*_comic_columns)
+    .select_from(comic_table.outerjoin(review_table))
+    .group_by(comic_table.c.id)
+    .order_by(sqlalchemy.desc(_average_rating))
+    .limit(bindparam("limit"))
+)
+_MOST_POPULAR_COMICS = CompiledQuery(
+    select(*_comic_columns)
+    .select_from(comic_table.outerjoin(review_table))
+    .group_by(comic_table.c.id)
+    .order_by(sqlalchemy.desc(comic_table.c.views))
+    .limit(bindparam("limit"))
+)
+_COMIC_GENRE_IDS = CompiledQuery(
+    select(comic_genre_table.c.comic_id, comic_genre_table.c.genre_id)
+    .where(comic_genre_table.c.comic_id == any_(bindparam("comic_ids")))
+)
+_COMIC_TAG_IDS = CompiledQuery(
+    select(comic_tag_table.c.comic_id, comic_tag_table.c.tag_id)
+    .where(comic_tag_table.c.comic_id == any_(bindparam("comic_ids")))
+)
+
 
 class ComicRepository(IComicRepository):
     """A class representing comic DB repository"""
 
+    @replica_read
     async def get_all_comics(self) -> Iterable[Any]:
         """The method getting all comics from the data storage.
 
@@ -33,20 +94,10 @@ class ComicRepository(IComicRepository):
                 Iterable[Any]: Comics in the data storage.
         """
 
-        avg_rating = func.coalesce(func.avg(review_table.c.rating), 0.0).label("average_rating")
-
-        query = (
-            select(
-                comic_table,
-                avg_rating
-            )
-            .select_from(comic_table.outerjoin(review_table))
-            .order_by(comic_table.c.id)
-            .group_by(comic_table.c.id)
-        )
-        comics = await database.fetch_all(query)
+        comics = await self._fetch_all(_ALL_COMICS)
         return await self._connect_relations(comics)
 
+    @replica_read
     async def get_comic_by_id(self, comic_id: int) -> Any | None:
         """The method getting comic by provided id
 
@@ -57,18 +108,7 @@ class ComicRepository(IComicRepository):
             Any | None: The comic details
         """
 
-        avg_rating = func.coalesce(func.avg(review_table.c.rating), 0.0).label("average_rating")
-
-        query = (
-            select(
-                comic_table,
-                avg_rating
-            )
-            .select_from(comic_table.outerjoin(review_table))
-            .where(comic_table.c.id == comic_id)
-            .group_by(comic_table.c.id)
-        )
-        comic = await database.fetch_one(query)
+        comic = await self._fetch_one(_COMIC_BY_ID, comic_id=comic_id)
 
         if comic:
             result = await self._connect_relations([comic])
@@ -76,6 +116,7 @@ class ComicRepository(IComicRepository):
 
         return None
 
+    @replica_read
     async def get_filtered_comics(self, genres: Optional[str], tags: Optional[str]) -> Iterable[Any]:
         """The method getting filtered collection of comics
 
@@ -115,6 +156,7 @@ class ComicRepository(IComicRepository):
         return await self._connect_relations(comics)
 
 
+    @replica_read
     async def get_top_rated_comics(self, limit: int) -> Iterable[Any]:
         """The method getting comics with the highest average rating
 
@@ -125,28 +167,10 @@ class ComicRepository(IComicRepository):
             Iterable[Any]: The collection of highest average rated comics
         """
 
-        avg_rating = func.coalesce(func.avg(review_table.c.rating), 0.0).label("average_rating")
-
-        query = (
-            select(
-                comic_table.c.id,
-                comic_table.c.title,
-                comic_table.c.author,
-                comic_table.c.description,
-                comic_table.c.likes,
-                comic_table.c.views,
-                comic_table.c.user_id,
-                avg_rating
-            )
-
-            .select_from(comic_table.outerjoin(review_table))
-            .group_by(comic_table.c.id)
-            .order_by(sqlalchemy.desc(avg_rating))
-            .limit(limit)
-        )
-        comics = await database.fetch_all(query)
+        comics = await self._fetch_all(_TOP_RATED_COMICS, limit=limit)
         return await self._connect_relations(comics)
 
+    @replica_read
     async def get_most_popular_comics(self, limit: int) -> Iterable[Any]:
         """The method getting comics with the most views
 
@@ -157,28 +181,10 @@ class ComicRepository(IComicRepository):
             Iterable[Any]: The collection of most viewed comics
         """
 
-        avg_rating = func.coalesce(func.avg(review_table.c.rating), 0.0).label("average_rating")
-
-        query = (
-            select(
-                comic_table.c.id,
-                comic_table.c.title,
-                comic_table.c.author,
-                comic_table.c.description,
-                comic_table.c.likes,
-                comic_table.c.views,
-                comic_table.c.user_id,
-                avg_rating
-            )
-
-            .select_from(comic_table.outerjoin(review_table))
-            .group_by(comic_table.c.id)
-            .order_by(sqlalchemy.desc(comic_table.c.views))
-            .limit(limit)
-        )
-        comics = await database.fetch_all(query)
+        comics = await self._fetch_all(_MOST_POPULAR_COMICS, limit=limit)
         return await self._connect_relations(comics)
 
+    @replica_read
     async def compare_comics(self, comic_id1: int, comic_id2: int) -> Any | None:
         """The method comparing comics
 
@@ -247,6 +253,7 @@ class ComicRepository(IComicRepository):
                 )
             )
 
+        after_commit(autocomplete_stale.mark)
         return await self.get_comic_by_id(comic_id)
 
     async def update_comic(self, comic_id: int, data: ComicBroker) -> Any | None:
@@ -294,6 +301,7 @@ class ComicRepository(IComicRepository):
                     )
                 )
 
+            after_commit(autocomplete_stale.mark)
             return await self.get_comic_by_id(comic_id)
 
         return None
@@ -325,6 +333,7 @@ class ComicRepository(IComicRepository):
                 .where(comic_table.c.id == comic_id)
 
             await database.execute(query)
+            after_commit(autocomplete_stale.mark)
             return True
         return False
 
@@ -346,6 +355,32 @@ class ComicRepository(IComicRepository):
         return await database.fetch_one(query)
 
 
+    async def _fetch_all(self, query: CompiledQuery, **values: Any) -> List[Any]:
+        """A private method fetching all rows of a pre-compiled read
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            List[Any]: The asyncpg records
+        """
+
+        return await query.fetch_all(**values)
+
+    async def _fetch_one(self, query: CompiledQuery, **values: Any) -> Optional[Any]:
+        """A private method fetching the first row of a pre-compiled read
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            Optional[Any]: The asyncpg record
+        """
+
+        return await query.fetch_one(**values)
+
     async def _connect_relations(self, comics: List[Record]) -> List[ComicDTO]:
         """A private method for comic and genre/tag relations
 
@@ -360,31 +395,65 @@ class ComicRepository(IComicRepository):
 
         comic_ids = [comic['id'] for comic in comics]
 
-        genres_query = (
-            select(genre_table, comic_genre_table.c.comic_id)
-            .join(comic_genre_table)
-            .where(comic_genre_table.c.comic_id.in_(comic_ids))
+        genres_rows = await self._fetch_all(_COMIC_GENRE_IDS, comic_ids=comic_ids)
+        genre_names = await self._get_names(
+            genre_dictionary,
+            genre_table,
+            {row['genre_id'] for row in genres_rows},
         )
-        genres_rows = await database.fetch_all(genres_query)
+        # One model per genre, shared by all comics having it
+        genres = {genre_id: Genre(id=genre_id, name=name) for genre_id, name in genre_names.items()}
         genres_map = {}
         for row in genres_rows:
-            genres_map.setdefault(row['comic_id'], []).append(Genre(**dict(row)))
-
-        tags_query = (
-            select(tag_table, comic_tag_table.c.comic_id)
-            .join(comic_tag_table)
-            .where(comic_tag_table.c.comic_id.in_(comic_ids))
+            if (genre := genres.get(row['genre_id'])) is not None:
+                genres_map.setdefault(row['comic_id'], []).append(genre)
+
+        tags_rows = await self._fetch_all(_COMIC_TAG_IDS, comic_ids=comic_ids)
+        tag_names = await self._get_names(
+            tag_dictionary,
+            tag_table,
+            {row['tag_id'] for row in tags_rows},
         )
-        tags_rows = await database.fetch_all(tags_query)
+        tags = {tag_id: Tag(id=tag_id, name=name) for tag_id, name in tag_names.items()}
         tags_map = {}
         for row in tags_rows:
-            tags_map.setdefault(row['comic_id'], []).append(Tag(**dict(row)))
+            if (tag := tags.get(row['tag_id'])) is not None:
+                tags_map.setdefault(row['comic_id'], []).append(tag)
+
+        return validate_all(
+            ComicDTO,
+            [
+                dict(
+                    comic,
+                    genres=genres_map.get(comic['id'], []),
+                    tags=tags_map.get(comic['id'], []),
+                )
+                for comic in comics
+            ],
+        )
+
+    async def _get_names(self, dictionary: NameDictionary, table: sqlalchemy.Table, ids: Set[int]) -> Dict[int, str]:
+        """A private method mapping genre or tag ids to their names
+
+        Names are read from the in-memory dictionary; ids it does not know
+        yet (e.g. written by another process) are fetched and added to it.
+
+        Args:
+            dictionary (NameDictionary): The in-memory dictionary
+            table (sqlalchemy.Table): The dictionary table
+            ids (Set[int]): The ids to map
+
+        Returns:
+            Dict[int, str]: The names by id
+        """
+
+        names = dictionary.snapshot.names
+        found = {entry_id: names[entry_id] for entry_id in ids if entry_id in names}
 
-        result = []
-        for comic in comics:
-            c_dict = dict(comic)
-            c_dict['genres'] = genres_map.get(comic['id'], [])
-            c_dict['tags'] = tags_map.get(comic['id'], [])
-            result.append(ComicDTO(**c_dict))
+        if missing := ids - found.keys():
+            query = select(table.c.id, table.c.name).where(table.c.id.in_(missing))
+            rows = [(row['id'], row['name']) for row in await database.fetch_all(query)]
+            found.update(rows)
+            after_commit(partial(dictionary.update, rows))
 
-        return result
\ No newline at end of file
+        return found
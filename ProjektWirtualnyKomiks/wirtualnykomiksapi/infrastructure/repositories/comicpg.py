@@ -0,0 +1,41 @@
+"""Module containing comic repository reading through the asyncpg pool."""
+
+from typing import Any, List, Optional
+
+from wirtualnykomiksapi.infrastructure.repositories.comicdb import ComicRepository
+from wirtualnykomiksapi.infrastructure.utils.compiled_query import CompiledQuery
+from wirtualnykomiksapi.infrastructure.utils.pg import asyncpg_pool
+
+
+class AsyncpgComicRepository(ComicRepository):
+    """A class representing comic repository of the asyncpg backend.
+
+    The pre-compiled reads run on the asyncpg pool; writes and the
+    remaining reads are inherited.
+    """
+
+    async def _fetch_all(self, query: CompiledQuery, **values: Any) -> List[Any]:
+        """A private method fetching all rows of a pre-compiled read
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            List[Any]: The asyncpg records
+        """
+
+        return await asyncpg_pool.fetch_all(query, **values)
+
+    async def _fetch_one(self, query: CompiledQuery, **values: Any) -> Optional[Any]:
+        """A private method fetching the first row of a pre-compiled read
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            Optional[Any]: The asyncpg record
+        """
+
+        return await asyncpg_pool.fetch_one(query, **values)
@@ -1,9 +1,9 @@
 """Module containing genre repository implementation."""
 
+from functools import partial
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select
 
 from wirtualnykomiksapi.core.domain.genre import Genre, GenreIn
 from wirtualnykomiksapi.core.repositories.igenre import IGenreRepository
@@ -14,27 +14,48 @@ from wirtualnykomiksapi.db import (
 )
 
 from wirtualnykomiksapi.infrastructure.dto.genredto import GenreDTO
+from wirtualnykomiksapi.infrastructure.repositories.namedb import NameRepository
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import after_commit
+from wirtualnykomiksapi.infrastructure.utils.dictionary import genre_dictionary
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import autocomplete_stale
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_read
 
-class GenreRepository(IGenreRepository):
+class GenreRepository(NameRepository, IGenreRepository):
     """A class representing genre DB repository"""
 
+    _table = genre_table
+    _dictionary = genre_dictionary
+
+    @replica_read
     async def get_all_genres(self) -> Iterable[Any]:
-        """The method getting all genres from the repository
+        """The method getting all genres from the in-memory dictionary
 
         Returns:
             Iterable[Any]: All genres
         """
-        query = (
-            select(
-                genre_table.c.id,
-                genre_table.c.name,
-            )
-            .order_by(genre_table.c.id)
-        )
-        genres = await database.fetch_all(query)
 
-        return [GenreDTO(**dict(genre)) for genre in genres]
+        if not genre_dictionary.loaded:
+            await self.load_dictionary()
+
+        return [
+            GenreDTO(id=genre_id, name=name)
+            for genre_id, name in genre_dictionary.snapshot.names.items()
+        ]
+
+    @replica_read
+    async def get_all_genres_json(self) -> bytes:
+        """The method getting all genres serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the genres
+        """
+
+        if not genre_dictionary.loaded:
+            await self.load_dictionary()
 
+        return genre_dictionary.snapshot.payload
+
+    @replica_read
     async def get_genre_by_id(self, genre_id: int) -> Any | None:
         """The method getting genre by id
 
@@ -62,7 +83,27 @@ class GenreRepository(IGenreRepository):
         new_genre_id = await database.execute(query)
         new_genre = await self._get_by_id(new_genre_id)
 
-        return Genre(**dict(new_genre)) if new_genre else None
+        if not new_genre:
+            return None
+
+        after_commit(partial(genre_dictionary.set, new_genre["id"], new_genre["name"]))
+        after_commit(autocomplete_stale.mark)
+        return Genre(**dict(new_genre))
+
+    async def resolve_genres(self, names: Iterable[str]) -> Iterable[Any]:
+        """The method getting ids of genres by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The genre names
+
+        Returns:
+            Iterable[Any]: The genres in the order of the first occurrence of their names
+        """
+
+        return [
+            GenreDTO(id=genre_id, name=name)
+            for genre_id, name in await self._resolve_names(names)
+        ]
 
     async def update_genre(self, genre_id: int, data: GenreIn) -> Any | None:
         """The method updating existing genre
@@ -84,7 +125,13 @@ class GenreRepository(IGenreRepository):
             await database.execute(query)
 
             genre = await self._get_by_id(genre_id)
-            return Genre(**dict(genre)) if genre else None
+
+            if not genre:
+                return None
+
+            after_commit(partial(genre_dictionary.set, genre["id"], genre["name"]))
+            after_commit(autocomplete_stale.mark)
+            return Genre(**dict(genre))
 
         return None
 
@@ -104,6 +151,8 @@ class GenreRepository(IGenreRepository):
                 .where(genre_table.c.id == genre_id)
 
             await database.execute(query)
+            after_commit(partial(genre_dictionary.discard, genre_id))
+            after_commit(autocomplete_stale.mark)
             return True
 
         return False
@@ -0,0 +1,80 @@
+"""Module containing the base of repositories of dictionary tables."""
+
+from functools import partial
+from typing import Iterable, List, Tuple
+
+import sqlalchemy
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from wirtualnykomiksapi.db import database
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import after_commit
+from wirtualnykomiksapi.infrastructure.utils.dictionary import NameDictionary
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import autocomplete_stale
+
+
+class NameRepository:
+    """A base of repositories of tables of unique names kept in a dictionary"""
+
+    _table: sqlalchemy.Table
+    _dictionary: NameDictionary
+
+    async def load_dictionary(self) -> None:
+        """The method loading the in-memory dictionary of the table"""
+
+        query = (
+            select(
+                self._table.c.id,
+                self._table.c.name,
+            )
+            .order_by(self._table.c.id)
+        )
+        rows = await database.fetch_all(query)
+
+        self._dictionary.load((row["id"], row["name"]) for row in rows)
+
+    async def _resolve_names(self, names: Iterable[str]) -> List[Tuple[int, str]]:
+        """A private method getting ids of names, creating the missing ones
+
+        The missing names are inserted with a single statement; names which
+        already exist (or are inserted concurrently) are read afterwards. Rows
+        are inserted in sorted name order, so concurrent requests lock the
+        unique index entries in the same order and cannot deadlock.
+
+        Args:
+            names (Iterable[str]): The names
+
+        Returns:
+            List[Tuple[int, str]]: The ids with names in the order of the
+                first occurrence of the names
+        """
+
+        unique_names = list(dict.fromkeys(name.strip() for name in names if name.strip()))
+        if not unique_names:
+            return []
+
+        insert_query = (
+            insert(self._table)
+            .values([{"name": name} for name in sorted(unique_names)])
+            .on_conflict_do_nothing(index_elements=[self._table.c.name])
+            .returning(self._table.c.id, self._table.c.name)
+        )
+
+        async with database.transaction():
+            created = await database.fetch_all(insert_query)
+            ids = {row["name"]: row["id"] for row in created}
+
+            if missing := [name for name in unique_names if name not in ids]:
+                select_query = (
+                    select(self._table.c.id, self._table.c.name)
+                    .where(self._table.c.name.in_(missing))
+                )
+                existing = await database.fetch_all(select_query)
+                ids.update({row["name"]: row["id"] for row in existing})
+
+        if created:
+            rows = [(row["id"], row["name"]) for row in created]
+            after_commit(partial(self._dictionary.update, rows))
+            after_commit(autocomplete_stale.mark)
+
+        return [(ids[name], name) for name in unique_names if name in ids]
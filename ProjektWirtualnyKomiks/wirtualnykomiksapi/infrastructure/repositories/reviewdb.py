@@ -1,7 +1,7 @@
 """Module containing review repository implementation."""
 
-from typing import Any, Iterable
-from sqlalchemy import select, func
+from typing import Any, Iterable, List
+from sqlalchemy import bindparam, select, func
 from asyncpg import Record  # type: ignore
 
 from wirtualnykomiksapi.core.repositories.ireview import IReviewRepository
@@ -13,10 +13,33 @@ from wirtualnykomiksapi.db import (
 )
 
 from wirtualnykomiksapi.infrastructure.dto.reviewdto import ReviewDTO
+from wirtualnykomiksapi.infrastructure.utils.compiled_query import CompiledQuery
+from wirtualnykomiksapi.infrastructure.utils.mapping import validate_all
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_read
+
+_review_columns = (
+    review_table.c.id,
+    review_table.c.comic_id,
+    review_table.c.user_id,
+    review_table.c.rating,
+    review_table.c.comment,
+)
+
+# Hot read statements, compiled once and executed with bound values only
+_REVIEWS_BY_USER = CompiledQuery(
+    select(*_review_columns)
+    .where(review_table.c.user_id == bindparam("user_id"))
+    .order_by(review_table.c.id.asc())
+)
+_REVIEWS_BY_COMIC = CompiledQuery(
+    select(*_review_columns)
+    .where(review_table.c.comic_id == bindparam("comic_id"))
+)
 
 class ReviewRepository(IReviewRepository):
     """A class representing review DB repository"""
 
+    @replica_read
     async def get_all_reviews(self) -> Iterable[Any]:
         """The method getting all reviews from the data storage.
 
@@ -30,8 +53,9 @@ class ReviewRepository(IReviewRepository):
             .order_by(review_table.c.id)
         )
         reviews = await database.fetch_all(query)
-        return [ReviewDTO(**dict(review)) for review in reviews]
+        return validate_all(ReviewDTO, reviews)
 
+    @replica_read
     async def get_reviews_by_user(self, user_id: str) -> Iterable[Any]:
         """The method getting user reviews by given id from the data storage
 
@@ -42,20 +66,11 @@ class ReviewRepository(IReviewRepository):
             Iterable[Any]: The collection of reviews by given user ID
         """
 
-        query = (
-            select(
-                review_table.c.id,
-                review_table.c.comic_id,
-                review_table.c.user_id,
-                review_table.c.rating,
-                review_table.c.comment,
-            )
-            .where(review_table.c.user_id == user_id)
-            .order_by(review_table.c.id.asc())
-        )
-        reviews = await database.fetch_all(query)
-        return [ReviewDTO(**dict(review)) for review in reviews]
+        reviews = await self._fetch_all(_REVIEWS_BY_USER, user_id=user_id)
+        # asyncpg records have no attribute access, unlike those of `databases`
+        return validate_all(ReviewDTO, [dict(review) for review in reviews])
 
+    @replica_read
     async def get_review_by_id(self, review_id: int) -> Any | None:
         """The method getting review by given id from the data storage
 
@@ -69,6 +84,7 @@ class ReviewRepository(IReviewRepository):
         review = await self._get_by_id(review_id)
         return Review(**dict(review)) if review else None
 
+    @replica_read
     async def get_reviews_by_comic_id(self, comic_id: int) -> Iterable[Any]:
         """The method getting reviews by given comic id from the data storage
 
@@ -79,20 +95,11 @@ class ReviewRepository(IReviewRepository):
             Iterable[Any]: All the reviews for the given comic ID
         """
 
-        query = (
-            select(
-                review_table.c.id,
-                review_table.c.comic_id,
-                review_table.c.user_id,
-                review_table.c.rating,
-                review_table.c.comment,
-            )
-            .where(review_table.c.comic_id == comic_id)
-        )
-        reviews = await database.fetch_all(query)
+        reviews = await self._fetch_all(_REVIEWS_BY_COMIC, comic_id=comic_id)
 
-        return [ReviewDTO(**dict(review)) for review in reviews]
+        return validate_all(ReviewDTO, [dict(review) for review in reviews])
 
+    @replica_read
     async def get_average_rating(self, comic_id: int) -> float:
         """The method getting average reviews rating for a comic
 
@@ -185,4 +192,17 @@ class ReviewRepository(IReviewRepository):
             .where(review_table.c.id == review_id)
             .order_by(review_table.c.id)
         )
-        return await database.fetch_one(query)
\ No newline at end of file
+        return await database.fetch_one(query)
+
+    async def _fetch_all(self, query: CompiledQuery, **values: Any) -> List[Any]:
+        """A private method fetching all rows of a pre-compiled read
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            List[Any]: The asyncpg records
+        """
+
+        return await query.fetch_all(**values)
\ No newline at end of file
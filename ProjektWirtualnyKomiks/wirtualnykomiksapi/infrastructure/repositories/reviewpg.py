@@ -0,0 +1,28 @@
+"""Module containing review repository reading through the asyncpg pool."""
+
+from typing import Any, List
+
+from wirtualnykomiksapi.infrastructure.repositories.reviewdb import ReviewRepository
+from wirtualnykomiksapi.infrastructure.utils.compiled_query import CompiledQuery
+from wirtualnykomiksapi.infrastructure.utils.pg import asyncpg_pool
+
+
+class AsyncpgReviewRepository(ReviewRepository):
+    """A class representing review repository of the asyncpg backend.
+
+    The pre-compiled reads run on the asyncpg pool; writes and the
+    remaining reads are inherited.
+    """
+
+    async def _fetch_all(self, query: CompiledQuery, **values: Any) -> List[Any]:
+        """A private method fetching all rows of a pre-compiled read
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            List[Any]: The asyncpg records
+        """
+
+        return await asyncpg_pool.fetch_all(query, **values)
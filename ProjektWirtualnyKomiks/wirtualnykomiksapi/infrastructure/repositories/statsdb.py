@@ -0,0 +1,62 @@
+"""Module containing catalog statistics repository implementation."""
+
+import time
+from typing import Any, Iterable, Tuple
+
+from sqlalchemy import select
+
+from wirtualnykomiksapi.core.repositories.istats import IStatsRepository
+
+from wirtualnykomiksapi.db import (
+    database,
+    comic_table,
+    review_table,
+    genre_table,
+    comic_genre_table,
+)
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import query_recorder
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_read
+
+
+class StatsRepository(IStatsRepository):
+    """A class representing statistics DB repository"""
+
+    @replica_read
+    async def get_catalog_columns(self) -> Tuple[Iterable[Any], ...]:
+        """The method getting all columns used by the statistics
+
+        The tables are read on one connection inside a single repeatable read
+        transaction, so all of them come from the same database snapshot.
+
+        Returns:
+            Tuple[Iterable[Any], ...]: The comic ids, authors, views and likes
+                ordered by id, the comic ids and ratings of all reviews,
+                the genre ids and names ordered by id and the comic ids and
+                genre ids of all associations
+        """
+
+        comics_query = (
+            select(
+                comic_table.c.id,
+                comic_table.c.author,
+                comic_table.c.views,
+                comic_table.c.likes,
+            )
+            .order_by(comic_table.c.id)
+        )
+        reviews_query = select(review_table.c.comic_id, review_table.c.rating)
+        genres_query = (
+            select(genre_table.c.id, genre_table.c.name)
+            .order_by(genre_table.c.id)
+        )
+        comic_genres_query = select(comic_genre_table.c.comic_id, comic_genre_table.c.genre_id)
+
+        results = []
+        async with database.connection() as connection:
+            async with connection.transaction(isolation="repeatable_read", readonly=True):
+                for query in (comics_query, reviews_query, genres_query, comic_genres_query):
+                    started_at = time.perf_counter()
+                    results.append(await connection.fetch_all(query))
+                    query_recorder.record(query, time.perf_counter() - started_at)
+
+        return tuple(results)
@@ -1,9 +1,9 @@
 """Module containing tag repository implementation."""
 
+from functools import partial
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select
 
 from wirtualnykomiksapi.core.domain.tag import Tag, TagIn
 from wirtualnykomiksapi.core.repositories.itag import ITagRepository
@@ -14,27 +14,48 @@ from wirtualnykomiksapi.db import (
 )
 
 from wirtualnykomiksapi.infrastructure.dto.tagdto import TagDTO
+from wirtualnykomiksapi.infrastructure.repositories.namedb import NameRepository
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import after_commit
+from wirtualnykomiksapi.infrastructure.utils.dictionary import tag_dictionary
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import autocomplete_stale
+from wirtualnykomiksapi.infrastructure.utils.replicas import replica_read
 
-class TagRepository(ITagRepository):
+class TagRepository(NameRepository, ITagRepository):
     """A class representing tag DB repository"""
 
+    _table = tag_table
+    _dictionary = tag_dictionary
+
+    @replica_read
     async def get_all_tags(self) -> Iterable[Any]:
-        """The method getting all tags from the repository
+        """The method getting all tags from the in-memory dictionary
 
         Returns:
             Iterable[Any]: All tags
         """
-        query = (
-            select(
-                tag_table.c.id,
-                tag_table.c.name,
-            )
-            .order_by(tag_table.c.id)
-        )
-        tags = await database.fetch_all(query)
 
-        return [TagDTO(**dict(tag)) for tag in tags]
+        if not tag_dictionary.loaded:
+            await self.load_dictionary()
+
+        return [
+            TagDTO(id=tag_id, name=name)
+            for tag_id, name in tag_dictionary.snapshot.names.items()
+        ]
+
+    @replica_read
+    async def get_all_tags_json(self) -> bytes:
+        """The method getting all tags serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the tags
+        """
+
+        if not tag_dictionary.loaded:
+            await self.load_dictionary()
 
+        return tag_dictionary.snapshot.payload
+
+    @replica_read
     async def get_tag_by_id(self, tag_id: int) -> Any | None:
         """The method getting tag by id
 
@@ -62,7 +83,27 @@ class TagRepository(ITagRepository):
         new_tag_id = await database.execute(query)
         new_tag = await self._get_by_id(new_tag_id)
 
-        return Tag(**dict(new_tag)) if new_tag else None
+        if not new_tag:
+            return None
+
+        after_commit(partial(tag_dictionary.set, new_tag["id"], new_tag["name"]))
+        after_commit(autocomplete_stale.mark)
+        return Tag(**dict(new_tag))
+
+    async def resolve_tags(self, names: Iterable[str]) -> Iterable[Any]:
+        """The method getting ids of tags by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The tag names
+
+        Returns:
+            Iterable[Any]: The tags in the order of the first occurrence of their names
+        """
+
+        return [
+            TagDTO(id=tag_id, name=name)
+            for tag_id, name in await self._resolve_names(names)
+        ]
 
     async def update_tag(self, tag_id: int, data: TagIn) -> Any | None:
         """The method updating existing tag
@@ -84,7 +125,13 @@ class TagRepository(ITagRepository):
             await database.execute(query)
 
             tag = await self._get_by_id(tag_id)
-            return Tag(**dict(tag)) if tag else None
+
+            if not tag:
+                return None
+
+            after_commit(partial(tag_dictionary.set, tag["id"], tag["name"]))
+            after_commit(autocomplete_stale.mark)
+            return Tag(**dict(tag))
 
         return None
 
@@ -104,6 +151,8 @@ class TagRepository(ITagRepository):
                 .where(tag_table.c.id == tag_id)
 
             await database.execute(query)
+            after_commit(partial(tag_dictionary.discard, tag_id))
+            after_commit(autocomplete_stale.mark)
             return True
 
         return False
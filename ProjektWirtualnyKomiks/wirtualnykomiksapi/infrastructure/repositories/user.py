@@ -1,14 +1,16 @@
 """A repository for user entity"""
 
+from datetime import datetime, timezone
 from typing import Any
 from pydantic import UUID4
 
-from wirtualnykomiksapi.infrastructure.utils.password import hash_password
+from wirtualnykomiksapi.infrastructure.utils.password import hash_password_async
 from wirtualnykomiksapi.core.repositories.iuser import IUserRepository
 from wirtualnykomiksapi.core.domain.user import UserIn
 from wirtualnykomiksapi.db import (
     database,
-    user_table
+    user_table,
+    refresh_token_table,
 )
 
 class UserRepository(IUserRepository):
@@ -27,7 +29,7 @@ class UserRepository(IUserRepository):
         if await self.get_by_email(user.email):
             return None
 
-        user.password = hash_password(user.password)
+        user.password = await hash_password_async(user.password)
 
         query = user_table.insert().values(**user.model_dump())
         new_user_uuid = await database.execute(query)
@@ -68,4 +70,55 @@ class UserRepository(IUserRepository):
 
         user = await database.fetch_one(query)
 
-        return user
\ No newline at end of file
+        return user
+
+    async def add_refresh_token(
+        self,
+        user_id: UUID4,
+        token_hash: str,
+        expires_at: datetime,
+    ) -> None:
+        """The method storing refresh token digest of the user
+
+        Expired tokens of the user are purged at the same time.
+
+        Args:
+            user_id (UUID4): UUID of the user
+            token_hash (str): The digest of the refresh token
+            expires_at (datetime): The expiration date of the token
+        """
+
+        purge_query = (
+            refresh_token_table.delete()
+            .where(refresh_token_table.c.user_id == user_id)
+            .where(refresh_token_table.c.expires_at <= datetime.now(timezone.utc))
+        )
+        await database.execute(purge_query)
+
+        query = refresh_token_table.insert().values(
+            user_id=user_id,
+            token_hash=token_hash,
+            expires_at=expires_at,
+        )
+        await database.execute(query)
+
+    async def consume_refresh_token(self, token_hash: str) -> Any | None:
+        """The method removing unexpired refresh token and getting its owner
+
+        A token can be consumed only once, even by concurrent requests.
+
+        Args:
+            token_hash (str): The digest of the refresh token
+
+        Returns:
+            Any | None: The user UUID if the token existed and was valid
+        """
+
+        query = (
+            refresh_token_table.delete()
+            .where(refresh_token_table.c.token_hash == token_hash)
+            .where(refresh_token_table.c.expires_at > datetime.now(timezone.utc))
+            .returning(refresh_token_table.c.user_id)
+        )
+
+        return await database.fetch_val(query)
\ No newline at end of file
@@ -1,31 +1,138 @@
-from typing import Iterable, Any, Optional
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Any, List, Optional
 
-from sqlalchemy import select, join
+from sqlalchemy import select, join, column, func, tuple_, bindparam, cast, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 from wirtualnykomiksapi.db import (
 database,
 user_comic_list_table,
+user_comic_list_counter_table,
 comic_table
 )
 
 from wirtualnykomiksapi.core.repositories.iuser_comic_list import IUserComicListRepository
-from wirtualnykomiksapi.core.domain.user_comic_list import UserComicList, UserComicListStatus
+from wirtualnykomiksapi.core.domain.user_comic_list import (
+    UserComicList,
+    UserComicListIn,
+    UserComicListSort,
+    UserComicListStatus,
+)
+from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import (
+    UserComicListDTO,
+    UserComicListEntryDTO,
+    UserComicListPageDTO,
+    UserComicListSummaryDTO,
+)
+from wirtualnykomiksapi.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from wirtualnykomiksapi.infrastructure.utils.mapping import validate_all
 
 class UserComicListRepository(IUserComicListRepository):
     """A class representing user comic list DB repository"""
 
-    async def get_user_list(self, user_id: str) -> Iterable[Any]:
-        """The method getting user list
+    async def get_user_list(
+            self,
+            user_id: str,
+            status: Optional[UserComicListStatus],
+            sort_by: UserComicListSort,
+            limit: int,
+            cursor: Optional[str],
+    ) -> Any:
+        """The method getting a page of user list
+
+        Pages are delimited by the sort key of the last returned entry
+        (keyset pagination), the entry id breaking ties. Entries with the
+        same status are ordered by the time they were added, which matches
+        the (user_id, status, added_at, id) index.
+
+        Args:
+            user_id (str): The user id
+            status (Optional[UserComicListStatus]): The status to filter by
+            sort_by (UserComicListSort): The order of the entries
+            limit (int): The maximal number of entries on the page
+            cursor (Optional[str]): The cursor returned with the previous page
+
+        Raises:
+            ValueError: If the cursor is malformed
+
+        Returns:
+            Any: The entries and the cursor of the next page
+        """
+
+        sort_columns = {
+            UserComicListSort.TITLE: [comic_table.c.title],
+            UserComicListSort.ADDED: [user_comic_list_table.c.added_at],
+            UserComicListSort.STATUS: [
+                user_comic_list_table.c.status,
+                user_comic_list_table.c.added_at,
+            ],
+        }[sort_by] + [user_comic_list_table.c.id]
+        # Recently added entries come first
+        descending = sort_by == UserComicListSort.ADDED
+
+        query = (
+            select(
+                user_comic_list_table.c.id,
+                user_comic_list_table.c.comic_id,
+                user_comic_list_table.c.status,
+                user_comic_list_table.c.added_at,
+                comic_table.c.title,
+                comic_table.c.author,
+            )
+            .select_from(
+                join(
+                    user_comic_list_table,
+                    comic_table,
+                    user_comic_list_table.c.comic_id == comic_table.c.id
+                )
+            )
+            .where(user_comic_list_table.c.user_id == user_id)
+        )
+
+        if status is not None:
+            query = query.where(user_comic_list_table.c.status == status.value)
+
+        if cursor is not None:
+            query = query.where(self._after_cursor(sort_columns, cursor, descending))
+
+        if descending:
+            query = query.order_by(*(sort_column.desc() for sort_column in sort_columns))
+        else:
+            query = query.order_by(*(sort_column.asc() for sort_column in sort_columns))
+
+        entries = await database.fetch_all(query.limit(limit + 1))
+        items = validate_all(UserComicListEntryDTO, entries[:limit])
+
+        next_cursor = None
+        if len(entries) > limit:
+            last = entries[limit - 1]
+            next_cursor = encode_cursor(*(
+                last[sort_column.name].isoformat()
+                if isinstance(last[sort_column.name], datetime)
+                else last[sort_column.name]
+                for sort_column in sort_columns
+            ))
+
+        return UserComicListPageDTO(items=items, next_cursor=next_cursor)
+
+    async def get_whole_user_list(self, user_id: str) -> Iterable[Any]:
+        """The method getting all entries of user list
 
         Args:
             user_id (str): The user id
 
         Returns:
-            Iterable[Any]: The user comic list
+            Iterable[Any]: The entries ordered by comic title
         """
 
         query = (
-            select(user_comic_list_table, comic_table)
+            select(
+                user_comic_list_table.c.id,
+                user_comic_list_table.c.user_id,
+                user_comic_list_table.c.comic_id,
+                user_comic_list_table.c.status,
+            )
             .select_from(
                 join(
                     user_comic_list_table,
@@ -34,14 +141,17 @@ class UserComicListRepository(IUserComicListRepository):
                 )
             )
             .where(user_comic_list_table.c.user_id == user_id)
-            .order_by(comic_table.c.title.asc())
+            .order_by(comic_table.c.title.asc(), user_comic_list_table.c.id.asc())
         )
-        comics = await database.fetch_all(query)
-        return [UserComicList(**dict(comic)) for comic in comics]
+        entries = await database.fetch_all(query)
+
+        return validate_all(UserComicListDTO, entries)
 
     async def add_comic(self, user_id: str, comic_id: int) -> Any:
         """The method adding comic to user list
 
+        Adding a comic which is already on the list returns the existing entry.
+
         Args:
             user_id (str): The user id
             comic_id (int): The id of the comic
@@ -50,15 +160,29 @@ class UserComicListRepository(IUserComicListRepository):
             Any: The comic
         """
 
-        query = user_comic_list_table.insert().values(
-            user_id=user_id,
-            comic_id=comic_id,
-            status=UserComicListStatus.PLANNING.value
-        )
-        entry_id = await database.execute(query)
-        record = await database.fetch_one(
-            user_comic_list_table.select().where(user_comic_list_table.c.id == entry_id)
+        query = (
+            insert(user_comic_list_table)
+            .values(
+                user_id=user_id,
+                comic_id=comic_id,
+                status=UserComicListStatus.PLANNING.value
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    user_comic_list_table.c.user_id,
+                    user_comic_list_table.c.comic_id,
+                ]
+            )
+            .returning(*user_comic_list_table.c)
         )
+        async with database.transaction():
+            record = await database.fetch_one(query)
+
+            if record is None:
+                record = await self._get_comic(user_id, comic_id)
+            else:
+                await self._adjust_counters(user_id, {UserComicListStatus.PLANNING.value: 1})
+
         return UserComicList(**dict(record))
 
     async def update_status(self, user_id: str, comic_id: int, status: str) -> Optional[Any]:
@@ -73,19 +197,81 @@ class UserComicListRepository(IUserComicListRepository):
             Optional[Any]: The user comic list
         """
 
-        if await self._get_comic(user_id, comic_id):
-            query = (
-                user_comic_list_table.update()
-                .where(
-                    (user_comic_list_table.c.user_id == user_id) &
-                    (user_comic_list_table.c.comic_id == comic_id)
+        previous = user_comic_list_table.alias("previous")
+        query = (
+            user_comic_list_table.update()
+            .where(
+                (user_comic_list_table.c.user_id == user_id) &
+                (user_comic_list_table.c.comic_id == comic_id)
+            )
+            .where(previous.c.id == user_comic_list_table.c.id)
+            .values(status=status)
+            .returning(
+                *user_comic_list_table.c,
+                previous.c.status.label("previous_status"),
+            )
+        )
+
+        async with database.transaction():
+            record = await database.fetch_one(query)
+
+            if record and record["previous_status"] != record["status"]:
+                await self._adjust_counters(
+                    user_id,
+                    {record["previous_status"]: -1, record["status"]: 1},
                 )
-                .values(status=status)
+
+        return UserComicList(**dict(record)) if record else None
+
+    async def update_statuses(self, user_id: str, entries: Iterable[UserComicListIn]) -> Iterable[Any]:
+        """The method updating statuses of many comics with a single statement
+
+        Args:
+            user_id (str): The user id
+            entries (Iterable[UserComicListIn]): The comic ids with their new statuses
+
+        Returns:
+            Iterable[Any]: The entries whose status has changed
+        """
+
+        statuses = {entry.comic_id: entry.status.value for entry in entries}
+        if not statuses:
+            return []
+
+        # Typed arrays keep the parameters out of the VALUES type inference
+        # and give the statement one shape whatever the number of entries
+        changes = (
+            func.unnest(
+                cast(bindparam("comic_ids", list(statuses.keys())), ARRAY(Integer)),
+                cast(bindparam("statuses", list(statuses.values())), ARRAY(String)),
             )
-            await database.execute(query)
-            record = await self._get_comic(user_id, comic_id)
-            return UserComicList(**dict(record)) if record else None
-        return None
+            .table_valued(column("comic_id", Integer), column("status", String))
+            .render_derived(name="changes")
+        )
+        previous = user_comic_list_table.alias("previous")
+        query = (
+            user_comic_list_table.update()
+            .where(user_comic_list_table.c.user_id == user_id)
+            .where(user_comic_list_table.c.comic_id == changes.c.comic_id)
+            .where(user_comic_list_table.c.status != changes.c.status)
+            .where(previous.c.id == user_comic_list_table.c.id)
+            .values(status=changes.c.status)
+            .returning(
+                *user_comic_list_table.c,
+                previous.c.status.label("previous_status"),
+            )
+        )
+
+        async with database.transaction():
+            records = await database.fetch_all(query)
+
+            deltas: Counter = Counter()
+            for record in records:
+                deltas[record["previous_status"]] -= 1
+                deltas[record["status"]] += 1
+            await self._adjust_counters(user_id, deltas)
+
+        return validate_all(UserComicList, records)
 
     async def delete_comic(self, user_id: str, comic_id: int) -> bool:
         """The method deleting comic
@@ -98,14 +284,137 @@ class UserComicListRepository(IUserComicListRepository):
             bool: Success of the operation
         """
 
-        if await self._get_comic(user_id, comic_id):
-            query = user_comic_list_table.delete().where(
+        query = (
+            user_comic_list_table.delete()
+            .where(
                 (user_comic_list_table.c.user_id == user_id) &
                 (user_comic_list_table.c.comic_id == comic_id)
             )
-            await database.execute(query)
-            return True
-        return False
+            .returning(user_comic_list_table.c.status)
+        )
+
+        async with database.transaction():
+            status = await database.fetch_val(query)
+
+            if status is not None:
+                await self._adjust_counters(user_id, {status: -1})
+
+        return status is not None
+
+    async def get_summary(self, user_id: str) -> Any:
+        """The method getting number of comics per status in user list
+
+        Args:
+            user_id (str): The user id
+
+        Returns:
+            Any: The counts of comics by status
+        """
+
+        query = (
+            select(
+                user_comic_list_counter_table.c.status,
+                user_comic_list_counter_table.c.count,
+            )
+            .where(user_comic_list_counter_table.c.user_id == user_id)
+        )
+        counters = await database.fetch_all(query)
+
+        return UserComicListSummaryDTO(
+            **{counter["status"]: counter["count"] for counter in counters}
+        )
+
+    async def rebuild_counters(self, user_id: Optional[str] = None) -> None:
+        """The method recomputing status counters from the list entries
+
+        Args:
+            user_id (Optional[str]): The user whose counters are rebuilt,
+                all users if not given
+        """
+
+        delete_query = user_comic_list_counter_table.delete()
+        entries_query = (
+            select(
+                user_comic_list_table.c.user_id,
+                user_comic_list_table.c.status,
+                func.count().label("count"),
+            )
+            .group_by(user_comic_list_table.c.user_id, user_comic_list_table.c.status)
+        )
+
+        if user_id is not None:
+            delete_query = delete_query.where(user_comic_list_counter_table.c.user_id == user_id)
+            entries_query = entries_query.where(user_comic_list_table.c.user_id == user_id)
+
+        insert_query = user_comic_list_counter_table.insert().from_select(
+            ["user_id", "status", "count"],
+            entries_query,
+        )
+
+        async with database.transaction():
+            await database.execute(delete_query)
+            await database.execute(insert_query)
+
+    async def _adjust_counters(self, user_id: str, deltas: Dict[str, int]) -> None:
+        """A private method shifting status counters of the user
+
+        Must be called inside the transaction modifying the list entries.
+
+        Args:
+            user_id (str): The id of the user
+            deltas (Dict[str, int]): The change of count for every status
+        """
+
+        rows = [
+            {"user_id": user_id, "status": status, "count": delta}
+            for status, delta in deltas.items()
+            if delta
+        ]
+        if not rows:
+            return
+
+        query = insert(user_comic_list_counter_table).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=[
+                user_comic_list_counter_table.c.user_id,
+                user_comic_list_counter_table.c.status,
+            ],
+            set_={"count": user_comic_list_counter_table.c.count + query.excluded["count"]},
+        )
+        await database.execute(query)
+
+    def _after_cursor(self, sort_columns: List[Any], cursor: str, descending: bool) -> Any:
+        """A private method building the condition selecting entries after the cursor
+
+        Args:
+            sort_columns (List[Any]): The columns the entries are ordered by,
+                the entry id last
+            cursor (str): The cursor returned with the previous page
+            descending (bool): Whether the entries are in descending order
+
+        Raises:
+            ValueError: If the cursor is malformed
+
+        Returns:
+            Any: The keyset condition
+        """
+
+        *sort_values, last_id = decode_cursor(cursor, len(sort_columns))
+        if not all(isinstance(value, str) for value in sort_values) or not isinstance(last_id, int):
+            raise ValueError("Invalid cursor")
+
+        sort_values = [
+            datetime.fromisoformat(value)
+            if sort_column is user_comic_list_table.c.added_at
+            else value
+            for sort_column, value in zip(sort_columns, sort_values)
+        ]
+
+        keyset = tuple_(*sort_columns)
+        if descending:
+            return keyset < tuple_(*sort_values, last_id)
+
+        return keyset > tuple_(*sort_values, last_id)
 
     async def _get_comic(self, user_id: str, comic_id: int) -> Optional[Any]:
         """A private method getting comic from the database based on its id
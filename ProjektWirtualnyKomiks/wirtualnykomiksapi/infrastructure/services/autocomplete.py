@@ -0,0 +1,128 @@
+"""Module containing autocompletion service implementation."""
+
+import asyncio
+import logging
+from collections import Counter
+from contextlib import suppress
+from typing import Any, Iterable, Optional
+
+from wirtualnykomiksapi.core.repositories.iautocomplete import IAutocompleteRepository
+from wirtualnykomiksapi.infrastructure.dto.autocompletedto import AutocompleteKind, SuggestionDTO
+from wirtualnykomiksapi.infrastructure.services.iautocomplete import IAutocompleteService
+from wirtualnykomiksapi.infrastructure.utils.prefix_index import PrefixIndex, autocomplete_stale
+
+logger = logging.getLogger(__name__)
+
+
+class AutocompleteService(IAutocompleteService):
+    """A class implementing the autocompletion service.
+
+    Suggestions are served from an in-memory prefix index. Catalog writes
+    only flag the index as stale; the next lookup answers from the current
+    index and starts a rebuild in the background.
+    """
+
+    _repository: IAutocompleteRepository
+    _index: PrefixIndex
+    _refresh_task: Optional[asyncio.Task]
+
+    def __init__(self, repository: IAutocompleteRepository) -> None:
+        """The initializer of the 'autocompletion service'.
+
+        Args:
+            repository (IAutocompleteRepository): The reference to the repository
+        """
+
+        self._repository = repository
+        self._index = PrefixIndex.empty()
+        self._refresh_task = None
+
+    async def refresh(self) -> None:
+        """The method rebuilding the prefix index from the repository"""
+
+        comics = await self._repository.get_comic_terms()
+        genres = await self._repository.get_genre_terms()
+        tags = await self._repository.get_tag_terms()
+
+        self._index = await asyncio.to_thread(self._build_index, comics, genres, tags)
+
+    async def close(self) -> None:
+        """The method stopping the index rebuild running in the background"""
+
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
+
+    async def suggest(
+        self,
+        prefix: str,
+        kind: Optional[AutocompleteKind],
+        limit: int,
+    ) -> Iterable[SuggestionDTO]:
+        """The method getting the most popular terms starting with prefix
+
+        Args:
+            prefix (str): The typed prefix
+            kind (Optional[AutocompleteKind]): The kind of terms, all if not given
+            limit (int): The maximal number of suggestions
+
+        Returns:
+            Iterable[SuggestionDTO]: The suggestions, most popular first
+        """
+
+        refreshing = self._refresh_task is not None and not self._refresh_task.done()
+        if not refreshing and autocomplete_stale.consume():
+            self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+        return self._index.search(prefix, kind, limit)
+
+    async def _refresh_in_background(self) -> None:
+        """A private method rebuilding the index without failing the caller"""
+
+        try:
+            await self.refresh()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Autocomplete index refresh failed")
+            autocomplete_stale.mark()
+
+    @staticmethod
+    def _build_index(
+        comics: Iterable[Any],
+        genres: Iterable[Any],
+        tags: Iterable[Any],
+    ) -> PrefixIndex:
+        """A private method building the prefix index from catalog terms
+
+        Titles are ranked by their views, authors by total views of their
+        comics, genres and tags by the number of comics using them.
+
+        Args:
+            comics (Iterable[Any]): The comic titles, authors and views
+            genres (Iterable[Any]): The genre names and comic counts
+            tags (Iterable[Any]): The tag names and comic counts
+
+        Returns:
+            PrefixIndex: The index
+        """
+
+        titles: Counter = Counter()
+        authors: Counter = Counter()
+        for comic in comics:
+            titles[comic["title"]] += comic["views"]
+            if comic["author"]:
+                authors[comic["author"]] += comic["views"]
+
+        terms = (
+            (AutocompleteKind.TITLE, titles.items()),
+            (AutocompleteKind.AUTHOR, authors.items()),
+            (AutocompleteKind.GENRE, ((genre["name"], genre["count"]) for genre in genres)),
+            (AutocompleteKind.TAG, ((tag["name"], tag["count"]) for tag in tags)),
+        )
+
+        return PrefixIndex.build(
+            SuggestionDTO(kind=kind, value=value, popularity=popularity)
+            for kind, values in terms
+            for value, popularity in values
+        )
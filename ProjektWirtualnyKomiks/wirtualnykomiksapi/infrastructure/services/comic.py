@@ -1,10 +1,16 @@
 """Module containing comic service implementation."""
 
-from typing import Iterable, Optional
+from collections import Counter
+from typing import Iterable, List, Optional
 
 from wirtualnykomiksapi.core.repositories.icomic import IComicRepository
 from wirtualnykomiksapi.core.domain.comic import Comic, ComicIn, ComicBroker
-from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO
+from wirtualnykomiksapi.infrastructure.dto.comicdto import (
+    ComicDTO,
+    ComicFacetsDTO,
+    FacetCountDTO,
+    FacetedComicsDTO,
+)
 from wirtualnykomiksapi.infrastructure.dto.comic_comparison_dto import ComicComparisonDTO
 from wirtualnykomiksapi.infrastructure.services.icomic import IComicService
 
@@ -55,6 +61,27 @@ class ComicService(IComicService):
         """
         return await self._repository.get_filtered_comics(genres, tags)
 
+    async def get_faceted_comics(self, genres: Optional[str], tags: Optional[str]) -> FacetedComicsDTO:
+        """The method getting filtered comics with genre and tag counts
+
+        Args:
+            genres (Optional[str]): The list of genres
+            tags (Optional[str]): The list of tags
+
+        Returns:
+            FacetedComicsDTO: The filtered comics and their facet counts
+        """
+
+        comics = list(await self._repository.get_filtered_comics(genres, tags))
+
+        return FacetedComicsDTO(
+            comics=comics,
+            facets=ComicFacetsDTO(
+                genres=self._count_facets(genre for comic in comics for genre in comic.genres),
+                tags=self._count_facets(tag for comic in comics for tag in comic.tags),
+            ),
+        )
+
     async def get_most_popular_comics(self, limit: int) -> Iterable[Comic]:
         """The method getting most popular comics
 
@@ -127,3 +154,20 @@ class ComicService(IComicService):
             bool: Success of the operation
         """
         return await self._repository.delete_comic(comic_id)
+
+    @staticmethod
+    def _count_facets(values: Iterable) -> List[FacetCountDTO]:
+        """A private method counting comics per genre or tag
+
+        Args:
+            values (Iterable): The genres or tags of every comic in the result
+
+        Returns:
+            List[FacetCountDTO]: The counts, most frequent first
+        """
+
+        counts = Counter((value.id, value.name) for value in values)
+        return [
+            FacetCountDTO(id=value_id, name=name, count=count)
+            for (value_id, name), count in sorted(counts.items(), key=lambda item: (-item[1], item[0][1]))
+        ]
@@ -29,6 +29,18 @@ class GenreService(IGenreService):
         """
         return await self._repository.get_all_genres()
 
+    async def get_all_genres_json(self) -> bytes:
+        """The method getting all genres serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the genres
+        """
+        return await self._repository.get_all_genres_json()
+
+    async def load_dictionary(self) -> None:
+        """The method loading the in-memory genre dictionary"""
+        await self._repository.load_dictionary()
+
     async def get_genre_by_id(self, genre_id: int) -> GenreDTO | None:
         """The method getting genre by id
 
@@ -51,6 +63,17 @@ class GenreService(IGenreService):
         """
         return await self._repository.add_genre(data)
 
+    async def resolve_genres(self, names: Iterable[str]) -> Iterable[GenreDTO]:
+        """The method getting ids of genres by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The genre names
+
+        Returns:
+            Iterable[GenreDTO]: The genres in the order of the first occurrence of their names
+        """
+        return await self._repository.resolve_genres(names)
+
     async def update_genre(self, genre_id: int, data: GenreIn) -> Genre | None:
         """The method updating genre in the data storage
 
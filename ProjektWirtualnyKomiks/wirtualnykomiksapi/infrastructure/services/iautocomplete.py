@@ -0,0 +1,36 @@
+"""Module containing autocompletion service abstractions"""
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from wirtualnykomiksapi.infrastructure.dto.autocompletedto import AutocompleteKind, SuggestionDTO
+
+
+class IAutocompleteService(ABC):
+    """A class representing autocompletion service"""
+
+    @abstractmethod
+    async def refresh(self) -> None:
+        """The method rebuilding the prefix index from the repository"""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """The method stopping the index rebuild running in the background"""
+
+    @abstractmethod
+    async def suggest(
+        self,
+        prefix: str,
+        kind: Optional[AutocompleteKind],
+        limit: int,
+    ) -> Iterable[SuggestionDTO]:
+        """The method getting the most popular terms starting with prefix
+
+        Args:
+            prefix (str): The typed prefix
+            kind (Optional[AutocompleteKind]): The kind of terms, all if not given
+            limit (int): The maximal number of suggestions
+
+        Returns:
+            Iterable[SuggestionDTO]: The suggestions, most popular first
+        """
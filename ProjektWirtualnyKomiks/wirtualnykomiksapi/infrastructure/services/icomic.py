@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Iterable, Optional
 
 from wirtualnykomiksapi.core.domain.comic import Comic, ComicIn, ComicBroker
-from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO
+from wirtualnykomiksapi.infrastructure.dto.comicdto import ComicDTO, FacetedComicsDTO
 from wirtualnykomiksapi.infrastructure.dto.comic_comparison_dto import ComicComparisonDTO
 
 class IComicService(ABC):
@@ -41,6 +41,18 @@ class IComicService(ABC):
             Iterable[ComicDTO]: The filtered collection of comics
         """
 
+    @abstractmethod
+    async def get_faceted_comics(self, genres: Optional[str], tags: Optional[str]) -> FacetedComicsDTO:
+        """The method getting filtered comics with genre and tag counts
+
+        Args:
+            genres (Optional[str]): The list of genres
+            tags (Optional[str]): The list of tags
+
+        Returns:
+            FacetedComicsDTO: The filtered comics and their facet counts
+        """
+
     @abstractmethod
     async def get_top_rated_comics(self, limit: int) -> Iterable[Comic]:
         """The method getting comics with the highest average rating
@@ -17,6 +17,18 @@ class IGenreService(ABC):
             Iterable[GenreDTO]: All genres
         """
 
+    @abstractmethod
+    async def get_all_genres_json(self) -> bytes:
+        """The method getting all genres serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the genres
+        """
+
+    @abstractmethod
+    async def load_dictionary(self) -> None:
+        """The method loading the in-memory genre dictionary"""
+
     @abstractmethod
     async def get_genre_by_id(self, genre_id: int) -> GenreDTO | None:
         """The method getting genre by id
@@ -39,6 +51,17 @@ class IGenreService(ABC):
             Genre | None: The genre
         """
 
+    @abstractmethod
+    async def resolve_genres(self, names: Iterable[str]) -> Iterable[GenreDTO]:
+        """The method getting ids of genres by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The genre names
+
+        Returns:
+            Iterable[GenreDTO]: The genres in the order of the first occurrence of their names
+        """
+
     @abstractmethod
     async def update_genre(self, genre_id: int, data: GenreIn) -> Genre | None:
         """The method updating genre in the data storage
@@ -0,0 +1,85 @@
+"""Module containing catalog statistics service abstractions"""
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Iterable
+
+from wirtualnykomiksapi.infrastructure.dto.statsdto import (
+    AuthorRankingCriterion,
+    AuthorStatsDTO,
+    CorrelationDTO,
+    GenreRatingDTO,
+    RatingDistributionDTO,
+)
+
+
+class IStatsService(ABC):
+    """A class representing statistics service"""
+
+    @abstractmethod
+    async def refresh(self) -> None:
+        """The method rebuilding the statistics snapshot from the repository"""
+
+    @abstractmethod
+    async def refresh_periodically(self, interval: float) -> None:
+        """The method rebuilding the statistics snapshot in a loop
+
+        Args:
+            interval (float): The number of seconds between refreshes
+        """
+
+    @abstractmethod
+    def add_refresh_listener(self, listener: Callable[[], Awaitable[None]]) -> None:
+        """The method registering a function called after every refresh
+
+        Args:
+            listener (Callable[[], Awaitable[None]]): The function called
+                once the new snapshot is in place
+        """
+
+    @abstractmethod
+    async def get_snapshot_version(self) -> int:
+        """The method getting the version of the current snapshot
+
+        Returns:
+            int: The version, different for every refresh
+        """
+
+    @abstractmethod
+    async def get_rating_distribution(self) -> RatingDistributionDTO:
+        """The method getting the distribution of review ratings
+
+        Returns:
+            RatingDistributionDTO: The rating distribution
+        """
+
+    @abstractmethod
+    async def get_genre_ratings(self) -> Iterable[GenreRatingDTO]:
+        """The method getting mean and median rating of every genre
+
+        Returns:
+            Iterable[GenreRatingDTO]: The per-genre aggregates
+        """
+
+    @abstractmethod
+    async def get_correlation(self) -> CorrelationDTO:
+        """The method getting correlations between comic metrics
+
+        Returns:
+            CorrelationDTO: The metric correlations
+        """
+
+    @abstractmethod
+    async def get_author_leaderboard(
+        self,
+        sort_by: AuthorRankingCriterion,
+        limit: int,
+    ) -> Iterable[AuthorStatsDTO]:
+        """The method getting the best authors by given criterion
+
+        Args:
+            sort_by (AuthorRankingCriterion): The ranking criterion
+            limit (int): The amount of shown authors
+
+        Returns:
+            Iterable[AuthorStatsDTO]: The author leaderboard
+        """
@@ -17,6 +17,18 @@ class ITagService(ABC):
             Iterable[TagDTO]: All the tags
         """
 
+    @abstractmethod
+    async def get_all_tags_json(self) -> bytes:
+        """The method getting all tags serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the tags
+        """
+
+    @abstractmethod
+    async def load_dictionary(self) -> None:
+        """The method loading the in-memory tag dictionary"""
+
     @abstractmethod
     async def get_tag_by_id(self, tag_id: int) -> TagDTO | None:
         """The method getting tag by id
@@ -39,6 +51,17 @@ class ITagService(ABC):
             Tag | None: The tag
         """
 
+    @abstractmethod
+    async def resolve_tags(self, names: Iterable[str]) -> Iterable[TagDTO]:
+        """The method getting ids of tags by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The tag names
+
+        Returns:
+            Iterable[TagDTO]: The tags in the order of the first occurrence of their names
+        """
+
     @abstractmethod
     async def update_tag(self, tag_id: int, data: TagIn) -> Tag | None:
         """The method updating existing tag
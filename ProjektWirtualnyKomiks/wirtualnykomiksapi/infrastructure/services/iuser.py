@@ -33,6 +33,17 @@ class IUserService(ABC):
             TokenDTO | None: The token details
         """
 
+    @abstractmethod
+    async def refresh_user_token(self, refresh_token: str) -> TokenDTO | None:
+        """The method exchanging refresh token for new access and refresh tokens
+
+        Args:
+            refresh_token (str): The raw refresh token
+
+        Returns:
+            TokenDTO | None: The token details
+        """
+
     @abstractmethod
     async def get_by_uuid(self, uuid: UUID4) -> UserDTO | None:
         """A method getting user by UUID
@@ -3,21 +3,56 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, Optional
 
-from wirtualnykomiksapi.core.domain.user_comic_list import UserComicList, UserComicListBroker
-from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import UserComicListDTO
+from wirtualnykomiksapi.core.domain.user_comic_list import (
+    UserComicList,
+    UserComicListBroker,
+    UserComicListIn,
+    UserComicListSort,
+    UserComicListStatus,
+)
+from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import (
+    UserComicListDTO,
+    UserComicListPageDTO,
+    UserComicListSummaryDTO,
+)
 
 class IUserComicListService(ABC):
     """A class representing user comic list repository"""
 
     @abstractmethod
-    async def get_user_list(self, user_id: str) -> Iterable[UserComicListDTO]:
-        """The method getting user's comic list
+    async def get_user_list(
+            self,
+            user_id: str,
+            status: Optional[UserComicListStatus] = None,
+            sort_by: UserComicListSort = UserComicListSort.TITLE,
+            limit: int = 50,
+            cursor: Optional[str] = None,
+    ) -> UserComicListPageDTO:
+        """The method getting a page of user's comic list
 
         Args:
             user_id (str): The id of the user
+            status (Optional[UserComicListStatus]): The status to filter by
+            sort_by (UserComicListSort): The order of the entries
+            limit (int): The maximal number of entries on the page
+            cursor (Optional[str]): The cursor returned with the previous page
+
+        Raises:
+            ValueError: If the cursor is malformed
 
         Returns:
-            Iterable[UserComicListDTO]: The collection of comics in users list
+            UserComicListPageDTO: The entries and the cursor of the next page
+        """
+
+    @abstractmethod
+    async def get_whole_user_list(self, user_id: str) -> Iterable[UserComicListDTO]:
+        """The method getting all entries of user's comic list
+
+        Args:
+            user_id (str): The id of the user
+
+        Returns:
+            Iterable[UserComicListDTO]: The entries ordered by comic title
         """
 
     @abstractmethod
@@ -44,6 +79,18 @@ class IUserComicListService(ABC):
             Optional[UserComicListDTO]: The updated status of the comic
         """
 
+    @abstractmethod
+    async def update_statuses(self, user_id: str, entries: Iterable[UserComicListIn]) -> Iterable[UserComicListDTO]:
+        """The method updating statuses of many comics in the user's list
+
+        Args:
+            user_id (str): The id of the user
+            entries (Iterable[UserComicListIn]): The comic ids with their new statuses
+
+        Returns:
+            Iterable[UserComicListDTO]: The entries whose status has changed
+        """
+
     @abstractmethod
     async def delete_comic(self, user_id: str, comic_id: int) -> bool:
         """The method deleting comic from user's list
@@ -55,3 +102,14 @@ class IUserComicListService(ABC):
         Returns:
             bool: Success of the operation
         """
+
+    @abstractmethod
+    async def get_summary(self, user_id: str) -> UserComicListSummaryDTO:
+        """The method getting number of comics per status in user's list
+
+        Args:
+            user_id (str): The id of the user
+
+        Returns:
+            UserComicListSummaryDTO: The counts of comics by status
+        """
@@ -0,0 +1,138 @@
+"""Module containing catalog statistics service implementation."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Iterable, List
+
+from wirtualnykomiksapi.core.repositories.istats import IStatsRepository
+from wirtualnykomiksapi.infrastructure.dto.statsdto import (
+    AuthorRankingCriterion,
+    AuthorStatsDTO,
+    CorrelationDTO,
+    GenreRatingDTO,
+    RatingDistributionDTO,
+)
+from wirtualnykomiksapi.infrastructure.services.istats import IStatsService
+from wirtualnykomiksapi.infrastructure.utils.catalog_snapshot import CatalogSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class StatsService(IStatsService):
+    """A class implementing the statistics service.
+
+    The aggregates are served from an in-memory snapshot which is replaced
+    as a whole on every refresh, so readers never see a partial update.
+    """
+
+    _repository: IStatsRepository
+    _snapshot: CatalogSnapshot
+    _listeners: List[Callable[[], Awaitable[None]]]
+
+    def __init__(self, repository: IStatsRepository) -> None:
+        """The initializer of the 'statistics service'.
+
+        Args:
+            repository (IStatsRepository): The reference to the repository
+        """
+
+        self._repository = repository
+        self._snapshot = CatalogSnapshot.empty()
+        self._listeners = []
+
+    async def refresh(self) -> None:
+        """The method rebuilding the statistics snapshot from the repository"""
+
+        comics, reviews, genres, comic_genres = await self._repository.get_catalog_columns()
+
+        self._snapshot = await asyncio.to_thread(
+            CatalogSnapshot.build,
+            comics=comics,
+            reviews=reviews,
+            genres=genres,
+            comic_genres=comic_genres,
+        )
+
+        for listener in self._listeners:
+            try:
+                await listener()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Statistics refresh listener failed")
+
+    async def refresh_periodically(self, interval: float) -> None:
+        """The method rebuilding the statistics snapshot in a loop
+
+        Args:
+            interval (float): The number of seconds between refreshes
+        """
+
+        while True:
+            try:
+                await self.refresh()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Statistics snapshot refresh failed")
+
+            await asyncio.sleep(interval)
+
+    def add_refresh_listener(self, listener: Callable[[], Awaitable[None]]) -> None:
+        """The method registering a function called after every refresh
+
+        Args:
+            listener (Callable[[], Awaitable[None]]): The function called
+                once the new snapshot is in place
+        """
+
+        self._listeners.append(listener)
+
+    async def get_snapshot_version(self) -> int:
+        """The method getting the version of the current snapshot
+
+        Returns:
+            int: The version, different for every refresh
+        """
+
+        return self._snapshot.version
+
+    async def get_rating_distribution(self) -> RatingDistributionDTO:
+        """The method getting the distribution of review ratings
+
+        Returns:
+            RatingDistributionDTO: The rating distribution
+        """
+
+        return self._snapshot.rating_distribution
+
+    async def get_genre_ratings(self) -> Iterable[GenreRatingDTO]:
+        """The method getting mean and median rating of every genre
+
+        Returns:
+            Iterable[GenreRatingDTO]: The per-genre aggregates
+        """
+
+        return self._snapshot.genre_ratings
+
+    async def get_correlation(self) -> CorrelationDTO:
+        """The method getting correlations between comic metrics
+
+        Returns:
+            CorrelationDTO: The metric correlations
+        """
+
+        return self._snapshot.correlation
+
+    async def get_author_leaderboard(
+        self,
+        sort_by: AuthorRankingCriterion,
+        limit: int,
+    ) -> Iterable[AuthorStatsDTO]:
+        """The method getting the best authors by given criterion
+
+        Args:
+            sort_by (AuthorRankingCriterion): The ranking criterion
+            limit (int): The amount of shown authors
+
+        Returns:
+            Iterable[AuthorStatsDTO]: The author leaderboard
+        """
+
+        return self._snapshot.author_leaderboards[sort_by][:limit]
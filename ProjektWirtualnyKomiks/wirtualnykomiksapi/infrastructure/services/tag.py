@@ -29,6 +29,18 @@ class TagService(ITagService):
         """
         return await self._repository.get_all_tags()
 
+    async def get_all_tags_json(self) -> bytes:
+        """The method getting all tags serialized to JSON
+
+        Returns:
+            bytes: The JSON listing of all the tags
+        """
+        return await self._repository.get_all_tags_json()
+
+    async def load_dictionary(self) -> None:
+        """The method loading the in-memory tag dictionary"""
+        await self._repository.load_dictionary()
+
     async def get_tag_by_id(self, tag_id: int) -> TagDTO | None:
         """The method getting tag by id from the repository
 
@@ -50,6 +62,17 @@ class TagService(ITagService):
         """
         return await self._repository.add_tag(data)
 
+    async def resolve_tags(self, names: Iterable[str]) -> Iterable[TagDTO]:
+        """The method getting ids of tags by name, creating the missing ones
+
+        Args:
+            names (Iterable[str]): The tag names
+
+        Returns:
+            Iterable[TagDTO]: The tags in the order of the first occurrence of their names
+        """
+        return await self._repository.resolve_tags(names)
+
     async def update_tag(self, tag_id: int, data: TagIn) -> Tag | None:
         """The method updating tag in the repository
 
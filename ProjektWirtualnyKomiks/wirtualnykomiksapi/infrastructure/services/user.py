@@ -7,8 +7,12 @@ from wirtualnykomiksapi.core.repositories.iuser import IUserRepository
 from wirtualnykomiksapi.infrastructure.dto.userdto import UserDTO
 from wirtualnykomiksapi.infrastructure.dto.tokendto import TokenDTO
 from wirtualnykomiksapi.infrastructure.services.iuser import IUserService
-from wirtualnykomiksapi.infrastructure.utils.password import verify_password
-from wirtualnykomiksapi.infrastructure.utils.token import generate_user_token
+from wirtualnykomiksapi.infrastructure.utils.password import verify_password_async
+from wirtualnykomiksapi.infrastructure.utils.token import (
+    generate_refresh_token,
+    generate_user_token,
+    hash_refresh_token,
+)
 
 class UserService(IUserService):
     """A class implementing the user service"""
@@ -41,15 +45,53 @@ class UserService(IUserService):
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data.password):
-                token_details = generate_user_token(user_data.id)
-                # trunk-ignore(bandit/B106)
-                return TokenDTO(token_type="Bearer", **token_details)
+            if await verify_password_async(user.password, user_data.password):
+                return await self._issue_tokens(user_data.id)
 
             return None
 
         return None
 
+    async def refresh_user_token(self, refresh_token: str) -> TokenDTO | None:
+        """The method exchanging refresh token for new access and refresh tokens
+
+        The refresh token is rotated: it is consumed by the exchange and
+        cannot be used again.
+
+        Args:
+            refresh_token (str): The raw refresh token
+
+        Returns:
+            TokenDTO | None: The token details
+        """
+
+        token_hash = hash_refresh_token(refresh_token)
+
+        if user_id := await self._repository.consume_refresh_token(token_hash):
+            return await self._issue_tokens(user_id)
+
+        return None
+
+    async def _issue_tokens(self, user_id: UUID4) -> TokenDTO:
+        """A private method issuing access token and storing new refresh token
+
+        Args:
+            user_id (UUID4): UUID of the user
+
+        Returns:
+            TokenDTO: The token details
+        """
+
+        token_details = generate_user_token(user_id)
+        refresh_details = generate_refresh_token()
+        await self._repository.add_refresh_token(
+            user_id=user_id,
+            token_hash=refresh_details.pop("token_hash"),
+            expires_at=refresh_details["refresh_expires"],
+        )
+        # trunk-ignore(bandit/B106)
+        return TokenDTO(token_type="Bearer", **token_details, **refresh_details)
+
     async def get_by_uuid(self, uuid: UUID4) -> UserDTO | None:
         """A method getting user by UUID
 
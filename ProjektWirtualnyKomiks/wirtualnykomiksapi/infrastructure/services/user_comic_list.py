@@ -3,8 +3,18 @@
 from typing import Iterable, Optional
 
 from wirtualnykomiksapi.core.repositories.iuser_comic_list import IUserComicListRepository
-from wirtualnykomiksapi.core.domain.user_comic_list import UserComicList, UserComicListBroker, UserComicListStatus
-from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import UserComicListDTO
+from wirtualnykomiksapi.core.domain.user_comic_list import (
+    UserComicList,
+    UserComicListBroker,
+    UserComicListIn,
+    UserComicListSort,
+    UserComicListStatus,
+)
+from wirtualnykomiksapi.infrastructure.dto.user_comic_listdto import (
+    UserComicListDTO,
+    UserComicListPageDTO,
+    UserComicListSummaryDTO,
+)
 from wirtualnykomiksapi.infrastructure.services.iuser_comic_list import IUserComicListService
 
 class UserComicListService(IUserComicListService):
@@ -21,16 +31,49 @@ class UserComicListService(IUserComicListService):
 
         self._repository = repository
 
-    async def get_user_list(self, user_id: str) -> Iterable[UserComicListDTO]:
-        """The method getting user's comic list
+    async def get_user_list(
+            self,
+            user_id: str,
+            status: Optional[UserComicListStatus] = None,
+            sort_by: UserComicListSort = UserComicListSort.TITLE,
+            limit: int = 50,
+            cursor: Optional[str] = None,
+    ) -> UserComicListPageDTO:
+        """The method getting a page of user's comic list
+
+        Args:
+            user_id (str): The id of the user
+            status (Optional[UserComicListStatus]): The status to filter by
+            sort_by (UserComicListSort): The order of the entries
+            limit (int): The maximal number of entries on the page
+            cursor (Optional[str]): The cursor returned with the previous page
+
+        Raises:
+            ValueError: If the cursor is malformed
+
+        Returns:
+            UserComicListPageDTO: The entries and the cursor of the next page
+        """
+
+        return await self._repository.get_user_list(
+            user_id=user_id,
+            status=status,
+            sort_by=sort_by,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def get_whole_user_list(self, user_id: str) -> Iterable[UserComicListDTO]:
+        """The method getting all entries of user's comic list
 
         Args:
             user_id (str): The id of the user
 
         Returns:
-            Iterable[UserComicListDTO]: The collection of comics in users list
+            Iterable[UserComicListDTO]: The entries ordered by comic title
         """
-        return await self._repository.get_user_list(user_id)
+
+        return await self._repository.get_whole_user_list(user_id)
 
     async def add_comic(self, data: UserComicListBroker) -> UserComicListDTO:
         """The method adding comic to user's list
@@ -64,6 +107,18 @@ class UserComicListService(IUserComicListService):
             status=status,
         )
 
+    async def update_statuses(self, user_id: str, entries: Iterable[UserComicListIn]) -> Iterable[UserComicListDTO]:
+        """The method updating statuses of many comics in the user's list
+
+        Args:
+            user_id (str): The id of the user
+            entries (Iterable[UserComicListIn]): The comic ids with their new statuses
+
+        Returns:
+            Iterable[UserComicListDTO]: The entries whose status has changed
+        """
+        return await self._repository.update_statuses(user_id, entries)
+
     async def delete_comic(self, user_id: str, comic_id: int) -> bool:
         """The method deleting comic from user's list
 
@@ -74,4 +129,15 @@ class UserComicListService(IUserComicListService):
         Returns:
             bool: Success of the operation
         """
-        return await self._repository.delete_comic(user_id, comic_id)
\ No newline at end of file
+        return await self._repository.delete_comic(user_id, comic_id)
+
+    async def get_summary(self, user_id: str) -> UserComicListSummaryDTO:
+        """The method getting number of comics per status in user's list
+
+        Args:
+            user_id (str): The id of the user
+
+        Returns:
+            UserComicListSummaryDTO: The counts of comics by status
+        """
+        return await self._repository.get_summary(user_id)
\ No newline at end of file
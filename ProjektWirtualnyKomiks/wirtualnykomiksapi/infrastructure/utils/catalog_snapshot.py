@@ -0,0 +1,369 @@
+"""A module containing the vectorized catalog analytics snapshot"""
+
+import itertools
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from wirtualnykomiksapi.infrastructure.dto.statsdto import (
+    AuthorRankingCriterion,
+    AuthorStatsDTO,
+    CorrelationDTO,
+    GenreRatingDTO,
+    RatingDistributionDTO,
+)
+
+MIN_RATING = 1
+MAX_RATING = 10
+
+_versions = itertools.count(1)
+
+
+class CatalogSnapshot:
+    """An immutable set of catalog aggregates computed in one pass.
+
+    The snapshot is built from columnar NumPy arrays and never mutated
+    afterwards, so a refresh replaces the whole object at once.
+    """
+
+    version: int
+    generated_at: datetime
+    rating_distribution: RatingDistributionDTO
+    genre_ratings: List[GenreRatingDTO]
+    correlation: CorrelationDTO
+    author_leaderboards: Dict[AuthorRankingCriterion, List[AuthorStatsDTO]]
+
+    def __init__(
+        self,
+        rating_distribution: RatingDistributionDTO,
+        genre_ratings: List[GenreRatingDTO],
+        correlation: CorrelationDTO,
+        author_leaderboards: Dict[AuthorRankingCriterion, List[AuthorStatsDTO]],
+    ) -> None:
+        """The initializer of the catalog snapshot.
+
+        Args:
+            rating_distribution (RatingDistributionDTO): The rating histogram
+            genre_ratings (List[GenreRatingDTO]): The per-genre aggregates
+            correlation (CorrelationDTO): The metric correlations
+            author_leaderboards (Dict[AuthorRankingCriterion, List[AuthorStatsDTO]]):
+                The authors ordered by every ranking criterion
+        """
+
+        self.version = next(_versions)
+        self.generated_at = datetime.now(timezone.utc)
+        self.rating_distribution = rating_distribution
+        self.genre_ratings = genre_ratings
+        self.correlation = correlation
+        self.author_leaderboards = author_leaderboards
+
+    @classmethod
+    def empty(cls) -> "CatalogSnapshot":
+        """A method creating snapshot of an empty catalog
+
+        Returns:
+            CatalogSnapshot: The snapshot without any data
+        """
+
+        return cls.build(comics=[], reviews=[], genres=[], comic_genres=[])
+
+    @classmethod
+    def build(
+        cls,
+        comics: Iterable[Any],
+        reviews: Iterable[Any],
+        genres: Iterable[Any],
+        comic_genres: Iterable[Any],
+    ) -> "CatalogSnapshot":
+        """A method building the snapshot from raw table rows
+
+        Args:
+            comics (Iterable[Any]): Comic rows (id, author, views, likes) ordered by id
+            reviews (Iterable[Any]): Review rows (comic_id, rating)
+            genres (Iterable[Any]): Genre rows (id, name) ordered by id
+            comic_genres (Iterable[Any]): Association rows (comic_id, genre_id)
+
+        Returns:
+            CatalogSnapshot: The computed snapshot
+        """
+
+        comics = list(comics)
+        reviews = list(reviews)
+        genres = list(genres)
+        comic_genres = list(comic_genres)
+
+        comic_ids = _column(comics, "id")
+        views = _column(comics, "views")
+        likes = _column(comics, "likes")
+        authors = np.array([comic["author"] or "" for comic in comics], dtype=str)
+
+        review_comic_ids = _column(reviews, "comic_id")
+        ratings = _column(reviews, "rating")
+
+        genre_ids = _column(genres, "id")
+        genre_names = [genre["name"] for genre in genres]
+
+        pair_comic_ids = _column(comic_genres, "comic_id")
+        pair_genre_ids = _column(comic_genres, "genre_id")
+
+        # `searchsorted` maps an unknown id onto a neighbouring position (or
+        # one past the end), so rows referencing missing comics or genres
+        # are dropped before positions are looked up
+        known_reviews = np.isin(review_comic_ids, comic_ids)
+        review_comic_ids = review_comic_ids[known_reviews]
+        ratings = ratings[known_reviews]
+
+        known_pairs = np.isin(pair_comic_ids, comic_ids) & np.isin(pair_genre_ids, genre_ids)
+        pair_comic_ids = pair_comic_ids[known_pairs]
+        pair_genre_ids = pair_genre_ids[known_pairs]
+
+        # Reviews grouped by the position of their comic in `comic_ids`
+        review_positions = np.searchsorted(comic_ids, review_comic_ids)
+        review_counts = np.bincount(review_positions, minlength=comic_ids.size)
+        rating_sums = np.bincount(
+            review_positions,
+            weights=ratings,
+            minlength=comic_ids.size,
+        )
+        average_ratings = _safe_divide(rating_sums, review_counts)
+
+        return cls(
+            rating_distribution=_rating_distribution(ratings),
+            genre_ratings=_genre_ratings(
+                genre_ids=genre_ids,
+                genre_names=genre_names,
+                pair_comic_positions=np.searchsorted(comic_ids, pair_comic_ids),
+                pair_genre_positions=np.searchsorted(genre_ids, pair_genre_ids),
+                review_positions=review_positions,
+                review_counts=review_counts,
+                ratings=ratings,
+            ),
+            correlation=CorrelationDTO(
+                comics=int(comic_ids.size),
+                views_likes=_pearson(views, likes),
+                views_rating=_pearson(views, average_ratings),
+                likes_rating=_pearson(likes, average_ratings),
+            ),
+            author_leaderboards=_author_leaderboards(
+                authors=authors,
+                views=views,
+                likes=likes,
+                rating_sums=rating_sums,
+                review_counts=review_counts,
+            ),
+        )
+
+
+def _column(rows: List[Any], name: str) -> np.ndarray:
+    """A function extracting integer column from the rows
+
+    Args:
+        rows (List[Any]): The table rows
+        name (str): The name of the column
+
+    Returns:
+        np.ndarray: The column values
+    """
+
+    return np.fromiter((row[name] for row in rows), dtype=np.int64, count=len(rows))
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """A function dividing arrays leaving zero where the denominator is zero
+
+    Args:
+        numerator (np.ndarray): The dividend
+        denominator (np.ndarray): The divisor
+
+    Returns:
+        np.ndarray: The quotient
+    """
+
+    result = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> Optional[float]:
+    """A function computing the Pearson correlation coefficient
+
+    Args:
+        x (np.ndarray): The first variable
+        y (np.ndarray): The second variable
+
+    Returns:
+        Optional[float]: The coefficient, None if it is undefined
+    """
+
+    if x.size < 2:
+        return None
+
+    x_centered = x - x.mean()
+    y_centered = y - y.mean()
+    denominator = np.sqrt((x_centered ** 2).sum() * (y_centered ** 2).sum())
+
+    if denominator == 0:
+        return None
+
+    return float((x_centered * y_centered).sum() / denominator)
+
+
+def _group_medians(groups: np.ndarray, values: np.ndarray, size: int) -> np.ndarray:
+    """A function computing median of values within every group
+
+    Args:
+        groups (np.ndarray): The group index of every value
+        values (np.ndarray): The values
+        size (int): The number of groups
+
+    Returns:
+        np.ndarray: The median per group, zero for empty groups
+    """
+
+    counts = np.bincount(groups, minlength=size)
+    sorted_values = values[np.lexsort((values, groups))].astype(np.float64)
+    starts = np.cumsum(counts) - counts
+
+    medians = np.zeros(size, dtype=np.float64)
+    present = counts > 0
+    lower = starts[present] + (counts[present] - 1) // 2
+    upper = starts[present] + counts[present] // 2
+    medians[present] = (sorted_values[lower] + sorted_values[upper]) / 2
+
+    return medians
+
+
+def _rating_distribution(ratings: np.ndarray) -> RatingDistributionDTO:
+    """A function computing the rating histogram
+
+    Args:
+        ratings (np.ndarray): The ratings of all reviews
+
+    Returns:
+        RatingDistributionDTO: The rating distribution
+    """
+
+    counts = np.bincount(ratings, minlength=MAX_RATING + 1)[MIN_RATING:]
+
+    return RatingDistributionDTO(
+        total_reviews=int(ratings.size),
+        mean_rating=float(ratings.mean()) if ratings.size else 0.0,
+        median_rating=float(np.median(ratings)) if ratings.size else 0.0,
+        counts={
+            rating: int(count)
+            for rating, count in enumerate(counts, start=MIN_RATING)
+        },
+    )
+
+
+def _genre_ratings(
+    genre_ids: np.ndarray,
+    genre_names: List[str],
+    pair_comic_positions: np.ndarray,
+    pair_genre_positions: np.ndarray,
+    review_positions: np.ndarray,
+    review_counts: np.ndarray,
+    ratings: np.ndarray,
+) -> List[GenreRatingDTO]:
+    """A function computing mean and median rating of every genre
+
+    Every review is counted once for each genre of its comic.
+
+    Args:
+        genre_ids (np.ndarray): The ids of the genres
+        genre_names (List[str]): The names of the genres
+        pair_comic_positions (np.ndarray): The comic position of every association
+        pair_genre_positions (np.ndarray): The genre position of every association
+        review_positions (np.ndarray): The comic position of every review
+        review_counts (np.ndarray): The number of reviews per comic
+        ratings (np.ndarray): The ratings of all reviews
+
+    Returns:
+        List[GenreRatingDTO]: The per-genre aggregates
+    """
+
+    sorted_ratings = ratings[np.argsort(review_positions, kind="stable")]
+    comic_offsets = np.cumsum(review_counts) - review_counts
+
+    pair_counts = review_counts[pair_comic_positions]
+    pair_offsets = np.cumsum(pair_counts) - pair_counts
+    rating_indices = (
+        np.repeat(comic_offsets[pair_comic_positions] - pair_offsets, pair_counts)
+        + np.arange(pair_counts.sum())
+    )
+    expanded_ratings = sorted_ratings[rating_indices]
+    expanded_genres = np.repeat(pair_genre_positions, pair_counts)
+
+    counts = np.bincount(expanded_genres, minlength=genre_ids.size)
+    means = _safe_divide(
+        np.bincount(expanded_genres, weights=expanded_ratings, minlength=genre_ids.size),
+        counts,
+    )
+    medians = _group_medians(expanded_genres, expanded_ratings, genre_ids.size)
+
+    return [
+        GenreRatingDTO(
+            genre_id=int(genre_ids[i]),
+            name=genre_names[i],
+            reviews=int(counts[i]),
+            mean_rating=float(means[i]),
+            median_rating=float(medians[i]),
+        )
+        for i in range(genre_ids.size)
+    ]
+
+
+def _author_leaderboards(
+    authors: np.ndarray,
+    views: np.ndarray,
+    likes: np.ndarray,
+    rating_sums: np.ndarray,
+    review_counts: np.ndarray,
+) -> Dict[AuthorRankingCriterion, List[AuthorStatsDTO]]:
+    """A function ranking authors by every criterion
+
+    Args:
+        authors (np.ndarray): The author of every comic
+        views (np.ndarray): The views of every comic
+        likes (np.ndarray): The likes of every comic
+        rating_sums (np.ndarray): The sum of ratings of every comic
+        review_counts (np.ndarray): The number of reviews of every comic
+
+    Returns:
+        Dict[AuthorRankingCriterion, List[AuthorStatsDTO]]: The leaderboards
+    """
+
+    names, groups = np.unique(authors, return_inverse=True)
+    size = names.size
+
+    totals = {
+        AuthorRankingCriterion.COMICS: np.bincount(groups, minlength=size),
+        AuthorRankingCriterion.VIEWS: np.bincount(groups, weights=views, minlength=size),
+        AuthorRankingCriterion.LIKES: np.bincount(groups, weights=likes, minlength=size),
+        AuthorRankingCriterion.RATING: _safe_divide(
+            np.bincount(groups, weights=rating_sums, minlength=size),
+            np.bincount(groups, weights=review_counts, minlength=size),
+        ),
+    }
+
+    entries = [
+        AuthorStatsDTO(
+            author=str(names[i]),
+            comics=int(totals[AuthorRankingCriterion.COMICS][i]),
+            views=int(totals[AuthorRankingCriterion.VIEWS][i]),
+            likes=int(totals[AuthorRankingCriterion.LIKES][i]),
+            average_rating=float(totals[AuthorRankingCriterion.RATING][i]),
+        )
+        for i in range(size)
+    ]
+    known = names != ""
+
+    return {
+        criterion: [
+            entries[i]
+            for i in np.argsort(-values, kind="stable")
+            if known[i]
+        ]
+        for criterion, values in totals.items()
+    }
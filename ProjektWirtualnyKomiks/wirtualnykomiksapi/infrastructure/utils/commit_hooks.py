@@ -0,0 +1,50 @@
+"""A module containing callbacks deferred until the request transaction commits"""
+
+import logging
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Set by the unit of work middleware for the duration of a write request:
+# the callbacks to run once its transaction has been committed
+pending_commit_hooks: ContextVar[Optional[List[Callable[[], None]]]] = ContextVar(
+    "pending_commit_hooks",
+    default=None,
+)
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """Function running a callback once the changes are visible to everyone.
+
+    In-memory state mirroring the database (dictionaries, stale markers) is
+    updated through this function, so a rolled back request never leaves
+    changes in memory which the database does not have. Outside a unit of
+    work the statements have already been committed and the callback runs
+    immediately.
+
+    Args:
+        callback (Callable[[], None]): The callback with its arguments bound
+    """
+
+    hooks = pending_commit_hooks.get()
+    if hooks is None:
+        callback()
+    else:
+        hooks.append(callback)
+
+
+def run_commit_hooks(hooks: List[Callable[[], None]]) -> None:
+    """Function running the callbacks of a committed transaction.
+
+    Args:
+        hooks (List[Callable[[], None]]): The callbacks in registration order
+    """
+
+    callbacks = list(hooks)
+    hooks.clear()
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception:
+            logger.exception("Commit hook %r failed", callback)
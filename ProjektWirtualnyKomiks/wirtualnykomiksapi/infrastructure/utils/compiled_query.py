@@ -0,0 +1,95 @@
+"""A module containing statements compiled once and reused with bound values"""
+
+import re
+import time
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.sql import ClauseElement
+
+from wirtualnykomiksapi.db import database
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import query_recorder
+
+_dialect = asyncpg_dialect()
+_WHITESPACE = re.compile(r"\s+")
+
+
+class CompiledQuery:
+    """A parameterized statement compiled to asyncpg SQL on first use.
+
+    The statement is built once at import time with named `bindparam`s and
+    `= ANY(:param)` instead of expanding `IN` lists, so its SQL does not
+    depend on the bound values. Executions skip statement construction and
+    compilation entirely and send the SQL text straight to asyncpg, whose
+    statement cache then reuses the server-side prepared statement.
+    """
+
+    def __init__(self, statement: ClauseElement) -> None:
+        """The initializer of the compiled query.
+
+        Args:
+            statement (ClauseElement): The statement with named bind parameters
+        """
+
+        self.statement = statement
+        self._compiled: Optional[Tuple[str, Tuple[str, ...], dict, str]] = None
+
+    async def fetch_all(self, **values: Any) -> List[Any]:
+        """A method fetching all rows of the statement
+
+        Args:
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            List[Any]: The asyncpg records
+        """
+
+        sql, args, fingerprint = self.bind(values)
+        started_at = time.perf_counter()
+        try:
+            async with database.connection() as connection:
+                return await connection.raw_connection.fetch(sql, *args)
+        finally:
+            query_recorder.record_fingerprint(fingerprint, time.perf_counter() - started_at)
+
+    async def fetch_one(self, **values: Any) -> Optional[Any]:
+        """A method fetching the first row of the statement
+
+        Args:
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            Optional[Any]: The asyncpg record
+        """
+
+        sql, args, fingerprint = self.bind(values)
+        started_at = time.perf_counter()
+        try:
+            async with database.connection() as connection:
+                return await connection.raw_connection.fetchrow(sql, *args)
+        finally:
+            query_recorder.record_fingerprint(fingerprint, time.perf_counter() - started_at)
+
+    def bind(self, values: dict) -> Tuple[str, list, str]:
+        """A method ordering bound values for the positional SQL
+
+        Args:
+            values (dict): The values of the named bind parameters
+
+        Returns:
+            Tuple[str, list, str]: The SQL text, its positional arguments
+                and the statement fingerprint
+        """
+
+        if self._compiled is None:
+            compiled = self.statement.compile(dialect=_dialect)
+            self._compiled = (
+                compiled.string,
+                tuple(compiled.positiontup or ()),
+                compiled.params,
+                _WHITESPACE.sub(" ", compiled.string).strip(),
+            )
+
+        sql, positions, defaults, fingerprint = self._compiled
+        args = [values[name] if name in values else defaults[name] for name in positions]
+        return sql, args, fingerprint
@@ -0,0 +1,264 @@
+"""A module containing HTTP response compression helpers"""
+
+import asyncio
+import gzip
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from wirtualnykomiksapi.config import config
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - optional codec
+    brotli = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:  # pragma: no cover - optional codec
+    zstandard = None
+
+IDENTITY = "identity"
+
+
+def _usable_cpus() -> int:
+    """Function counting CPUs the process may run on.
+
+    Returns:
+        int: The number of usable CPUs
+    """
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def _compressor(encoding: str, level: int) -> Callable[[bytes], bytes]:
+    """Function building the compressor of a content coding.
+
+    Args:
+        encoding (str): The content coding
+        level (int): The compression level of the codec
+
+    Returns:
+        Callable[[bytes], bytes]: The compressing function
+    """
+
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress
+    if encoding == "br":
+        return lambda data: brotli.compress(data, quality=level)
+
+    return lambda data: gzip.compress(data, compresslevel=level, mtime=0)
+
+
+# Codecs in order of preference with their (fast, balanced, best) levels;
+# zstd and brotli are used only if their packages are installed
+_LEVELS: Dict[str, Tuple[int, int, int]] = {
+    **({"zstd": (1, 6, 19)} if zstandard is not None else {}),
+    **({"br": (1, 5, 11)} if brotli is not None else {}),
+    "gzip": (1, 6, 9),
+}
+
+
+class Compressor:
+    """A set of content codings with levels fitted to the available CPUs.
+
+    On-the-fly compression uses the balanced level, or the fast one when
+    the worker has fewer CPUs than `cpu_threshold`. Payloads precompressed
+    off the event loop use the best level.
+    """
+
+    def __init__(self, level: Optional[str], cpu_threshold: int) -> None:
+        """The initializer of the compressor.
+
+        Args:
+            level (Optional[str]): The forced level, "fast" or "balanced",
+                chosen by the number of CPUs if not given
+            cpu_threshold (int): The number of CPUs needed for the balanced level
+        """
+
+        if level is None:
+            level = "balanced" if _usable_cpus() >= cpu_threshold else "fast"
+
+        index = 0 if level == "fast" else 1
+        self.level = level
+        self._on_the_fly = {
+            encoding: _compressor(encoding, levels[index])
+            for encoding, levels in _LEVELS.items()
+        }
+        self._best = {
+            encoding: _compressor(encoding, levels[2])
+            for encoding, levels in _LEVELS.items()
+        }
+
+    @property
+    def encodings(self) -> Tuple[str, ...]:
+        """A property returning the supported content codings
+
+        Returns:
+            Tuple[str, ...]: The codings in order of preference
+        """
+
+        return tuple(_LEVELS)
+
+    def compress(self, data: bytes, encoding: str, best: bool = False) -> bytes:
+        """A method compressing data with a content coding
+
+        Args:
+            data (bytes): The data to compress
+            encoding (str): The content coding
+            best (bool, optional): Whether to use the best level. Defaults to False.
+
+        Returns:
+            bytes: The compressed data
+        """
+
+        return (self._best if best else self._on_the_fly)[encoding](data)
+
+    def negotiate(self, accept_encoding: str) -> str:
+        """A method choosing the content coding from an Accept-Encoding header
+
+        Args:
+            accept_encoding (str): The value of the Accept-Encoding header
+
+        Returns:
+            str: The preferred supported coding, identity if none is accepted
+        """
+
+        accepted = {}
+        for item in accept_encoding.split(","):
+            coding, _, params = item.strip().partition(";")
+            quality = 1.0
+            key, _, value = params.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+            accepted[coding.strip().lower()] = quality
+
+        for encoding in self.encodings:
+            if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+                return encoding
+
+        return IDENTITY
+
+
+class CompressedPayloadCache:
+    """A bounded cache of rendered and compressed response bodies.
+
+    Entries are keyed by the caller with the version of the data the body
+    was rendered from and the parameters of the request, so a hit skips
+    serialization as well as compression, and the entries of an outdated
+    version simply age out. Bodies rendered on a request are compressed on
+    the event loop at the on-the-fly level; `precompress` fills in all
+    codings at the best level in a worker thread.
+    """
+
+    def __init__(self, compressor: Compressor, max_entries: int, minimum_size: int) -> None:
+        """The initializer of the compressed payload cache.
+
+        Args:
+            compressor (Compressor): The compressor of the payloads
+            max_entries (int): The maximal number of cached bodies
+            minimum_size (int): The smallest payload worth compressing
+        """
+
+        self.compressor = compressor
+        self.max_entries = max_entries
+        self.minimum_size = minimum_size
+        self._entries: OrderedDict[Tuple[Hashable, str, str], Tuple[bytes, str]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        key: Hashable,
+        media_type: str,
+        encoding: str,
+        render: Callable[[], bytes],
+    ) -> Tuple[bytes, str]:
+        """A method getting the body of a response, rendering it on a miss
+
+        Args:
+            key (Hashable): The version of the data and the request parameters
+            media_type (str): The media type of the body
+            encoding (str): The content coding accepted by the client
+            render (Callable[[], bytes]): The function serializing the payload
+
+        Returns:
+            Tuple[bytes, str]: The body and the content coding it uses
+        """
+
+        entry_key = (key, media_type, encoding)
+        if (entry := self._entries.get(entry_key)) is not None:
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = self._encode(render(), encoding, best=False)
+        self._store(entry_key, entry)
+
+        return entry
+
+    async def precompress(self, key: Hashable, media_type: str, payload: bytes) -> None:
+        """A method caching a payload in all content codings ahead of requests
+
+        Args:
+            key (Hashable): The version of the data and the request parameters
+            media_type (str): The media type of the payload
+            payload (bytes): The serialized payload
+        """
+
+        encodings = (IDENTITY, *self.compressor.encodings)
+        entries = await asyncio.to_thread(
+            lambda: [self._encode(payload, encoding, best=True) for encoding in encodings],
+        )
+        for encoding, entry in zip(encodings, entries):
+            self._store((key, media_type, encoding), entry)
+
+    def _encode(self, payload: bytes, encoding: str, best: bool) -> Tuple[bytes, str]:
+        """A private method compressing a payload if it is worth it
+
+        Args:
+            payload (bytes): The serialized payload
+            encoding (str): The content coding accepted by the client
+            best (bool): Whether to use the best level
+
+        Returns:
+            Tuple[bytes, str]: The body and the content coding it uses
+        """
+
+        if encoding == IDENTITY or len(payload) < self.minimum_size:
+            return payload, IDENTITY
+
+        return self.compressor.compress(payload, encoding, best=best), encoding
+
+    def _store(self, entry_key: Tuple[Hashable, str, str], entry: Tuple[bytes, str]) -> None:
+        """A private method adding an entry, evicting the least recently used one
+
+        Args:
+            entry_key (Tuple[Hashable, str, str]): The key, media type and coding
+            entry (Tuple[bytes, str]): The body and the content coding it uses
+        """
+
+        self._entries[entry_key] = entry
+        self._entries.move_to_end(entry_key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+compressor = Compressor(
+    level=config.COMPRESSION_LEVEL,
+    cpu_threshold=config.COMPRESSION_CPU_THRESHOLD,
+)
+
+compressed_payload_cache = CompressedPayloadCache(
+    compressor,
+    max_entries=config.COMPRESSION_CACHE_SIZE,
+    minimum_size=config.COMPRESSION_MIN_SIZE,
+)
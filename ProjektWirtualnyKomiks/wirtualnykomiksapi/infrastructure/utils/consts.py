@@ -1,5 +1,6 @@
 """A module containing constant values for infrastructure layer"""
 
 EXPIRATION_MINUTES = 60
+REFRESH_EXPIRATION_DAYS = 30
 SECRET_KEY = "s3cr3t"
 ALGORITHM = "HS256"
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""A module containing helpers for opaque keyset pagination cursors"""
+
+import base64
+import binascii
+import json
+from typing import Any, List
+
+
+def encode_cursor(*values: Any) -> str:
+    """Function encoding the keyset of the last returned row into a cursor.
+
+    Args:
+        *values (Any): The JSON-serializable sort key values of the row
+
+    Returns:
+        str: The URL-safe cursor
+    """
+
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> List[Any]:
+    """Function decoding the keyset values from a cursor.
+
+    Args:
+        cursor (str): The cursor returned with the previous page
+        length (int): The expected number of keyset values
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    Returns:
+        List[Any]: The sort key values of the last row of the previous page
+    """
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Invalid cursor")
+
+    return values
@@ -0,0 +1,118 @@
+"""A module containing in-memory snapshots of small dictionary tables"""
+
+import itertools
+import json
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple, Tuple
+
+
+_versions = itertools.count(1)
+
+
+class DictionarySnapshot(NamedTuple):
+    """An immutable id to name mapping with its pre-serialized JSON listing"""
+    names: Mapping[int, str]
+    payload: bytes
+    version: int
+
+
+class NameDictionary:
+    """A process-local copy of an id to name table.
+
+    Readers take the current snapshot without locking; writers build a new
+    snapshot from a copy and swap the reference, so a snapshot once taken
+    never changes.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the name dictionary."""
+
+        self._snapshot = self._build({})
+        self.loaded = False
+
+    @property
+    def snapshot(self) -> DictionarySnapshot:
+        """A property returning the current snapshot
+
+        Returns:
+            DictionarySnapshot: The names and their JSON listing
+        """
+
+        return self._snapshot
+
+    def load(self, rows: Iterable[Tuple[int, str]]) -> None:
+        """A method replacing the whole dictionary
+
+        The snapshot, and so its version, is kept when the table has not
+        changed, which makes periodic reloads free for cached listings.
+
+        Args:
+            rows (Iterable[Tuple[int, str]]): The ids with their names
+        """
+
+        names = dict(rows)
+        if not self.loaded or names != self._snapshot.names:
+            self._snapshot = self._build(names)
+        self.loaded = True
+
+    def set(self, entry_id: int, name: str) -> None:
+        """A method adding or renaming a single entry
+
+        Args:
+            entry_id (int): The id of the entry
+            name (str): The name of the entry
+        """
+
+        names = dict(self._snapshot.names)
+        names[entry_id] = name
+        self._snapshot = self._build(names)
+
+    def update(self, rows: Iterable[Tuple[int, str]]) -> None:
+        """A method adding or renaming many entries at once
+
+        Args:
+            rows (Iterable[Tuple[int, str]]): The ids with their names
+        """
+
+        names = dict(self._snapshot.names)
+        names.update(rows)
+        self._snapshot = self._build(names)
+
+    def discard(self, entry_id: int) -> None:
+        """A method removing a single entry if it exists
+
+        Args:
+            entry_id (int): The id of the entry
+        """
+
+        if entry_id in self._snapshot.names:
+            names = dict(self._snapshot.names)
+            del names[entry_id]
+            self._snapshot = self._build(names)
+
+    @staticmethod
+    def _build(names: dict) -> DictionarySnapshot:
+        """A private method freezing names into a snapshot
+
+        Args:
+            names (dict): The ids with their names
+
+        Returns:
+            DictionarySnapshot: The snapshot ordered by id
+        """
+
+        ordered = dict(sorted(names.items()))
+        payload = json.dumps(
+            [{"id": entry_id, "name": name} for entry_id, name in ordered.items()],
+            separators=(",", ":"),
+        ).encode()
+
+        return DictionarySnapshot(
+            names=MappingProxyType(ordered),
+            payload=payload,
+            version=next(_versions),
+        )
+
+
+genre_dictionary = NameDictionary()
+tag_dictionary = NameDictionary()
@@ -0,0 +1,199 @@
+"""A module containing graceful shutdown coordination of the worker"""
+
+import asyncio
+import logging
+import signal
+import time
+from contextlib import suppress
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from wirtualnykomiksapi.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class ShutdownCoordinator:
+    """A coordinator of the shutdown of the worker.
+
+    On SIGTERM the worker first reports itself as not ready for the grace
+    period, so load balancers stop routing to it while its listeners are
+    still open. It then stops accepting requests, waits until the in-flight
+    ones finish or the drain deadline passes, and only afterwards lets the
+    server close its listeners. The registered flush hooks run in order of
+    registration once the server shuts down. Requests still running after
+    the deadline are counted as dropped.
+    """
+
+    def __init__(self, drain_timeout: float, hook_timeout: float, grace_period: float) -> None:
+        """The initializer of the shutdown coordinator.
+
+        Args:
+            drain_timeout (float): The number of seconds in-flight requests may take
+            hook_timeout (float): The number of seconds a single flush hook may take
+            grace_period (float): The number of seconds requests are still
+                accepted after SIGTERM while the worker reports not ready
+        """
+
+        self.drain_timeout = drain_timeout
+        self.hook_timeout = hook_timeout
+        self.grace_period = grace_period
+        self.stopping = False
+        self.draining = False
+        self.in_flight = 0
+        self.rejected = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._hooks: List[Tuple[str, Callable[[], Awaitable[None]]]] = []
+        self._drain_task: Optional[asyncio.Task] = None
+        self._drain_metrics: dict = {}
+
+    def install_signal_handler(self) -> None:
+        """A method draining the worker on SIGTERM before the server stops
+
+        The handler installed by the server is called once the requests
+        are drained. Signal handlers can only be installed from the main
+        thread, elsewhere the worker is drained at shutdown only.
+        """
+
+        loop = asyncio.get_running_loop()
+        previous = signal.getsignal(signal.SIGTERM)
+        try:
+            loop.add_signal_handler(signal.SIGTERM, self._on_sigterm, loop, previous)
+        except (NotImplementedError, RuntimeError, ValueError):
+            logger.info("SIGTERM handler not installed, draining on shutdown only")
+
+    def _on_sigterm(self, loop: asyncio.AbstractEventLoop, previous: Callable) -> None:
+        """A private method starting to drain the worker on SIGTERM
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The loop the handler is installed in
+            previous (Callable): The SIGTERM handler of the server
+        """
+
+        async def drain_and_stop() -> None:
+            try:
+                await self._drain(self.grace_period)
+            finally:
+                # Give the signal back to the server, which now closes its
+                # listeners and runs the lifespan shutdown
+                loop.remove_signal_handler(signal.SIGTERM)
+                signal.signal(signal.SIGTERM, previous)
+                signal.raise_signal(signal.SIGTERM)
+
+        if self._drain_task is None:
+            logger.info("SIGTERM received, draining requests")
+            self._drain_task = loop.create_task(drain_and_stop())
+
+    def register(self, name: str, hook: Callable[[], Awaitable[None]]) -> None:
+        """A method adding a flush hook run after the requests are drained
+
+        Args:
+            name (str): The name of the hook used in logs
+            hook (Callable[[], Awaitable[None]]): The function flushing the state
+        """
+
+        self._hooks.append((name, hook))
+
+    def request_started(self) -> bool:
+        """A method admitting a request
+
+        Returns:
+            bool: Whether the request may run, False once draining has begun
+        """
+
+        if self.draining:
+            self.rejected += 1
+            return False
+
+        self.in_flight += 1
+        self._idle.clear()
+        return True
+
+    def request_finished(self) -> None:
+        """A method releasing an admitted request"""
+
+        self.in_flight -= 1
+        if self.in_flight == 0:
+            self._idle.set()
+
+    async def _drain(self, grace_period: float) -> None:
+        """A private method stopping admission of requests and waiting for the in-flight ones
+
+        Args:
+            grace_period (float): The number of seconds requests are still
+                accepted while the worker reports not ready
+        """
+
+        self.stopping = True
+        started = time.monotonic()
+        await asyncio.sleep(grace_period)
+
+        self.draining = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), self.drain_timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        self._drain_metrics = {
+            "drain_seconds": round(time.monotonic() - started, 3),
+            "dropped_requests": self.in_flight,
+        }
+
+    async def shutdown(self) -> dict:
+        """A method draining the requests and running the flush hooks
+
+        Returns:
+            dict: The shutdown metrics
+        """
+
+        if self._drain_task is not None:
+            # Drained on SIGTERM already, the task ends by handing the
+            # signal to the server which is what brought us here
+            await asyncio.shield(self._drain_task)
+        else:
+            await self._drain(0)
+
+        failed_hooks = []
+        for name, hook in self._hooks:
+            hook_started = time.monotonic()
+            try:
+                await asyncio.wait_for(hook(), self.hook_timeout)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Shutdown hook %s failed", name)
+                failed_hooks.append(name)
+            logger.info(
+                "Shutdown hook %s took %.1f ms",
+                name,
+                (time.monotonic() - hook_started) * 1000,
+            )
+
+        metrics = {
+            **self._drain_metrics,
+            "rejected_requests": self.rejected,
+            "failed_hooks": failed_hooks,
+        }
+        if metrics["dropped_requests"] or failed_hooks:
+            logger.warning("Shutdown finished with dropped work: %s", metrics)
+        else:
+            logger.info("Shutdown finished: %s", metrics)
+
+        return metrics
+
+
+async def cancel_task(task: asyncio.Task) -> None:
+    """Function cancelling a background task and waiting for it to stop.
+
+    Args:
+        task (asyncio.Task): The task to cancel
+    """
+
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+shutdown_coordinator = ShutdownCoordinator(
+    drain_timeout=config.SHUTDOWN_DRAIN_SECONDS,
+    hook_timeout=config.SHUTDOWN_HOOK_SECONDS,
+    grace_period=config.SHUTDOWN_GRACE_SECONDS,
+)
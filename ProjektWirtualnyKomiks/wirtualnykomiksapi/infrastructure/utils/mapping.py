@@ -0,0 +1,40 @@
+"""A module containing mapping of database rows to DTOs"""
+
+from functools import lru_cache
+from typing import Any, Iterable, List, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Function getting the cached adapter validating lists of a model.
+
+    Args:
+        model (Type[BaseModel]): The model of the list items
+
+    Returns:
+        TypeAdapter: The adapter of the list
+    """
+
+    return TypeAdapter(List[model])  # type: ignore
+
+
+def validate_all(model: Type[M], rows: Iterable[Any]) -> List[M]:
+    """Function validating a whole result set in a single call.
+
+    Rows are read through their attributes, so records of `databases`
+    need no intermediate dict per row.
+
+    Args:
+        model (Type[M]): The model of the items
+        rows (Iterable[Any]): The records or dicts
+
+    Returns:
+        List[M]: The validated models
+    """
+
+    return _list_adapter(model).validate_python(rows, from_attributes=True)
+
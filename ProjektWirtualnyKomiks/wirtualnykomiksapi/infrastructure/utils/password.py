@@ -1,7 +1,14 @@
 """A module containing password helper methods"""
 
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
+from wirtualnykomiksapi.config import config
+
 pwd_context = CryptContext(schemes=["bcrypt"])
 
 
@@ -27,4 +34,141 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasherPool:
+    """A bounded worker pool running bcrypt outside the event loop.
+
+    At most `max_workers` calls are submitted to the executor at once,
+    the remaining callers wait on a semaphore and are counted as queued.
+    """
+
+    def __init__(self, executor_kind: str, max_workers: int) -> None:
+        """The initializer of the password hasher pool.
+
+        Args:
+            executor_kind (str): Either "thread" or "process"
+            max_workers (int): The maximal number of concurrent bcrypt calls
+        """
+
+        if executor_kind not in ("thread", "process"):
+            raise ValueError(f"Unsupported password hash executor: {executor_kind}")
+
+        self.executor_kind = executor_kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+        self.queued = 0
+        self.peak_queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """A method running the function in the worker pool
+
+        Args:
+            func (Callable[..., Any]): A picklable module-level function
+            *args (Any): The function arguments
+
+        Returns:
+            Any: The function result
+        """
+
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        enqueued_at = time.perf_counter()
+
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        self.total_wait_seconds += time.perf_counter() - enqueued_at
+        self.in_flight += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def metrics(self) -> dict:
+        """A method returning the current pool metrics
+
+        Returns:
+            dict: The pool metrics
+        """
+
+        return {
+            "executor": self.executor_kind,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "completed": self.completed,
+            "average_wait_ms": (
+                self.total_wait_seconds / self.completed * 1000
+                if self.completed else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        """A method stopping the executor workers"""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        """A private method lazily creating the executor
+
+        Returns:
+            Executor: The executor running bcrypt calls
+        """
+
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="bcrypt",
+                )
+
+        return self._executor
+
+
+password_pool = PasswordHasherPool(
+    executor_kind=config.PASSWORD_HASH_EXECUTOR,
+    max_workers=config.PASSWORD_HASH_WORKERS,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """A function generating hash password in the worker pool
+
+    Args:
+        password (str): A raw form of the password
+
+    Returns:
+        str: The hashed password
+    """
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """A function verifying a password against its hash in the worker pool
+
+    Args:
+        plain_password (str): The raw password
+        hashed_password (str): The hashed password
+
+    Returns:
+        bool: True if the password matches the hash, False otherwise
+    """
+    return await password_pool.run(verify_password, plain_password, hashed_password)
@@ -0,0 +1,112 @@
+"""A module containing the asyncpg pool of the asyncpg repository backend"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional
+
+import asyncpg  # type: ignore
+
+from wirtualnykomiksapi.db import database, db_uri, pool_options
+from wirtualnykomiksapi.infrastructure.utils.commit_hooks import pending_commit_hooks
+from wirtualnykomiksapi.infrastructure.utils.compiled_query import CompiledQuery
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import query_recorder
+from wirtualnykomiksapi.infrastructure.utils.replicas import reads_from_replica
+
+
+class AsyncpgPool:
+    """A pool of plain asyncpg connections to the primary.
+
+    Pre-compiled reads run on it without the connection bookkeeping of
+    `databases`; asyncpg prepares every statement once per connection and
+    reuses it from its statement cache. A separate connection cannot see
+    uncommitted writes, so inside a unit of work the reads stay on the
+    connection of the request, and reads routed to a healthy replica go
+    to the replica as well.
+    """
+
+    def __init__(self, dsn: str, **options: Any) -> None:
+        """The initializer of the asyncpg pool.
+
+        Args:
+            dsn (str): The libpq connection string of the primary
+            **options (Any): The options of `asyncpg.create_pool`
+        """
+
+        self.dsn = dsn
+        self.options = options
+        self._pool: Optional[asyncpg.Pool] = None
+
+    async def connect(self) -> None:
+        """A method opening the pool"""
+
+        if self._pool is None:
+            self._pool = await asyncpg.create_pool(self.dsn, **self.options)
+
+    async def disconnect(self) -> None:
+        """A method closing the pool"""
+
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    async def fetch_all(self, query: CompiledQuery, **values: Any) -> List[Any]:
+        """A method fetching all rows of a pre-compiled statement
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            List[Any]: The asyncpg records
+        """
+
+        sql, args, fingerprint = query.bind(values)
+        started_at = time.perf_counter()
+        try:
+            async with self._connection() as connection:
+                return await connection.fetch(sql, *args)
+        finally:
+            query_recorder.record_fingerprint(fingerprint, time.perf_counter() - started_at)
+
+    async def fetch_one(self, query: CompiledQuery, **values: Any) -> Optional[Any]:
+        """A method fetching the first row of a pre-compiled statement
+
+        Args:
+            query (CompiledQuery): The statement
+            **values (Any): The values of the bind parameters
+
+        Returns:
+            Optional[Any]: The asyncpg record
+        """
+
+        sql, args, fingerprint = query.bind(values)
+        started_at = time.perf_counter()
+        try:
+            async with self._connection() as connection:
+                return await connection.fetchrow(sql, *args)
+        finally:
+            query_recorder.record_fingerprint(fingerprint, time.perf_counter() - started_at)
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[Any]:
+        """A private method getting the asyncpg connection for a read
+
+        Yields:
+            Any: The pooled connection, or the raw connection of `databases`
+                within a unit of work or for a replica read
+        """
+
+        if (
+            self._pool is None
+            or pending_commit_hooks.get() is not None
+            or (reads_from_replica() and any(database.replicas.healthy))
+        ):
+            async with database.connection() as connection:
+                yield connection.raw_connection
+            return
+
+        async with self._pool.acquire() as connection:
+            yield connection
+
+
+asyncpg_pool = AsyncpgPool(db_uri.replace("postgresql+asyncpg://", "postgresql://", 1), **pool_options)
@@ -0,0 +1,159 @@
+"""A module containing connection pool instrumentation"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Optional
+
+from databases import Database
+
+from wirtualnykomiksapi.config import config
+
+LATENCY_SAMPLES = 1024
+
+
+class PoolMonitor:
+    """A recorder of waiting acquirers and acquire latency of the DB pool.
+
+    The asyncpg pool created by `databases` is replaced by a thin proxy,
+    which applies the acquire timeout and times every acquire; the latency
+    percentiles are computed over the most recent samples.
+    """
+
+    def __init__(self, acquire_timeout: float) -> None:
+        """The initializer of the pool monitor.
+
+        Args:
+            acquire_timeout (float): The number of seconds to wait for a connection
+        """
+
+        self.acquire_timeout = acquire_timeout
+        self._pool: Optional[Any] = None
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+
+    def install(self, database: Database) -> None:
+        """A method instrumenting the pool of a connected database
+
+        Args:
+            database (Database): The connected database
+        """
+
+        backend = database._backend  # pylint: disable=protected-access
+        self._pool = backend._pool  # pylint: disable=protected-access
+        backend._pool = _InstrumentedPool(self._pool, self)  # pylint: disable=protected-access
+
+    async def acquire(self, pool: Any) -> Any:
+        """A method acquiring a connection from the pool
+
+        Args:
+            pool (Any): The asyncpg pool
+
+        Raises:
+            asyncio.TimeoutError: If no connection is released in time
+
+        Returns:
+            Any: The asyncpg connection
+        """
+
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        started_at = time.perf_counter()
+
+        try:
+            connection = await pool.acquire(timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+
+        self._latencies.append((time.perf_counter() - started_at) * 1000)
+        self.acquired += 1
+        return connection
+
+    def metrics(self) -> dict:
+        """A method returning the pool metrics
+
+        Returns:
+            dict: The pool occupancy and acquire statistics
+        """
+
+        size = self._pool.get_size() if self._pool else 0
+        idle = self._pool.get_idle_size() if self._pool else 0
+        latencies = sorted(self._latencies)
+
+        return {
+            "min_size": config.DB_POOL_MIN_SIZE,
+            "max_size": config.DB_POOL_MAX_SIZE,
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": self.waiting,
+            "peak_waiting": self.peak_waiting,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "acquire_p50_ms": self._percentile(latencies, 0.50),
+            "acquire_p95_ms": self._percentile(latencies, 0.95),
+            "acquire_p99_ms": self._percentile(latencies, 0.99),
+        }
+
+    @staticmethod
+    def _percentile(latencies: list, fraction: float) -> float:
+        """A private method picking a percentile of sorted latencies
+
+        Args:
+            latencies (list): The sorted latencies
+            fraction (float): The percentile as a fraction
+
+        Returns:
+            float: The latency in milliseconds, 0 without samples
+        """
+
+        if not latencies:
+            return 0.0
+
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+
+class _InstrumentedPool:
+    """A proxy of the asyncpg pool reporting acquires to the monitor"""
+
+    def __init__(self, pool: Any, monitor: PoolMonitor) -> None:
+        """The initializer of the instrumented pool.
+
+        Args:
+            pool (Any): The asyncpg pool
+            monitor (PoolMonitor): The monitor recording the acquires
+        """
+
+        self._pool = pool
+        self._monitor = monitor
+
+    async def acquire(self) -> Any:
+        """A method acquiring a connection through the monitor
+
+        Returns:
+            Any: The asyncpg connection
+        """
+
+        return await self._monitor.acquire(self._pool)
+
+    def __getattr__(self, name: str) -> Any:
+        """A method delegating the remaining pool API
+
+        Args:
+            name (str): The attribute name
+
+        Returns:
+            Any: The attribute of the asyncpg pool
+        """
+
+        return getattr(self._pool, name)
+
+
+pool_monitor = PoolMonitor(acquire_timeout=config.DB_POOL_ACQUIRE_TIMEOUT)
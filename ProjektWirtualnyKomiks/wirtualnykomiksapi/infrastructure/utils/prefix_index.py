@@ -0,0 +1,208 @@
+"""A module containing the in-memory prefix index used for autocompletion"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+from wirtualnykomiksapi.infrastructure.dto.autocompletedto import AutocompleteKind, SuggestionDTO
+
+MAX_SUGGESTIONS = 20
+SHORT_PREFIX_LENGTH = 2
+
+_SEPARATORS = re.compile(r"[\W_]+")
+# Letters which have no decomposition into a base letter and a diacritic
+_FOLDED_LETTERS = str.maketrans({"ł": "l", "ø": "o", "đ": "d", "æ": "ae", "œ": "oe"})
+
+
+def normalize(text: str) -> str:
+    """Function normalizing text for accent and case insensitive matching.
+
+    Args:
+        text (str): The text to normalize
+
+    Returns:
+        str: The casefolded text without diacritics, words separated by single spaces
+    """
+
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    folded = stripped.casefold().translate(_FOLDED_LETTERS)
+    return _SEPARATORS.sub(" ", folded).strip()
+
+
+class _KindIndex:
+    """A sorted array of normalized keys of one kind of suggestions.
+
+    Every word suffix of a term is a key, so a prefix matches the start of
+    any word. Suggestions are stored by rank (most popular first), which
+    lets the top matches be picked as the smallest ranks.
+    """
+
+    def __init__(self, suggestions: List[SuggestionDTO]) -> None:
+        """The initializer of the kind index.
+
+        Args:
+            suggestions (List[SuggestionDTO]): The suggestions ordered by rank
+        """
+
+        self.suggestions = suggestions
+
+        entries = []
+        for rank, suggestion in enumerate(suggestions):
+            words = normalize(suggestion.value).split(" ")
+            for start in range(len(words)):
+                entries.append((" ".join(words[start:]), rank))
+        entries.sort()
+
+        self.keys = [key for key, _ in entries]
+        self.ranks = [rank for _, rank in entries]
+
+        # Short prefixes match large ranges, so their answers are precomputed
+        short: Dict[str, set] = {}
+        for key, rank in entries:
+            for length in range(1, min(len(key), SHORT_PREFIX_LENGTH) + 1):
+                short.setdefault(key[:length], set()).add(rank)
+        self.short = {
+            prefix: heapq.nsmallest(MAX_SUGGESTIONS, ranks)
+            for prefix, ranks in short.items()
+        }
+
+    def search(self, prefix: str, limit: int) -> List[SuggestionDTO]:
+        """A method finding the most popular suggestions starting with prefix
+
+        Args:
+            prefix (str): The normalized prefix
+            limit (int): The maximal number of suggestions
+
+        Returns:
+            List[SuggestionDTO]: The suggestions, most popular first
+        """
+
+        return [self.suggestions[rank] for rank in self.search_ranks(prefix, limit)]
+
+    def search_ranks(self, prefix: str, limit: int) -> List[int]:
+        """A method finding ranks of the most popular suggestions starting with prefix
+
+        Args:
+            prefix (str): The normalized prefix
+            limit (int): The maximal number of suggestions
+
+        Returns:
+            List[int]: The ranks, smallest first
+        """
+
+        if len(prefix) <= SHORT_PREFIX_LENGTH:
+            return self.short.get(prefix, [])[:limit]
+
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\uffff", lo=start)
+        return heapq.nsmallest(limit, set(self.ranks[start:end]))
+
+
+class PrefixIndex:
+    """An immutable prefix index over the catalog terms of every kind"""
+
+    def __init__(self, indexes: Dict[AutocompleteKind, _KindIndex]) -> None:
+        """The initializer of the prefix index.
+
+        Args:
+            indexes (Dict[AutocompleteKind, _KindIndex]): The index of every kind
+        """
+
+        self._indexes = indexes
+
+    @classmethod
+    def build(cls, suggestions: Iterable[SuggestionDTO]) -> "PrefixIndex":
+        """A method building the index
+
+        Args:
+            suggestions (Iterable[SuggestionDTO]): The catalog terms with their popularity
+
+        Returns:
+            PrefixIndex: The index
+        """
+
+        by_kind: Dict[AutocompleteKind, List[SuggestionDTO]] = {kind: [] for kind in AutocompleteKind}
+        for suggestion in suggestions:
+            by_kind[suggestion.kind].append(suggestion)
+
+        return cls({
+            kind: _KindIndex(sorted(terms, key=lambda term: (-term.popularity, term.value)))
+            for kind, terms in by_kind.items()
+        })
+
+    @classmethod
+    def empty(cls) -> "PrefixIndex":
+        """A method creating an index without any terms
+
+        Returns:
+            PrefixIndex: The empty index
+        """
+
+        return cls.build([])
+
+    def search(self, prefix: str, kind: Optional[AutocompleteKind], limit: int) -> List[SuggestionDTO]:
+        """A method finding the most popular terms starting with prefix
+
+        Popularity of different kinds is not comparable (views of comics,
+        numbers of comics with a genre), so terms of all kinds are merged by
+        their rank within the kind relative to its size; the top terms of
+        every kind come before the less popular ones of any kind.
+
+        Args:
+            prefix (str): The typed prefix
+            kind (Optional[AutocompleteKind]): The kind of terms, all if not given
+            limit (int): The maximal number of suggestions
+
+        Returns:
+            List[SuggestionDTO]: The suggestions, most popular first
+        """
+
+        normalized = normalize(prefix)
+        if not normalized:
+            return []
+
+        limit = min(limit, MAX_SUGGESTIONS)
+        if kind is not None:
+            return self._indexes[kind].search(normalized, limit)
+
+        matches = heapq.nsmallest(
+            limit,
+            (
+                (rank / len(index.suggestions), position, rank)
+                for position, index in enumerate(self._indexes.values())
+                for rank in index.search_ranks(normalized, limit)
+            ),
+        )
+        indexes = list(self._indexes.values())
+
+        return [indexes[position].suggestions[rank] for _, position, rank in matches]
+
+
+class StaleMarker:
+    """A flag raised by writers of the catalog and consumed by the index owner"""
+
+    def __init__(self) -> None:
+        """The initializer of the stale marker."""
+
+        self._stale = False
+
+    def mark(self) -> None:
+        """A method flagging the index as outdated"""
+
+        self._stale = True
+
+    def consume(self) -> bool:
+        """A method reading and clearing the flag
+
+        Returns:
+            bool: Whether the index was flagged since the last call
+        """
+
+        stale, self._stale = self._stale, False
+        return stale
+
+
+autocomplete_stale = StaleMarker()
@@ -0,0 +1,330 @@
+"""A module containing SQL statement instrumentation"""
+
+import logging
+import re
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Set, Union
+
+import databases
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.dml import UpdateBase
+
+from wirtualnykomiksapi.config import config
+
+logger = logging.getLogger(__name__)
+
+HISTOGRAM_BOUNDS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+MAX_FINGERPRINTS = 1000
+
+_WHITESPACE = re.compile(r"\s+")
+
+request_queries: ContextVar[Optional[Counter]] = ContextVar("request_queries", default=None)
+# Set by the replica routing middleware for write requests: the tables the
+# INSERT, UPDATE and DELETE statements of the request were run on
+request_written_tables: ContextVar[Optional[Set[str]]] = ContextVar("request_written_tables", default=None)
+
+
+class QueryHistogram:
+    """A latency histogram of a single statement fingerprint"""
+
+    def __init__(self) -> None:
+        """The initializer of the query histogram."""
+
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """A method recording a single execution
+
+        Args:
+            duration_ms (float): The execution time in milliseconds
+        """
+
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+class QueryRecorder:
+    """A collector of timings of all statements sent through the database.
+
+    Statements are grouped by fingerprint: the SQL text without bound
+    values. The text is compiled once per SQLAlchemy cache key, so
+    fingerprinting a repeated query costs a dictionary lookup.
+    """
+
+    def __init__(self, slow_query_ms: float) -> None:
+        """The initializer of the query recorder.
+
+        Args:
+            slow_query_ms (float): The duration above which statements are logged
+        """
+
+        self.slow_query_ms = slow_query_ms
+        self._fingerprints: Dict[Any, str] = {}
+        self._histograms: Dict[str, QueryHistogram] = {}
+        self._collectors: List[Counter] = []
+
+    def fingerprint(self, query: Union[ClauseElement, str]) -> str:
+        """A method getting the fingerprint of a statement
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+
+        Returns:
+            str: The SQL text with collapsed whitespace
+        """
+
+        if isinstance(query, str):
+            return _WHITESPACE.sub(" ", query).strip()
+
+        cache_key = query._generate_cache_key()  # pylint: disable=protected-access
+        if cache_key is None:
+            return _WHITESPACE.sub(" ", str(query)).strip()
+
+        fingerprint = self._fingerprints.get(cache_key.key)
+        if fingerprint is None:
+            fingerprint = _WHITESPACE.sub(" ", str(query)).strip()
+            if len(self._fingerprints) < MAX_FINGERPRINTS:
+                self._fingerprints[cache_key.key] = fingerprint
+
+        return fingerprint
+
+    def record(self, query: Union[ClauseElement, str], duration: float) -> None:
+        """A method recording an executed statement
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+            duration (float): The execution time in seconds
+        """
+
+        if isinstance(query, UpdateBase) and (tables := request_written_tables.get()) is not None:
+            tables.add(query.table.name)
+
+        self.record_fingerprint(self.fingerprint(query), duration)
+
+    def record_fingerprint(self, fingerprint: str, duration: float) -> None:
+        """A method recording an executed statement of known fingerprint
+
+        Args:
+            fingerprint (str): The statement fingerprint
+            duration (float): The execution time in seconds
+        """
+
+        duration_ms = duration * 1000
+
+        histogram = self._histograms.get(fingerprint)
+        if histogram is None:
+            if len(self._histograms) >= MAX_FINGERPRINTS:
+                fingerprint = "<other>"
+            histogram = self._histograms.setdefault(fingerprint, QueryHistogram())
+        histogram.add(duration_ms)
+
+        if duration_ms >= self.slow_query_ms:
+            logger.warning("Slow query (%.1f ms): %s", duration_ms, fingerprint)
+
+        if (queries := request_queries.get()) is not None:
+            queries[fingerprint] += 1
+
+        for collector in self._collectors:
+            collector[fingerprint] += 1
+
+    def metrics(self) -> List[dict]:
+        """A method returning the histograms, slowest in total first
+
+        Returns:
+            List[dict]: The statement fingerprints with their latency statistics
+        """
+
+        return [
+            {
+                "fingerprint": fingerprint,
+                "count": histogram.count,
+                "total_ms": histogram.total_ms,
+                "mean_ms": histogram.total_ms / histogram.count,
+                "max_ms": histogram.max_ms,
+                "buckets": dict(zip(
+                    [f"le_{bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + ["inf"],
+                    histogram.buckets,
+                )),
+            }
+            for fingerprint, histogram in sorted(
+                self._histograms.items(),
+                key=lambda item: item[1].total_ms,
+                reverse=True,
+            )
+        ]
+
+    @contextmanager
+    def collect(self) -> Iterator[Counter]:
+        """A method counting statements executed within the block
+
+        Unlike the per-request counter, the collector sees statements from
+        every task and thread, e.g. those run by a test client.
+
+        Yields:
+            Counter: The number of executions per fingerprint
+        """
+
+        collector: Counter = Counter()
+        self._collectors.append(collector)
+        try:
+            yield collector
+        finally:
+            self._collectors.remove(collector)
+
+
+def check_request_queries(queries: Counter, path: str) -> None:
+    """Function logging requests which look like they issue N+1 queries.
+
+    Args:
+        queries (Counter): The number of executions per fingerprint
+        path (str): The request path
+    """
+
+    total = sum(queries.values())
+    if total > config.REQUEST_QUERY_LIMIT:
+        logger.warning("Request %s issued %d queries", path, total)
+
+    for fingerprint, count in queries.items():
+        if count > config.REQUEST_QUERY_REPEAT_LIMIT:
+            logger.warning(
+                "Request %s repeated a query %d times (possible N+1): %s",
+                path,
+                count,
+                fingerprint,
+            )
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Iterator[Counter]:
+    """Function asserting the number of statements executed within the block.
+
+    Intended for tests, e.g.::
+
+        with assert_query_budget(3, max_repeats=1):
+            client.get("/comic/all")
+
+    Args:
+        max_queries (int): The maximal number of statements
+        max_repeats (Optional[int]): The maximal number of executions of
+            a single fingerprint
+
+    Raises:
+        AssertionError: If the budget is exceeded
+
+    Yields:
+        Counter: The number of executions per fingerprint
+    """
+
+    with query_recorder.collect() as queries:
+        yield queries
+
+    total = sum(queries.values())
+    assert total <= max_queries, f"Expected at most {max_queries} queries, got {total}: {dict(queries)}"
+
+    if max_repeats is not None:
+        repeated = {fingerprint: count for fingerprint, count in queries.items() if count > max_repeats}
+        assert not repeated, f"Expected at most {max_repeats} executions per query, got {repeated}"
+
+
+class InstrumentedDatabase(databases.Database):
+    """A database reporting every executed statement to the query recorder"""
+
+    async def fetch_all(self, query: Union[ClauseElement, str], values: Optional[dict] = None) -> List[Any]:
+        """A method fetching all rows of a statement
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+            values (Optional[dict]): The bound values of a textual statement
+
+        Returns:
+            List[Any]: The rows
+        """
+
+        started_at = time.perf_counter()
+        try:
+            return await super().fetch_all(query, values)
+        finally:
+            query_recorder.record(query, time.perf_counter() - started_at)
+
+    async def fetch_one(self, query: Union[ClauseElement, str], values: Optional[dict] = None) -> Optional[Any]:
+        """A method fetching the first row of a statement
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+            values (Optional[dict]): The bound values of a textual statement
+
+        Returns:
+            Optional[Any]: The row
+        """
+
+        started_at = time.perf_counter()
+        try:
+            return await super().fetch_one(query, values)
+        finally:
+            query_recorder.record(query, time.perf_counter() - started_at)
+
+    async def fetch_val(
+        self,
+        query: Union[ClauseElement, str],
+        values: Optional[dict] = None,
+        column: Any = 0,
+    ) -> Any:
+        """A method fetching a single value of a statement
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+            values (Optional[dict]): The bound values of a textual statement
+            column (Any): The column of the first row to return
+
+        Returns:
+            Any: The value
+        """
+
+        started_at = time.perf_counter()
+        try:
+            return await super().fetch_val(query, values, column=column)
+        finally:
+            query_recorder.record(query, time.perf_counter() - started_at)
+
+    async def execute(self, query: Union[ClauseElement, str], values: Optional[dict] = None) -> Any:
+        """A method executing a statement
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+            values (Optional[dict]): The bound values of a textual statement
+
+        Returns:
+            Any: The last row id or the first returned value
+        """
+
+        started_at = time.perf_counter()
+        try:
+            return await super().execute(query, values)
+        finally:
+            query_recorder.record(query, time.perf_counter() - started_at)
+
+    async def execute_many(self, query: Union[ClauseElement, str], values: list) -> None:
+        """A method executing a statement for many sets of values
+
+        Args:
+            query (Union[ClauseElement, str]): The statement
+            values (list): The sets of bound values
+        """
+
+        started_at = time.perf_counter()
+        try:
+            await super().execute_many(query, values)
+        finally:
+            query_recorder.record(query, time.perf_counter() - started_at)
+
+
+query_recorder = QueryRecorder(slow_query_ms=config.SLOW_QUERY_MS)
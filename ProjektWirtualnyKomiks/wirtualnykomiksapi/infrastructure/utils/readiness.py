@@ -0,0 +1,38 @@
+"""A module containing the readiness state of the worker"""
+
+from typing import Callable, Dict
+
+
+class Readiness:
+    """A set of named checks deciding whether the worker may receive traffic.
+
+    Checks are registered by the parts of the app which need warming up
+    (caches, dictionaries); the worker is ready once all of them pass.
+    """
+
+    def __init__(self) -> None:
+        """The initializer of the readiness state."""
+
+        self._checks: Dict[str, Callable[[], bool]] = {}
+
+    def register(self, name: str, check: Callable[[], bool]) -> None:
+        """A method adding a readiness check
+
+        Args:
+            name (str): The name of the check reported by the probe
+            check (Callable[[], bool]): The function telling whether the check passes
+        """
+
+        self._checks[name] = check
+
+    def evaluate(self) -> Dict[str, bool]:
+        """A method running all readiness checks
+
+        Returns:
+            Dict[str, bool]: The result of every check by its name
+        """
+
+        return {name: check() for name, check in self._checks.items()}
+
+
+readiness = Readiness()
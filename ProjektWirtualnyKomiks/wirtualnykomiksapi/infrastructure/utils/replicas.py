@@ -0,0 +1,214 @@
+"""A module containing read-replica routing of database connections"""
+
+import asyncio
+import functools
+import logging
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+from databases import Database
+
+from wirtualnykomiksapi.infrastructure.utils.query_metrics import InstrumentedDatabase
+from wirtualnykomiksapi.infrastructure.utils.unit_of_work import (
+    UnitOfWorkConnection,
+    UnitOfWorkTransaction,
+    current_unit_of_work,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Set by the request middleware: the request is read-only and has not
+# written recently, so its reads may be served by a replica
+replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+# Set while a repository method marked with `replica_read` is running
+_replica_read: ContextVar[bool] = ContextVar("replica_read", default=False)
+
+
+def replica_read(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Function marking a repository method as safe to run on a replica.
+
+    Args:
+        method (Callable[..., Awaitable[T]]): The read-only repository method
+
+    Returns:
+        Callable[..., Awaitable[T]]: The marked method
+    """
+
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        token = _replica_read.set(True)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _replica_read.reset(token)
+
+    return wrapper
+
+
+def reads_from_replica() -> bool:
+    """Function checking whether the current statement may run on a replica.
+
+    Returns:
+        bool: Whether a `replica_read` method runs within a request allowing replica reads
+    """
+
+    return _replica_read.get() and replica_reads_allowed.get()
+
+
+class ReplicaSet:
+    """A round-robin selection of healthy read replicas.
+
+    Replicas are pinged periodically; one which fails a check is skipped
+    until it passes again. Without healthy replicas reads go to the primary.
+    """
+
+    def __init__(self, replicas: List[Database], check_timeout: float) -> None:
+        """The initializer of the replica set.
+
+        Args:
+            replicas (List[Database]): The replica databases
+            check_timeout (float): The number of seconds a health check may take
+        """
+
+        self.replicas = replicas
+        self.check_timeout = check_timeout
+        self.healthy = [False] * len(replicas)
+        self.reads = [0] * len(replicas)
+        self._turn = count()
+
+    async def connect(self) -> None:
+        """A method opening pools of the replicas and checking them"""
+
+        for replica in self.replicas:
+            try:
+                await replica.connect()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Could not connect to replica %s", replica.url.hostname)
+
+        await self.check_health()
+
+    async def disconnect(self) -> None:
+        """A method closing pools of the replicas"""
+
+        for replica in self.replicas:
+            await replica.disconnect()
+
+    async def check_health(self) -> None:
+        """A method pinging every replica"""
+
+        for index, replica in enumerate(self.replicas):
+            try:
+                if not replica.is_connected:
+                    await replica.connect()
+                await asyncio.wait_for(replica.fetch_val("SELECT 1"), self.check_timeout)
+                healthy = True
+            except Exception:  # pylint: disable=broad-except
+                healthy = False
+
+            if healthy != self.healthy[index]:
+                logger.warning(
+                    "Replica %s is %s",
+                    replica.url.hostname,
+                    "healthy" if healthy else "unhealthy",
+                )
+            self.healthy[index] = healthy
+
+    async def check_periodically(self, interval: float) -> None:
+        """A method checking health of the replicas in a loop
+
+        Args:
+            interval (float): The number of seconds between checks
+        """
+
+        while True:
+            await asyncio.sleep(interval)
+            await self.check_health()
+
+    def choose(self) -> Optional[Database]:
+        """A method picking the next healthy replica
+
+        Returns:
+            Optional[Database]: The replica, None if no replica is healthy
+        """
+
+        for _ in range(len(self.replicas)):
+            index = next(self._turn) % len(self.replicas)
+            if self.healthy[index]:
+                self.reads[index] += 1
+                return self.replicas[index]
+
+        return None
+
+    def metrics(self) -> List[dict]:
+        """A method returning the state of every replica
+
+        Returns:
+            List[dict]: The replica hosts, health and number of routed reads
+        """
+
+        return [
+            {"host": replica.url.hostname, "healthy": healthy, "reads": reads}
+            for replica, healthy, reads in zip(self.replicas, self.healthy, self.reads)
+        ]
+
+
+class RoutedDatabase(InstrumentedDatabase):
+    """A primary database handing reads out to replicas.
+
+    Connections for methods marked with `replica_read` come from a replica
+    when the current request allows it; everything else, including all
+    transactions, stays on the primary. Within a unit of work the first
+    primary connection of the request task begins its transaction.
+    """
+
+    def __init__(self, url: str, replicas: ReplicaSet, **options: Any) -> None:
+        """The initializer of the routed database.
+
+        Args:
+            url (str): The URL of the primary
+            replicas (ReplicaSet): The read replicas
+            **options (Any): The options of the primary pool
+        """
+
+        super().__init__(url, **options)
+        self.replicas = replicas
+
+    def connection(self) -> Any:
+        """A method getting the connection for the current statement
+
+        Returns:
+            Any: The connection of a replica or of the primary
+        """
+
+        if reads_from_replica():
+            if (replica := self.replicas.choose()) is not None:
+                return replica.connection()
+
+        unit_of_work = current_unit_of_work.get()
+        if (
+            unit_of_work is not None
+            and unit_of_work.database is self
+            and unit_of_work.owns_current_task()
+            and self._global_connection is None
+            and not self._connection
+        ):
+            self._connection = UnitOfWorkConnection(self, self._backend, unit_of_work)
+
+        return super().connection()
+
+    def transaction(self, *, force_rollback: bool = False, **kwargs: Any) -> Any:
+        """A method creating a transaction on the connection of the current task
+
+        Args:
+            force_rollback (bool, optional): Whether to roll the transaction
+                back on exit. Defaults to False.
+            **kwargs (Any): The options of the backend transaction
+
+        Returns:
+            Any: The transaction, nested in the unit of work if there is one
+        """
+
+        return UnitOfWorkTransaction(self.connection, force_rollback=force_rollback, **kwargs)
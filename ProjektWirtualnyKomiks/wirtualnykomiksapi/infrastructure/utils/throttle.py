@@ -0,0 +1,105 @@
+"""A module containing in-memory request throttling helpers"""
+
+import time
+from collections import OrderedDict
+from typing import List, Tuple
+
+from wirtualnykomiksapi.config import config
+
+
+class TokenBucketLimiter:
+    """A bounded collection of token buckets keyed by an arbitrary string.
+
+    A bucket which has been idle long enough to refill completely carries no
+    state, so it is dropped; the least recently used buckets are evicted when
+    the number of keys exceeds `max_keys`.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, max_keys: int) -> None:
+        """The initializer of the token bucket limiter.
+
+        Args:
+            capacity (float): The maximal burst of requests per key
+            refill_per_second (float): The number of tokens regained per second
+            max_keys (int): The maximal number of tracked keys
+        """
+
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+        self.idle_ttl = capacity / refill_per_second
+        self._buckets: OrderedDict[str, List[float]] = OrderedDict()
+
+        self.allowed = 0
+        self.rejected = 0
+
+    def acquire(self, key: str) -> Tuple[bool, float]:
+        """A method taking one token from the bucket of given key
+
+        Args:
+            key (str): The throttled key
+
+        Returns:
+            Tuple[bool, float]: Whether the request is allowed and the number
+                of seconds after which the next token becomes available
+        """
+
+        now = time.monotonic()
+        self._expire(now)
+
+        tokens, updated_at = self._buckets.pop(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+            self.allowed += 1
+        else:
+            self.rejected += 1
+
+        self._buckets[key] = [tokens, now]
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        retry_after = 0.0 if tokens >= 1 else (1 - tokens) / self.refill_per_second
+        return allowed, retry_after
+
+    def metrics(self) -> dict:
+        """A method returning the limiter metrics
+
+        Returns:
+            dict: The number of tracked keys and throttling decisions
+        """
+
+        return {
+            "keys": len(self._buckets),
+            "max_keys": self.max_keys,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+        }
+
+    def _expire(self, now: float) -> None:
+        """A private method dropping buckets which have refilled completely
+
+        Args:
+            now (float): The current monotonic time
+        """
+
+        while self._buckets:
+            key, (_, updated_at) = next(iter(self._buckets.items()))
+            if now - updated_at < self.idle_ttl:
+                return
+            del self._buckets[key]
+
+
+login_ip_limiter = TokenBucketLimiter(
+    capacity=config.LOGIN_IP_BURST,
+    refill_per_second=config.LOGIN_IP_PER_MINUTE / 60,
+    max_keys=config.LOGIN_THROTTLE_MAX_KEYS,
+)
+
+login_email_limiter = TokenBucketLimiter(
+    capacity=config.LOGIN_EMAIL_BURST,
+    refill_per_second=config.LOGIN_EMAIL_PER_MINUTE / 60,
+    max_keys=config.LOGIN_THROTTLE_MAX_KEYS,
+)
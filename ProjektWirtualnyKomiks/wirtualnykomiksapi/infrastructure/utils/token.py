@@ -1,11 +1,19 @@
 """A module containing helper functions for token generation"""
 
+import hashlib
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from jose import jwt
+from typing import Optional, Tuple
+
+from jose import jwt, JWTError
 from pydantic import UUID4
 
+from wirtualnykomiksapi.config import config
 from wirtualnykomiksapi.infrastructure.utils.consts import (
     EXPIRATION_MINUTES,
+    REFRESH_EXPIRATION_DAYS,
     ALGORITHM,
     SECRET_KEY,
 )
@@ -25,3 +33,139 @@ def generate_user_token(user_uuid: UUID4) -> dict:
     encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
 
     return {"user_token": encoded_jwt, "expires": expire}
+
+
+def generate_refresh_token() -> dict:
+    """A function returning new opaque refresh token
+
+    Returns:
+        dict: The raw token, its digest and expiration date
+    """
+    refresh_token = secrets.token_urlsafe(32)
+    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_EXPIRATION_DAYS)
+
+    return {
+        "refresh_token": refresh_token,
+        "token_hash": hash_refresh_token(refresh_token),
+        "refresh_expires": expire,
+    }
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """A function hashing the refresh token for storage and lookup
+
+    The token carries 256 bits of randomness, so a fast digest is enough
+    and no salted password hash is needed.
+
+    Args:
+        refresh_token (str): The raw refresh token
+
+    Returns:
+        str: The hex SHA-256 digest of the token
+    """
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+class VerifiedTokenCache:
+    """A bounded LRU cache of already verified tokens.
+
+    Entries are keyed by the SHA-256 digest of the token, so raw tokens are
+    never kept in memory, and are dropped once the token's `exp` has passed.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """The initializer of the verified token cache.
+
+        Args:
+            max_size (int): The maximal number of cached tokens
+        """
+
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, Tuple[str, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, digest: bytes) -> Optional[str]:
+        """A method getting the user id of a cached, unexpired token
+
+        Args:
+            digest (bytes): The digest of the token
+
+        Returns:
+            Optional[str]: The user id if the token is cached
+        """
+
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        subject, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[digest]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return subject
+
+    def put(self, digest: bytes, subject: str, expires_at: float) -> None:
+        """A method storing verified token
+
+        Args:
+            digest (bytes): The digest of the token
+            subject (str): The user id stored in the token
+            expires_at (float): The token expiration as UNIX timestamp
+        """
+
+        self._entries[digest] = (subject, expires_at)
+        self._entries.move_to_end(digest)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def metrics(self) -> dict:
+        """A method returning the cache metrics
+
+        Returns:
+            dict: The cache size and hit statistics
+        """
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = VerifiedTokenCache(max_size=config.TOKEN_CACHE_SIZE)
+
+
+def decode_user_token(token: str) -> Optional[str]:
+    """A function verifying JWT token and returning its subject
+
+    Args:
+        token (str): The encoded JWT token
+
+    Returns:
+        Optional[str]: The user id if the token is valid
+    """
+    digest = hashlib.sha256(token.encode()).digest()
+
+    if subject := token_cache.get(digest):
+        return subject
+
+    try:
+        token_payload = jwt.decode(token, key=SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+    subject = token_payload.get("sub")
+    expires_at = token_payload.get("exp")
+
+    if subject and expires_at:
+        token_cache.put(digest, subject, float(expires_at))
+
+    return subject
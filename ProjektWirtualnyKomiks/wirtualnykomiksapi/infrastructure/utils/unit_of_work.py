@@ -0,0 +1,122 @@
+"""A module containing the request transaction begun on its first statement"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from databases import Database
+from databases.core import Connection, Transaction
+
+
+class UnitOfWork:
+    """The transaction of a single write request, begun lazily.
+
+    Nothing is acquired from the pool until the request runs its first
+    statement on the primary, so requests rejected before touching the
+    database (validation, authentication, login throttling) neither hold
+    a connection nor send BEGIN and ROLLBACK.
+    """
+
+    def __init__(self, database: Database) -> None:
+        """The initializer of the unit of work.
+
+        Args:
+            database (Database): The database to open the transaction on
+        """
+
+        self.database = database
+        self.transaction: Optional[Transaction] = None
+        self._task = asyncio.current_task()
+        self._beginning = False
+
+    def owns_current_task(self) -> bool:
+        """A method checking whether statements of the current task belong to the unit
+
+        Tasks spawned by the request keep running on their own connections,
+        as the transaction is bound to the connection of the request task.
+
+        Returns:
+            bool: Whether the current task is the request task
+        """
+
+        return asyncio.current_task() is self._task
+
+    async def begin(self) -> None:
+        """A method beginning the transaction unless it has been begun"""
+
+        if self.transaction is None and not self._beginning:
+            self._beginning = True
+            try:
+                self.transaction = await self.database.transaction().start()
+            finally:
+                self._beginning = False
+
+    async def commit(self) -> None:
+        """A method committing the transaction if it has been begun"""
+
+        if self.transaction is not None:
+            await self.transaction.commit()
+
+    async def rollback(self) -> None:
+        """A method rolling the transaction back if it has been begun"""
+
+        if self.transaction is not None:
+            await self.transaction.rollback()
+
+
+# Set by the unit of work middleware for the duration of a write request
+current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("current_unit_of_work", default=None)
+
+
+class UnitOfWorkConnection(Connection):
+    """A connection of the request task beginning its unit of work when first used"""
+
+    def __init__(self, database: Database, backend: Any, unit_of_work: UnitOfWork) -> None:
+        """The initializer of the unit of work connection.
+
+        Args:
+            database (Database): The database of the connection
+            backend (Any): The backend of the database
+            unit_of_work (UnitOfWork): The unit of work of the request
+        """
+
+        super().__init__(database, backend)
+        self.unit_of_work = unit_of_work
+
+    async def __aenter__(self) -> "Connection":
+        """A method acquiring the connection and beginning the unit of work
+
+        Returns:
+            Connection: The connection
+        """
+
+        await super().__aenter__()
+        try:
+            await self.unit_of_work.begin()
+        except BaseException:
+            await super().__aexit__()
+            raise
+
+        return self
+
+
+class UnitOfWorkTransaction(Transaction):
+    """A transaction nested in the unit of work of its connection.
+
+    `Transaction.start` enters the connection while holding its transaction
+    lock, where the unit could not begin its own transaction, so the unit
+    is begun first and this transaction becomes a savepoint in it.
+    """
+
+    async def start(self) -> "Transaction":
+        """A method beginning the unit of work and then the transaction
+
+        Returns:
+            Transaction: The transaction
+        """
+
+        connection = self._connection
+        if isinstance(connection, UnitOfWorkConnection):
+            await connection.unit_of_work.begin()
+
+        return await super().start()
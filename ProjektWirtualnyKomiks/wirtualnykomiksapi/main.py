@@ -1,18 +1,38 @@
 """Main module of the app"""
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
 
+from wirtualnykomiksapi.api.middleware import (
+    CompressionMiddleware,
+    ContentNegotiationMiddleware,
+    DrainingMiddleware,
+    QueryCountMiddleware,
+    ReplicaRoutingMiddleware,
+    UnitOfWorkMiddleware,
+)
 from wirtualnykomiksapi.api.routers.comic import router as comic_router
 from wirtualnykomiksapi.api.routers.review import router as review_router
 from wirtualnykomiksapi.api.routers.genre import router as genre_router
 from wirtualnykomiksapi.api.routers.tag import router as tag_router
 from wirtualnykomiksapi.api.routers.user_comic_list import router as user_comic_list_router
 from wirtualnykomiksapi.api.routers.user import router as user_router
+from wirtualnykomiksapi.api.routers.stats import precompress_stats, router as stats_router
+from wirtualnykomiksapi.api.routers.internal import router as internal_router
+from wirtualnykomiksapi.api.routers.autocomplete import router as autocomplete_router
+from wirtualnykomiksapi.api.routers.health import router as health_router
+from wirtualnykomiksapi.config import config
 from wirtualnykomiksapi.container import Container
 from wirtualnykomiksapi.db import database, init_db
+from wirtualnykomiksapi.infrastructure.utils.dictionary import genre_dictionary, tag_dictionary
+from wirtualnykomiksapi.infrastructure.utils.lifecycle import cancel_task, shutdown_coordinator
+from wirtualnykomiksapi.infrastructure.utils.password import password_pool
+from wirtualnykomiksapi.infrastructure.utils.pg import asyncpg_pool
+from wirtualnykomiksapi.infrastructure.utils.pool import pool_monitor
+from wirtualnykomiksapi.infrastructure.utils.readiness import readiness
 
 container = Container()
 container.wire(modules=[
@@ -22,24 +42,80 @@ container.wire(modules=[
     "wirtualnykomiksapi.api.routers.tag",
     "wirtualnykomiksapi.api.routers.user",
     "wirtualnykomiksapi.api.routers.user_comic_list",
+    "wirtualnykomiksapi.api.routers.stats",
+    "wirtualnykomiksapi.api.routers.autocomplete",
 ])
 
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
+    # Registered before loading, so the probe reports them as pending until then
+    readiness.register("genre_dictionary", lambda: genre_dictionary.loaded)
+    readiness.register("tag_dictionary", lambda: tag_dictionary.loaded)
+
     await init_db()
     await database.connect()
+    pool_monitor.install(database)
+    await database.replicas.connect()
+    if config.DB_BACKEND == "asyncpg":
+        await asyncpg_pool.connect()
+    replica_monitor = asyncio.create_task(
+        database.replicas.check_periodically(config.DB_REPLICA_CHECK_SECONDS),
+    )
+
+    await container.genre_service().load_dictionary()
+    await container.tag_service().load_dictionary()
+
+    stats_service = container.stats_service()
+    stats_service.add_refresh_listener(lambda: precompress_stats(stats_service))
+    # Renames and deletions made by other workers are picked up on every refresh
+    stats_service.add_refresh_listener(container.genre_service().load_dictionary)
+    stats_service.add_refresh_listener(container.tag_service().load_dictionary)
+    await stats_service.refresh()
+    stats_refresher = asyncio.create_task(
+        stats_service.refresh_periodically(config.STATS_REFRESH_SECONDS),
+    )
+    autocomplete_service = container.autocomplete_service()
+    await autocomplete_service.refresh()
+
+    # Hooks run in this order once in-flight requests are drained,
+    # the connection pools are closed last
+    shutdown_coordinator.register("stats_refresher", lambda: cancel_task(stats_refresher))
+    shutdown_coordinator.register("replica_monitor", lambda: cancel_task(replica_monitor))
+    shutdown_coordinator.register("autocomplete_refresh", autocomplete_service.close)
+    shutdown_coordinator.register("password_pool", lambda: asyncio.to_thread(password_pool.shutdown))
+    shutdown_coordinator.register("replica_pools", database.replicas.disconnect)
+    shutdown_coordinator.register("asyncpg_pool", asyncpg_pool.disconnect)
+    shutdown_coordinator.register("database_pool", database.disconnect)
+    readiness.register("accepting_requests", lambda: not shutdown_coordinator.stopping)
+    shutdown_coordinator.install_signal_handler()
+
     yield
-    await database.disconnect()
+
+    await shutdown_coordinator.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(ContentNegotiationMiddleware)
+app.add_middleware(UnitOfWorkMiddleware, database=database)
+app.add_middleware(ReplicaRoutingMiddleware, window=config.READ_YOUR_WRITES_SECONDS)
+app.add_middleware(QueryCountMiddleware)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MIN_SIZE,
+    thread_size=config.COMPRESSION_THREAD_SIZE,
+)
+app.add_middleware(DrainingMiddleware, coordinator=shutdown_coordinator)
 app.include_router(comic_router, prefix="/comic")
 app.include_router(review_router, prefix="/review")
 app.include_router(genre_router, prefix="/genre")
 app.include_router(tag_router, prefix="/tag")
 app.include_router(user_router, prefix="")
 app.include_router(user_comic_list_router, prefix="/user_comic_list")
+app.include_router(stats_router, prefix="/stats")
+app.include_router(internal_router, prefix="/internal")
+app.include_router(autocomplete_router, prefix="/autocomplete")
+app.include_router(health_router, prefix="")
 
 
 @app.exception_handler(HTTPException)
@@ -0,0 +1,31 @@
+"""A command rebuilding status counters of users comic lists
+
+Usage: python -m wirtualnykomiksapi.rebuild_counters [USER_ID]
+"""
+
+import asyncio
+import sys
+from typing import Optional
+
+from wirtualnykomiksapi.container import Container
+from wirtualnykomiksapi.db import database
+
+
+async def rebuild_counters(user_id: Optional[str] = None) -> None:
+    """Function recomputing the counters from the list entries.
+
+    Args:
+        user_id (Optional[str], optional): The user whose counters are
+            rebuilt. Defaults to all users.
+    """
+    repository = Container().user_comic_list_repository()
+
+    await database.connect()
+    try:
+        await repository.rebuild_counters(user_id)
+    finally:
+        await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_counters(sys.argv[1] if len(sys.argv) > 1 else None))
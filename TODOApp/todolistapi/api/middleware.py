@@ -0,0 +1,37 @@
+from databases import Database
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class UnitOfWorkMiddleware:
+    def __init__(self, app: ASGIApp, database: Database) -> None:
+        self.app = app
+        self.database = database
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in READ_ONLY_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async with self.database.connection():
+            transaction = await self.database.transaction().start()
+            finished = False
+
+            async def send_after_commit(message: Message) -> None:
+                nonlocal finished
+
+                if message["type"] == "http.response.start" and not finished:
+                    finished = True
+                    if message["status"] < 400:
+                        await transaction.commit()
+                    else:
+                        await transaction.rollback()
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_after_commit)
+            finally:
+                if not finished:
+                    await transaction.rollback()
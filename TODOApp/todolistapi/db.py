@@ -34,7 +34,6 @@ engine = create_async_engine(
 
 database = databases.Database(
     db_uri,
-    force_rollback=True,
 )
 
 async def init_db(retries: int = 5, delay: int = 5) -> None:
@@ -4,6 +4,7 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
 
+from todolistapi.api.middleware import UnitOfWorkMiddleware
 from todolistapi.api.routers.task import router as task_router
 from todolistapi.container import Container
 from todolistapi.db import database, init_db
@@ -21,6 +22,7 @@ async def lifespan(_: FastAPI) -> AsyncGenerator:
     await database.disconnect()
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(UnitOfWorkMiddleware, database=database)
 app.include_router(task_router, prefix="/task")
 
 @app.exception_handler(HTTPException)